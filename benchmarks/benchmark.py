@@ -0,0 +1,246 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import resource
+import statistics
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Adiciona o diretório raiz do projeto ao sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import InstanceLoader, LazyCities
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASETS_DIR = os.path.join(BASE_DIR, 'datasets')
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+DEFAULT_BASELINE = os.path.join(BASE_DIR, 'benchmarks', 'baseline.json')
+
+# Optimal tour lengths with unrounded distances (eil51, berlin52) and the best
+# known tour for logistica_brasil. Synthetic instances use the
+# Beardwood-Halton-Hammersley estimate 0.7124 * sqrt(n * area) instead.
+KNOWN_OPTIMA = {
+    'eil51': 428.87,
+    'berlin52': 7544.37,
+    'logistica_brasil': 6682.4,
+}
+
+SYNTHETIC_SIZES = {'synthetic_1k': 1000, 'synthetic_5k': 5000, 'synthetic_10k': 10000}
+SYNTHETIC_SIDE = 1000.0
+
+# Solver variants: GeneticAlgorithm keyword arguments
+VARIANTS = {
+    'baseline': {},
+    'seeded': {'seeding_ratio': 0.1},
+    'memetic': {'seeding_ratio': 0.1, 'local_search': '2opt', 'ls_rate': 0.02},
+    'swap': {'mutation': 'swap'},
+    'eax': {'crossover': 'eax'},
+    'erx': {'crossover': 'erx'},
+}
+
+DEFAULT_INSTANCES = ['eil51', 'berlin52', 'logistica_brasil']
+
+# Metrics compared against the baseline: (name, higher_is_better)
+COMPARED_METRICS = [
+    ('generations_per_sec', True),
+    ('evaluations_per_sec', True),
+    ('final_gap_pct', False),
+    ('peak_rss_mb', False),
+]
+
+
+def load_instance(name: str) -> DistanceMatrix:
+    """Loads a bundled dataset or generates a synthetic uniform instance (fixed seed)."""
+    if name in SYNTHETIC_SIZES:
+        n = SYNTHETIC_SIZES[name]
+        coords = np.random.default_rng(n).random((n, 2)) * SYNTHETIC_SIDE
+        cities = LazyCities(np.arange(1, n + 1).astype(str), coords)
+        # float32 keeps the full matrix of the largest instances in memory
+        return DistanceMatrix.from_cities(cities, dtype=np.float32, max_memory_mb=1024)
+    return InstanceLoader(os.path.join(DATASETS_DIR, f"{name}.csv")).load().distance_matrix()
+
+
+def reference_distance(name: str, n: int) -> float:
+    if name in KNOWN_OPTIMA:
+        return KNOWN_OPTIMA[name]
+    return 0.7124 * (n * SYNTHETIC_SIDE * SYNTHETIC_SIDE) ** 0.5
+
+
+def _single_run(variant: str, params: dict, instance: str, seed: int, generations: int,
+                pop_size: int, target_gap: float) -> dict:
+    """One (variant, instance, seed) run. Executed in its own process to isolate peak RSS."""
+    distance_matrix = load_instance(instance)
+    reference = reference_distance(instance, len(distance_matrix))
+    target = reference * (1 + target_gap / 100)
+
+    start = time.perf_counter()
+    reached = {}
+
+    def on_generation(generation: int, best: float):
+        if 'time' not in reached and best <= target:
+            reached['time'] = time.perf_counter() - start
+            reached['generation'] = generation
+
+    ga = GeneticAlgorithm(distance_matrix.cities, pop_size=pop_size, distance_matrix=distance_matrix,
+                          seed=seed, **params)
+    if ga.fitness.min() <= target:
+        on_generation(0, float(ga.fitness.min()))
+    evolve_start = time.perf_counter()
+    best_route, _ = ga.run(generations, progress=False, callback=on_generation)
+    end = time.perf_counter()
+
+    evolve_time = max(end - evolve_start, 1e-9)
+    return {
+        'variant': variant,
+        'instance': instance,
+        'seed': seed,
+        'n_cities': len(distance_matrix),
+        'generations': generations,
+        'wall_time_s': end - start,
+        'generations_per_sec': generations / evolve_time,
+        'evaluations': ga.evaluations,
+        'evaluations_per_sec': ga.evaluations / max(end - start, 1e-9),
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'final_distance': best_route.distance,
+        'reference_distance': reference,
+        'final_gap_pct': 100 * (best_route.distance - reference) / reference,
+        'target_gap_pct': target_gap,
+        'time_to_target_s': reached.get('time'),
+        'generations_to_target': reached.get('generation'),
+    }
+
+
+def summarize(runs: list) -> dict:
+    """Aggregates runs per (variant, instance): medians of the metrics, target hit rate."""
+    groups = {}
+    for run in runs:
+        groups.setdefault(f"{run['variant']}/{run['instance']}", []).append(run)
+
+    summary = {}
+    for key, group in groups.items():
+        times = [r['time_to_target_s'] for r in group if r['time_to_target_s'] is not None]
+        entry = {metric: statistics.median(r[metric] for r in group)
+                 for metric in ('wall_time_s', 'generations_per_sec', 'evaluations_per_sec',
+                                'peak_rss_mb', 'final_distance', 'final_gap_pct')}
+        entry['runs'] = len(group)
+        entry['target_hit_rate'] = len(times) / len(group)
+        entry['time_to_target_s'] = statistics.median(times) if times else None
+        summary[key] = entry
+    return summary
+
+
+def compare(summary: dict, baseline: dict, tolerance: float) -> bool:
+    """Prints a comparison table against the baseline. Returns False on regression."""
+    ok = True
+    header = f"{'variant/instance':<34}{'metric':<22}{'baseline':>12}{'current':>12}{'change':>10}  status"
+    print(header)
+    print("-" * len(header))
+    for key, entry in summary.items():
+        if key not in baseline:
+            print(f"{key:<34}{'(no baseline)':<22}")
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            old, new = baseline[key].get(metric), entry.get(metric)
+            if old is None or new is None:
+                continue
+            if metric == 'final_gap_pct':
+                # Gap is compared in absolute percentage points
+                change = new - old
+                regressed = change > tolerance * 100
+                change_text = f"{change:+.2f}pp"
+            else:
+                change = (new - old) / old if old else 0.0
+                regressed = (-change if higher_is_better else change) > tolerance
+                change_text = f"{100 * change:+.1f}%"
+            status = "REGRESSION" if regressed else "ok"
+            ok = ok and not regressed
+            print(f"{key:<34}{metric:<22}{old:>12.2f}{new:>12.2f}{change_text:>10}  {status}")
+    return ok
+
+
+def write_outputs(runs: list, summary: dict, output_dir: str, tag: str):
+    os.makedirs(output_dir, exist_ok=True)
+    json_path = os.path.join(output_dir, f"{tag}.json")
+    csv_path = os.path.join(output_dir, f"{tag}.csv")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': runs, 'summary': summary}, f, indent=2)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(runs[0].keys()))
+        writer.writeheader()
+        writer.writerows(runs)
+    return json_path, csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='evoTSP benchmark suite')
+    parser.add_argument('--instances', type=str, nargs='+', default=DEFAULT_INSTANCES,
+                        help=f"Instâncias: {', '.join(list(KNOWN_OPTIMA) + list(SYNTHETIC_SIZES))}")
+    parser.add_argument('--variants', type=str, nargs='+', default=['baseline'],
+                        help=f"Variantes do solver: {', '.join(VARIANTS)}")
+    parser.add_argument('--variants_file', type=str, default=None,
+                        help='JSON com variantes adicionais {nome: {parâmetros do GeneticAlgorithm}}')
+    parser.add_argument('--seeds', type=int, nargs='+', default=[1, 2, 3],
+                        help='Sementes (uma execução por semente)')
+    parser.add_argument('--generations', type=int, default=500, help='Gerações por execução')
+    parser.add_argument('--pop_size', type=int, default=200, help='Tamanho da população')
+    parser.add_argument('--target_gap', type=float, default=5.0,
+                        help='Alvo (%% acima do ótimo) para o tempo até o alvo')
+    parser.add_argument('--output_dir', type=str, default=RESULTS_DIR, help='Pasta de saída (JSON/CSV)')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Arquivo de baseline')
+    parser.add_argument('--save_baseline', action='store_true', help='Grava o resumo atual como baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Piora relativa tolerada antes de acusar regressão (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    variants = dict(VARIANTS)
+    if args.variants_file:
+        with open(args.variants_file, encoding='utf-8') as f:
+            variants.update(json.load(f))
+    unknown = [v for v in args.variants if v not in variants]
+    if unknown:
+        parser.error(f"Variantes desconhecidas: {', '.join(unknown)}")
+
+    # Each run in a fresh process (one task per child) so peak RSS is measured per run
+    runs = []
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn'), max_tasks_per_child=1)
+    with executor:
+        for variant in args.variants:
+            for instance in args.instances:
+                for seed in args.seeds:
+                    run = executor.submit(_single_run, variant, variants[variant], instance, seed,
+                                          args.generations, args.pop_size, args.target_gap).result()
+                    runs.append(run)
+                    ttt = f"{run['time_to_target_s']:.2f}s" if run['time_to_target_s'] is not None else "-"
+                    print(f"{variant:<10} {instance:<18} seed={seed:<4} {run['generations_per_sec']:8.1f} gen/s "
+                          f"gap={run['final_gap_pct']:6.2f}% ttt={ttt} rss={run['peak_rss_mb']:.0f}MB")
+
+    summary = summarize(runs)
+    tag = time.strftime('benchmark_%Y%m%d_%H%M%S')
+    json_path, csv_path = write_outputs(runs, summary, args.output_dir, tag)
+    print(f"\nResultados: {json_path}\n            {csv_path}\n")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Baseline gravado em: {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if not compare(summary, baseline, args.tolerance):
+            print("\n❌ Regressão de desempenho detectada.")
+            sys.exit(1)
+        print("\n✅ Sem regressões em relação ao baseline.")
+    else:
+        print(f"(Sem baseline em {args.baseline}; use --save_baseline para criar)")
+
+
+if __name__ == "__main__":
+    main()
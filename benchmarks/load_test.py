@@ -0,0 +1,160 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Adiciona o diretório raiz do projeto ao sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.service.client import SolverClient
+from src.service.daemon import DEFAULT_SOCKET
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+
+DEFAULT_DATASETS = ['eil51.csv', 'berlin52.csv', 'logistica_brasil.csv']
+
+# Latencies reported per request (seconds, measured by the client)
+LATENCY_METRICS = ('accepted_s', 'first_result_s', 'total_s')
+
+
+def spawn_daemon(socket_path: str, workers: int, timeout: float = 30.0) -> subprocess.Popen:
+    """Starts src/server.py in the background and waits until it answers a ping."""
+    process = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, 'src', 'server.py'),
+                                '--socket', socket_path, '--workers', str(workers)])
+    client = SolverClient(socket_path)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if client.request({'op': 'ping'})['event'] == 'pong':
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError(f"Daemon não respondeu em {timeout:.0f}s ({socket_path})")
+
+
+def one_request(client: SolverClient, dataset: str, time_limit: float, stop_after_first: bool) -> dict:
+    """
+    Runs one solve and times its events: acceptance, first (anytime) route and
+    completion. With stop_after_first the request is cancelled at the first route.
+    """
+    start = time.perf_counter()
+    record = {'dataset': dataset, 'status': 'ok', 'improvements': 0, 'cached': None,
+              'accepted_s': None, 'first_result_s': None, 'total_s': None, 'distance': None}
+    try:
+        for event in client.solve(dataset, time_limit=time_limit, routes=False):
+            now = time.perf_counter() - start
+            kind = event['event']
+            if kind == 'accepted':
+                record['accepted_s'] = now
+                record['cached'] = event['cached']
+            elif kind == 'improved':
+                record['improvements'] += 1
+                record['distance'] = event['distance']
+                if record['first_result_s'] is None:
+                    record['first_result_s'] = now
+                if stop_after_first:
+                    break
+            elif kind == 'done':
+                record['distance'] = event['distance']
+            else:
+                record['status'] = 'error'
+                record['error'] = event.get('error')
+    except OSError as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    record['total_s'] = time.perf_counter() - start
+    return record
+
+
+def summarize(records: list, elapsed: float) -> dict:
+    """p50/p90/p99/mean/max of every latency metric over the successful requests."""
+    ok = [r for r in records if r['status'] == 'ok']
+    summary = {
+        'requests': len(records),
+        'errors': len(records) - len(ok),
+        'elapsed_s': elapsed,
+        'throughput_rps': len(records) / elapsed if elapsed > 0 else 0.0,
+        'cache_hits': sum(1 for r in ok if r['cached']),
+    }
+    for metric in LATENCY_METRICS:
+        values = np.array([r[metric] for r in ok if r[metric] is not None], dtype=np.float64)
+        if len(values) == 0:
+            continue
+        summary[metric] = {
+            'p50': float(np.percentile(values, 50)),
+            'p90': float(np.percentile(values, 90)),
+            'p99': float(np.percentile(values, 99)),
+            'mean': float(values.mean()),
+            'max': float(values.max()),
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gerador de carga do solver residente (latência p50/p99)')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET, help='Socket Unix do daemon')
+    parser.add_argument('--spawn', action='store_true', help='Inicia o daemon (src/server.py) e o encerra no fim')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Workers do daemon iniciado com --spawn')
+    parser.add_argument('--datasets', type=str, nargs='+', default=DEFAULT_DATASETS,
+                        help='Datasets sorteados pelas requisições (nomes em datasets/ ou caminhos)')
+    parser.add_argument('--requests', type=int, default=100, help='Total de requisições')
+    parser.add_argument('--clients', type=int, default=4, help='Clientes simultâneos')
+    parser.add_argument('--time_limit', type=float, default=0.2, help='Tempo de cada requisição (s)')
+    parser.add_argument('--stop_after_first', action='store_true',
+                        help='Cancela cada requisição ao receber a primeira rota (uso interativo)')
+    parser.add_argument('--seed', type=int, default=0, help='Semente do sorteio dos datasets')
+    parser.add_argument('--output_dir', type=str, default=RESULTS_DIR, help='Pasta de saída (JSON)')
+    args = parser.parse_args()
+
+    daemon = spawn_daemon(args.socket, args.workers) if args.spawn else None
+    client = SolverClient(args.socket)
+    rng = np.random.default_rng(args.seed)
+    datasets = [args.datasets[i] for i in rng.integers(len(args.datasets), size=args.requests)]
+    records = []
+    lock = threading.Lock()
+
+    def worker(dataset: str):
+        record = one_request(client, dataset, args.time_limit, args.stop_after_first)
+        with lock:
+            records.append(record)
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            list(executor.map(worker, datasets))
+        elapsed = time.perf_counter() - start
+        server_stats = client.stats()
+    finally:
+        if daemon is not None:
+            daemon.terminate()
+            daemon.wait()
+
+    summary = summarize(records, elapsed)
+    summary['config'] = {key: value for key, value in vars(args).items() if key != 'output_dir'}
+    summary['server'] = server_stats
+
+    print(f"\n{summary['requests']} requisições ({args.clients} clientes, {args.time_limit}s cada) em "
+          f"{elapsed:.1f}s: {summary['throughput_rps']:.1f} req/s, {summary['errors']} erros, "
+          f"{summary['cache_hits']} acertos no cache")
+    print(f"{'métrica':<16}{'p50':>10}{'p90':>10}{'p99':>10}{'média':>10}{'máx':>10}")
+    for metric in LATENCY_METRICS:
+        if metric in summary:
+            s = summary[metric]
+            print(f"{metric:<16}" + "".join(f"{1000 * s[k]:>8.1f}ms" for k in ('p50', 'p90', 'p99', 'mean', 'max')))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = os.path.join(args.output_dir, time.strftime('load_%Y%m%d_%H%M%S.json'))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': records, 'summary': summary}, f, indent=2)
+    print(f"\nResultados: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional
+import numpy as np
+
+# Adiciona o diretório pai ao sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ga.genetic_algorithm import GeneticAlgorithm, DUPLICATE_POLICIES
+from src.ga.mutation import DELTA_MUTATIONS
+from src.ga.crossover import CROSSOVERS
+from src.ga.local_search import LOCAL_SEARCH_METHODS
+from src.ga.replacement import REPLACEMENT_STRATEGIES
+from src.ga.rng import spawn
+from src.output.sinks import RunResult, PlotSink
+from src.tsp.instance_loader import InstanceLoader
+
+INSTANCE_EXTENSIONS = ('.csv', '.tsp')
+# Quebras de pool (worker morto por OOM, segfault...) antes de a instância rodar sozinha
+MAX_POOL_CRASHES = 2
+
+
+def discover_instances(source: str) -> List[Dict[str, Any]]:
+    """
+    Lista as instâncias de um lote.
+    - Pasta: todos os arquivos .csv/.tsp (ordem alfabética).
+    - Manifesto: um caminho por linha (relativo ao manifesto), ou um objeto JSON por linha
+      {"path": ..., "generations": ..., "time_limit": ...} para sobrescrever parâmetros.
+    """
+    if os.path.isdir(source):
+        return [{'path': os.path.join(source, name)} for name in sorted(os.listdir(source))
+                if name.lower().endswith(INSTANCE_EXTENSIONS)]
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    jobs = []
+    with open(source, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            job = json.loads(line) if line.startswith('{') else {'path': line}
+            if not os.path.isabs(job['path']):
+                job['path'] = os.path.join(base_dir, job['path'])
+            jobs.append(job)
+    return jobs
+
+
+def _instance_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _error_record(path: str, error: str, elapsed: float) -> Dict[str, Any]:
+    return {'instance': _instance_name(path), 'path': path, 'status': 'error', 'error': error,
+            'elapsed_s': elapsed}
+
+
+def solve_instance(job: Dict[str, Any], ga_params: Dict[str, Any], generations: int,
+                   time_limit: Optional[float], seed: np.random.SeedSequence,
+                   plot_dir: Optional[str]) -> Dict[str, Any]:
+    """Resolve uma instância dentro de um processo do pool e devolve o registro de resultado."""
+    start = time.perf_counter()
+    path = job['path']
+    name = _instance_name(path)
+    try:
+        instance = InstanceLoader(path, verbose=False).load()
+        distance_matrix = instance.distance_matrix()
+        params = dict(ga_params, **job.get('params', {}))
+        ga = GeneticAlgorithm(instance.cities, distance_matrix=distance_matrix, seed=seed, **params)
+        initial = float(ga.fitness.min())
+        best_route, history = ga.run(job.get('generations', generations), progress=False,
+                                     time_limit=job.get('time_limit', time_limit))
+    except Exception as e:
+        return _error_record(path, str(e), time.perf_counter() - start)
+
+    if plot_dir:
+        # Já estamos num processo do pool: gráficos gerados aqui mesmo (matplotlib só é importado agora)
+        PlotSink(plot_dir, background=False).write(RunResult.from_route(name, path, best_route, history))
+
+    return {
+        'instance': name,
+        'path': path,
+        'status': 'ok',
+        'n_cities': len(distance_matrix),
+        'distance': best_route.distance,
+        'initial_distance': initial,
+        'improvement_pct': 100 * (initial - best_route.distance) / initial if initial else 0.0,
+        'generations': ga.generation,
+        'evaluations': ga.evaluations,
+        'cache_hit_rate': ga.fitness_cache.hit_rate if ga.fitness_cache is not None else None,
+        'unique_individuals': ga.unique_individuals,
+        'seed': seed.entropy,
+        'stream': seed.spawn_key[-1],
+        'elapsed_s': time.perf_counter() - start,
+        'route': [city.name for city in best_route.cities],
+    }
+
+
+def run_batch(jobs: List[Dict[str, Any]], ga_params: Dict[str, Any], generations: int,
+              time_limit: Optional[float] = None, workers: Optional[int] = None, seed: int = 0,
+              plot_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Distribui as instâncias num pool de processos (reaproveitado entre instâncias)
+    e devolve os resultados à medida que cada uma termina.
+    A instância i usa o i-ésimo fluxo de SeedSequence(seed).spawn: o resultado não
+    depende de qual processo a resolveu nem da ordem de término.
+
+    Se um worker morre (OOM, segfault), o pool inteiro quebra e as instâncias ainda
+    abertas são reenviadas a um pool novo; a que quebrar MAX_POOL_CRASHES pools roda
+    sozinha, e só se derrubar também esse processo vira um registro de erro.
+    """
+    seeds = spawn(seed, len(jobs))
+    crashes = [0] * len(jobs)
+    pending = list(range(len(jobs)))
+    while pending:
+        shared = [i for i in pending if crashes[i] < MAX_POOL_CRASHES]
+        rounds = ([(shared, workers)] if shared else []) + [([i], 1) for i in pending if i not in shared]
+        pending = []
+        for indices, max_workers in rounds:
+            start = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(solve_instance, jobs[i], ga_params, generations, time_limit,
+                                           seeds[i], plot_dir): i
+                           for i in indices}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        crashes[i] += 1
+                        if crashes[i] <= MAX_POOL_CRASHES:
+                            pending.append(i)
+                            continue
+                        result = _error_record(jobs[i]['path'], f"Processo do pool encerrado inesperadamente: {e}",
+                                               time.perf_counter() - start)
+                    yield result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='evoTSP - resolução em lote (JSON lines)')
+    parser.add_argument('source', type=str,
+                        help='Pasta com instâncias (.csv/.tsp) ou manifesto (um caminho ou objeto JSON por linha)')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Arquivo JSON-lines de saída (padrão: stdout)')
+    parser.add_argument('--workers', type=int, default=None, help='Processos no pool (padrão: nº de CPUs)')
+    parser.add_argument('--time_limit', type=float, default=None, help='Tempo máximo por instância (s)')
+    parser.add_argument('--generations', type=int, default=2000, help='Gerações máximas por instância')
+    parser.add_argument('--seed', type=int, default=0, help='Semente base (a instância i usa o i-ésimo fluxo derivado dela)')
+    parser.add_argument('--plot_dir', type=str, default=None, help='Gera o mapa de cada rota nesta pasta')
+    parser.add_argument('--pop_size', type=int, default=200, help='Tamanho da população')
+    parser.add_argument('--mutation_rate', type=float, default=0.01, help='Taxa de mutação')
+    parser.add_argument('--mutation', type=str, default='inversion', choices=list(DELTA_MUTATIONS),
+                        help='Operador de mutação')
+    parser.add_argument('--crossover', type=str, default='ox1', choices=list(CROSSOVERS),
+                        help='Operador de crossover')
+    parser.add_argument('--elite_size', type=int, default=1, help='Indivíduos preservados por geração')
+    parser.add_argument('--replacement', type=str, default='generational', choices=REPLACEMENT_STRATEGIES,
+                        help='Estratégia de sobrevivência')
+    parser.add_argument('--seeding_ratio', type=float, default=0.1,
+                        help='Fração da população inicial gerada por heurísticas')
+    parser.add_argument('--fitness_cache', type=int, default=0,
+                        help='Capacidade do cache de distâncias por hash canônico da rota (0 = desativado)')
+    parser.add_argument('--duplicates', type=str, default='allow', choices=DUPLICATE_POLICIES,
+                        help='Clones na população: manter, mutar (2-opt) ou substituir')
+    parser.add_argument('--local_search', type=str, default='none', choices=('none',) + LOCAL_SEARCH_METHODS,
+                        help='Busca local aplicada à elite e a uma fração dos filhos')
+    args = parser.parse_args()
+
+    jobs = discover_instances(args.source)
+    if not jobs:
+        print(f"❌ Nenhuma instância encontrada em: {args.source}", file=sys.stderr)
+        sys.exit(1)
+    if args.plot_dir:
+        os.makedirs(args.plot_dir, exist_ok=True)
+
+    ga_params = dict(
+        pop_size=args.pop_size,
+        mutation_rate=args.mutation_rate,
+        mutation=args.mutation,
+        crossover=args.crossover,
+        elite_size=args.elite_size,
+        replacement=args.replacement,
+        seeding_ratio=args.seeding_ratio,
+        fitness_cache=args.fitness_cache,
+        duplicates=args.duplicates,
+        local_search=None if args.local_search == 'none' else args.local_search,
+    )
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    solved = failed = 0
+    try:
+        for result in run_batch(jobs, ga_params, args.generations, args.time_limit,
+                                args.workers, args.seed, args.plot_dir):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            if result['status'] == 'ok':
+                solved += 1
+            else:
+                failed += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ {solved} instâncias resolvidas, {failed} com erro, em {elapsed:.1f}s "
+          f"({60 * solved / max(elapsed, 1e-9):.1f} instâncias/min)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,18 +8,88 @@ incluindo a classe principal de controle e os operadores genéticos
 (seleção, crossover e mutação).
 """
 
-from .genetic_algorithm import GeneticAlgorithm
-from .selection import tournament_selection, roulette_selection
-from .crossover import ordered_crossover, cycle_crossover
-from .mutation import swap_mutation, inversion_mutation
+from .genetic_algorithm import GeneticAlgorithm, DUPLICATE_POLICIES
+from .island_model import IslandModel
+from .decomposition import ClusterSolver, PARTITION_METHODS, partition_clusters, improve_path
+from .selection import tournament_selection, roulette_selection, batch_tournament_selection
+from .crossover import (ordered_crossover, cycle_crossover, ox1_child, cx_child,
+                        batch_ordered_crossover, batch_cycle_crossover, batch_pmx_crossover,
+                        erx_child, batch_erx_crossover, eax_child, batch_eax_crossover, CROSSOVERS)
+from .mutation import (swap_mutation, inversion_mutation, inversion_mutation_delta,
+                       swap_mutation_delta, neighbor_inversion_mutation_delta, neighbor_swap_mutation_delta,
+                       or_opt_mutation_delta, double_bridge_mutation_delta, DELTA_MUTATIONS, NEIGHBOR_MUTATIONS,
+                       MUTATION_DRAWS)
+from .evaluation import BatchEvaluator
+from .local_search import LocalSearch, nearest_neighbors, candidate_lists
+from .seeding import PopulationSeeder
+from .instrumentation import Observer, JsonlEventWriter, Instrumentation
+from .checkpoint import save_checkpoint, load_checkpoint, restore_checkpoint
+from .repair import cheapest_insertion
+from .termination import (Criterion, TimeLimit, MaxEvaluations, Stagnation, TargetDistance,
+                          DiversityCollapse, Termination)
+from .rng import RandomSource, make_rng, seed_sequence, spawn
+from .tour_hash import tour_hashes, update_hash, FitnessCache, CachedEvaluator
 
 # Define o que é exportado quando se faz "from src.ga import *"
 __all__ = [
     'GeneticAlgorithm',
+    'DUPLICATE_POLICIES',
+    'IslandModel',
+    'ClusterSolver',
+    'PARTITION_METHODS',
+    'partition_clusters',
+    'improve_path',
     'tournament_selection',
     'roulette_selection',
+    'batch_tournament_selection',
     'ordered_crossover',
     'cycle_crossover',
+    'ox1_child',
+    'cx_child',
+    'batch_ordered_crossover',
+    'batch_cycle_crossover',
+    'batch_pmx_crossover',
+    'erx_child',
+    'batch_erx_crossover',
+    'eax_child',
+    'batch_eax_crossover',
+    'CROSSOVERS',
     'swap_mutation',
-    'inversion_mutation'
+    'inversion_mutation',
+    'inversion_mutation_delta',
+    'swap_mutation_delta',
+    'neighbor_inversion_mutation_delta',
+    'neighbor_swap_mutation_delta',
+    'or_opt_mutation_delta',
+    'double_bridge_mutation_delta',
+    'DELTA_MUTATIONS',
+    'NEIGHBOR_MUTATIONS',
+    'MUTATION_DRAWS',
+    'BatchEvaluator',
+    'LocalSearch',
+    'nearest_neighbors',
+    'candidate_lists',
+    'PopulationSeeder',
+    'Observer',
+    'JsonlEventWriter',
+    'Instrumentation',
+    'save_checkpoint',
+    'load_checkpoint',
+    'restore_checkpoint',
+    'cheapest_insertion',
+    'Criterion',
+    'TimeLimit',
+    'MaxEvaluations',
+    'Stagnation',
+    'TargetDistance',
+    'DiversityCollapse',
+    'Termination',
+    'RandomSource',
+    'make_rng',
+    'seed_sequence',
+    'spawn',
+    'tour_hashes',
+    'update_hash',
+    'FitnessCache',
+    'CachedEvaluator'
 ]
\ No newline at end of file
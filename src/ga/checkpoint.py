@@ -0,0 +1,100 @@
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+from typing import Dict, Any
+
+from ..tsp.distance_matrix import DistanceMatrix
+
+# A checkpoint is a directory of .npy arrays (memory-mappable on load) plus a JSON state file
+POPULATION_FILE = 'population.npy'
+FITNESS_FILE = 'fitness.npy'
+HISTORY_FILE = 'history.npy'
+STATE_FILE = 'state.json'
+
+
+def instance_fingerprint(distance_matrix: DistanceMatrix) -> str:
+    """
+    Hash of the instance (coordinates and metric), so a checkpoint is never resumed
+    on another dataset. Explicit instances also hash the matrix itself: their
+    coordinates (MDS or DISPLAY_DATA) do not determine the distances.
+    """
+    digest = hashlib.sha1(np.ascontiguousarray(distance_matrix.coords).tobytes())
+    digest.update(b'geo' if distance_matrix.is_geo else b'euc')
+    digest.update(distance_matrix.metric.encode())
+    if distance_matrix.metric == 'explicit':
+        digest.update(np.ascontiguousarray(distance_matrix.matrix).tobytes())
+    return digest.hexdigest()
+
+
+def save_checkpoint(ga, path: str):
+    """
+    Writes the full GA state (population, distances, history, generation and
+    the state of its random generator) to the directory `path`. The new checkpoint is written next to
+    the old one and swapped in, so an interrupted save never corrupts it.
+    """
+    tmp_path = path + '.tmp'
+    old_path = path + '.old'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, POPULATION_FILE), ga.population)
+    np.save(os.path.join(tmp_path, FITNESS_FILE), ga.fitness)
+    np.save(os.path.join(tmp_path, HISTORY_FILE), np.asarray(ga.history, dtype=np.float64))
+
+    state = {
+        'generation': ga.generation,
+        'evaluations': ga.evaluations,
+        'restarts': ga.restarts,
+        'stats_history': ga.stats_history,
+        'timings': ga.timings,
+        'pop_size': ga.pop_size,
+        'n_cities': ga.n_cities,
+        'instance': instance_fingerprint(ga.distance_matrix),
+        # Bit generator state (plain dict of ints), so a resumed run continues the same stream
+        'rng': ga.rng.bit_generator.state,
+    }
+    with open(os.path.join(tmp_path, STATE_FILE), 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+
+    shutil.rmtree(old_path, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def load_checkpoint(path: str, mmap: bool = True) -> Dict[str, Any]:
+    """Reads a checkpoint directory. Arrays are memory-mapped (read-only) unless mmap=False."""
+    if not os.path.exists(os.path.join(path, STATE_FILE)):
+        raise FileNotFoundError(f"Checkpoint not found: {path}")
+    mode = 'r' if mmap else None
+    with open(os.path.join(path, STATE_FILE), encoding='utf-8') as f:
+        state = json.load(f)
+    state['population'] = np.load(os.path.join(path, POPULATION_FILE), mmap_mode=mode)
+    state['fitness'] = np.load(os.path.join(path, FITNESS_FILE), mmap_mode=mode)
+    state['history'] = np.load(os.path.join(path, HISTORY_FILE), mmap_mode=mode)
+    return state
+
+
+def restore_checkpoint(ga, checkpoint: Dict[str, Any]):
+    """Loads a checkpoint into a GeneticAlgorithm built for the same instance and population size."""
+    if checkpoint['instance'] != instance_fingerprint(ga.distance_matrix):
+        raise ValueError("Checkpoint belongs to a different instance")
+    if 'bit_generator' not in checkpoint.get('rng', {}):
+        # Resuming with a fresh stream would silently break reproducibility
+        raise ValueError("Checkpoint has no random generator state")
+    if checkpoint['population'].shape != ga.population.shape:
+        raise ValueError(f"Checkpoint population shape {checkpoint['population'].shape} "
+                         f"does not match {ga.population.shape}")
+
+    ga.population[:] = checkpoint['population']
+    ga.fitness[:] = checkpoint['fitness']
+    ga.history = [float(x) for x in checkpoint['history']]
+    ga.generation = checkpoint['generation']
+    ga.evaluations = checkpoint['evaluations']
+    ga.restarts = checkpoint.get('restarts', 0)
+    ga.stats_history = list(checkpoint.get('stats_history', []))
+    ga.timings.update(checkpoint['timings'])
+    ga.rng.bit_generator.state = checkpoint['rng']
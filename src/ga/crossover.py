@@ -1,14 +1,20 @@
-import random
-from typing import List, Any, Tuple
+import numpy as np
+from typing import List, Any, Tuple, Optional, Dict, Callable
 
-def ordered_crossover(parent1: List[Any], parent2: List[Any]) -> Tuple[List[Any], List[Any]]:
+from ..tsp.distance_matrix import DistanceMatrix
+from .local_search import candidate_lists
+from .rng import make_rng
+
+def ordered_crossover(parent1: List[Any], parent2: List[Any],
+                      rng: Optional[np.random.Generator] = None) -> Tuple[List[Any], List[Any]]:
     """
     Executes Ordered Crossover (OX1).
     Preserves a subsequence from one parent and relative order from the other.
+    Reference implementation (O(n²)); see ox1_child / batch_ordered_crossover.
     """
     size = len(parent1)
     # Select random cross section
-    start, end = sorted(random.sample(range(size), 2))
+    start, end = sorted(make_rng(rng).choice(size, size=2, replace=False).tolist())
 
     def _build_child(p_primary: List[Any], p_secondary: List[Any]) -> List[Any]:
         child = [None] * size
@@ -34,6 +40,7 @@ def cycle_crossover(parent1: List[Any], parent2: List[Any]) -> Tuple[List[Any],
     """
     Executes Cycle Crossover (CX).
     Preserves absolute positions of elements from parents.
+    Reference implementation (O(n²)); see cx_child / batch_cycle_crossover.
     """
     size = len(parent1)
 
@@ -57,4 +64,425 @@ def cycle_crossover(parent1: List[Any], parent2: List[Any]) -> Tuple[List[Any],
     child1 = _build_child(parent1, parent2)
     child2 = _build_child(parent2, parent1)
 
-    return child1, child2
\ No newline at end of file
+    return child1, child2
+
+# --- Linear-time kernels --------------------------------------------------
+# The list-based functions above are kept as reference implementations.
+# The kernels below operate on permutations of city indices (0..n-1), using a
+# boolean membership mask (OX1) or a position lookup table (CX), so each child
+# is built in O(n) instead of O(n²).
+
+def _random_cuts(n: int, size: int, rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Draws n pairs of distinct cut points, returned as sorted (starts, ends)."""
+    rng = make_rng(rng)
+    first = rng.integers(0, size, n)
+    second = (first + rng.integers(1, size, n)) % size
+    return np.minimum(first, second), np.maximum(first, second)
+
+def ox1_child(p_primary: np.ndarray, p_secondary: np.ndarray, start: int, end: int) -> np.ndarray:
+    """
+    Builds one OX1 child in O(n): keeps p_primary[start:end] and fills the
+    remaining slots, left to right, with p_secondary's genes in order.
+    """
+    size = len(p_primary)
+    segment = p_primary[start:end]
+    in_segment = np.zeros(size, dtype=bool)
+    in_segment[segment] = True
+
+    remaining = p_secondary[~in_segment[p_secondary]]
+    child = np.empty_like(p_primary)
+    child[:start] = remaining[:start]
+    child[start:end] = segment
+    child[end:] = remaining[start:]
+    return child
+
+def cx_child(p_primary: np.ndarray, p_secondary: np.ndarray) -> np.ndarray:
+    """
+    Builds one CX child in O(n): traces the first cycle through a position
+    lookup table instead of calling list.index on every step.
+    """
+    size = len(p_primary)
+    position = np.empty(size, dtype=np.intp)
+    position[p_primary] = np.arange(size)
+    position_of = position.tolist()
+    secondary = p_secondary.tolist()
+
+    in_cycle = np.zeros(size, dtype=bool)
+    idx = 0
+    while not in_cycle[idx]:
+        in_cycle[idx] = True
+        idx = position_of[secondary[idx]]
+
+    return np.where(in_cycle, p_primary, p_secondary)
+
+def _batch_ox1(primary: np.ndarray, secondary: np.ndarray,
+               starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    m, size = primary.shape
+    rows = np.arange(m)[:, None]
+    positions = np.arange(size)
+    # Slot mask (by position) and the same mask re-indexed by gene
+    in_segment = (positions >= starts[:, None]) & (positions < ends[:, None])
+    gene_in_segment = np.zeros((m, size), dtype=bool)
+    gene_in_segment[rows, primary] = in_segment
+
+    child = np.where(in_segment, primary, 0).astype(primary.dtype, copy=False)
+    # Row-major boolean indexing keeps each row's order and per-row counts match
+    child[~in_segment] = secondary[~gene_in_segment[rows, secondary]]
+    return child
+
+def _batch_cx(primary: np.ndarray, secondary: np.ndarray) -> np.ndarray:
+    m, size = primary.shape
+    rows = np.arange(m)
+    position = np.empty_like(primary)
+    position[rows[:, None], primary] = np.arange(size, dtype=primary.dtype)
+
+    in_cycle = np.zeros((m, size), dtype=bool)
+    idx = np.zeros(m, dtype=np.intp)
+    active = np.ones(m, dtype=bool)
+    # All cycles are traced in lockstep; finished rows drop out of the active set
+    while active.any():
+        r = rows[active]
+        current = idx[r]
+        in_cycle[r, current] = True
+        nxt = position[r, secondary[r, current]]
+        idx[r] = nxt
+        active[r] = ~in_cycle[r, nxt]
+
+    return np.where(in_cycle, primary, secondary)
+
+def batch_ordered_crossover(parents1: np.ndarray, parents2: np.ndarray,
+                            starts: Optional[np.ndarray] = None,
+                            ends: Optional[np.ndarray] = None,
+                            rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    OX1 over a whole mating pool: row i of parents1 is crossed with row i of parents2.
+    Cut points are drawn per pair (from rng) unless given explicitly.
+    """
+    if starts is None or ends is None:
+        starts, ends = _random_cuts(len(parents1), parents1.shape[1], rng)
+    children1 = _batch_ox1(parents1, parents2, starts, ends)
+    children2 = _batch_ox1(parents2, parents1, starts, ends)
+    return children1, children2
+
+def batch_cycle_crossover(parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CX over a whole mating pool: row i of parents1 is crossed with row i of parents2.
+    """
+    return _batch_cx(parents1, parents2), _batch_cx(parents2, parents1)
+
+# --- Partially mapped crossover (PMX) -------------------------------------
+
+def _batch_pmx(primary: np.ndarray, secondary: np.ndarray,
+               starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    m, size = primary.shape
+    rows = np.arange(m)[:, None]
+    positions = np.arange(size)
+    in_segment = (positions >= starts[:, None]) & (positions < ends[:, None])
+    position = np.empty_like(primary)
+    position[rows, primary] = positions.astype(primary.dtype)
+    gene_in_segment = np.zeros((m, size), dtype=bool)
+    gene_in_segment[rows, primary] = in_segment
+
+    child = np.where(in_segment, primary, secondary)
+    # Genes outside the segment that clash with it follow the segment mapping
+    # (gene -> secondary gene at its position in primary) until they leave it
+    r, c = np.nonzero(~in_segment & gene_in_segment[rows, child])
+    while len(r):
+        child[r, c] = secondary[r, position[r, child[r, c]]]
+        still = gene_in_segment[r, child[r, c]]
+        r, c = r[still], c[still]
+    return child
+
+def batch_pmx_crossover(parents1: np.ndarray, parents2: np.ndarray,
+                        starts: Optional[np.ndarray] = None,
+                        ends: Optional[np.ndarray] = None,
+                        rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Partially Mapped Crossover (PMX) over a whole mating pool. Each child keeps a
+    segment of one parent and the absolute positions of the other elsewhere;
+    conflicts are resolved through the segment mapping, all rows in lockstep.
+    """
+    if starts is None or ends is None:
+        starts, ends = _random_cuts(len(parents1), parents1.shape[1], rng)
+    return _batch_pmx(parents1, parents2, starts, ends), _batch_pmx(parents2, parents1, starts, ends)
+
+# --- Edge recombination (ERX) ---------------------------------------------
+
+def _adjacency(tour: List[int]) -> List[Tuple[int, int]]:
+    """(predecessor, successor) of every city of a tour."""
+    size = len(tour)
+    adjacency: List[Tuple[int, int]] = [(0, 0)] * size
+    for i, city in enumerate(tour):
+        adjacency[city] = (tour[i - 1], tour[(i + 1) % size])
+    return adjacency
+
+def erx_child(p_primary: np.ndarray, p_secondary: np.ndarray,
+              distance_matrix: Optional[DistanceMatrix] = None,
+              rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Builds one Edge Recombination (ERX) child in O(n) from the union of both
+    parents' adjacency arrays: from the current city, move to the neighbor
+    with the fewest remaining edges (ties broken by distance when a matrix is
+    given); at a dead end jump to a random unvisited city.
+    """
+    primary, secondary = p_primary.tolist(), p_secondary.tolist()
+    size = len(primary)
+    adj1, adj2 = _adjacency(primary), _adjacency(secondary)
+    edges = [list({*adj1[c], *adj2[c]}) for c in range(size)]
+
+    # Unvisited cities with O(1) removal (swap with the last one)
+    unvisited = list(range(size))
+    slot = list(range(size))
+    def visit(city: int):
+        i, last = slot[city], unvisited[-1]
+        unvisited[i], slot[last] = last, i
+        unvisited.pop()
+        for other in edges[city]:
+            edges[other].remove(city)
+
+    rows = distance_matrix.matrix if distance_matrix is not None and distance_matrix.is_full else None
+    draws = make_rng(rng).random(size).tolist()
+    current = primary[0]
+    child = [current]
+    visit(current)
+    while unvisited:
+        candidates = edges[current]
+        if len(candidates) > 1:
+            fewest = min(len(edges[c]) for c in candidates)
+            candidates = [c for c in candidates if len(edges[c]) == fewest]
+        if len(candidates) == 1:
+            current = candidates[0]
+        elif candidates:
+            if distance_matrix is not None:
+                row = rows[current] if rows is not None else distance_matrix.row(current)
+                current = min(candidates, key=row.__getitem__)
+            else:
+                current = candidates[int(draws[len(child)] * len(candidates))]
+        else:
+            current = unvisited[int(draws[len(child)] * len(unvisited))]
+        child.append(current)
+        visit(current)
+    return np.array(child, dtype=p_primary.dtype)
+
+def batch_erx_crossover(parents1: np.ndarray, parents2: np.ndarray,
+                        distance_matrix: Optional[DistanceMatrix] = None,
+                        rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """ERX over a whole mating pool (one child per parent order)."""
+    rng = make_rng(rng)
+    children1 = np.empty_like(parents1)
+    children2 = np.empty_like(parents2)
+    for i in range(len(parents1)):
+        children1[i] = erx_child(parents1[i], parents2[i], distance_matrix, rng)
+        children2[i] = erx_child(parents2[i], parents1[i], distance_matrix, rng)
+    return children1, children2
+
+# --- Edge assembly (EAX-style) --------------------------------------------
+
+# Size of the candidate lists used to merge EAX subtours
+EAX_NEIGHBORS = 10
+
+def _distances(distance_matrix: DistanceMatrix, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Element-wise d(u[i], v[i]) for index arrays of any shape."""
+    if distance_matrix.matrix is not None:
+        return distance_matrix.matrix[u, v].astype(np.float64, copy=False)
+    return np.array([distance_matrix.distance(a, b) for a, b in zip(np.ravel(u).tolist(), np.ravel(v).tolist())],
+                    dtype=np.float64).reshape(np.shape(u))
+
+def _tour_adjacency(tours: np.ndarray) -> np.ndarray:
+    """(predecessor, successor) of every city: (n, 2) for one tour, (m, n, 2) for a batch."""
+    tours = np.asarray(tours)
+    batch = tours.reshape(-1, tours.shape[-1])
+    rows = np.arange(len(batch))[:, None]
+    adjacency = np.empty(batch.shape + (2,), dtype=np.int64)
+    adjacency[rows, batch, 0] = np.concatenate((batch[:, -1:], batch[:, :-1]), axis=1)
+    adjacency[rows, batch, 1] = np.concatenate((batch[:, 1:], batch[:, :1]), axis=1)
+    return adjacency.reshape(tours.shape + (2,))
+
+def _ab_cycles(adj_a: np.ndarray, adj_b: np.ndarray, rng: np.random.Generator) -> List[List[int]]:
+    """
+    Decomposes the symmetric difference of two tours into AB-cycles: closed
+    walks alternating an edge of A and an edge of B. Each cycle is returned as
+    its vertex sequence v0, v1, ... where (v0, v1) is an A-edge.
+    """
+    # Per vertex: A-only and B-only edges (always equally many); common edges are ignored
+    a_only = ~(adj_a[:, :, None] == adj_b[:, None, :]).any(axis=2)
+    b_only = ~(adj_b[:, :, None] == adj_a[:, None, :]).any(axis=2)
+    active = np.flatnonzero(a_only.any(axis=1)).tolist()
+    remaining: Tuple[Dict[int, List[int]], Dict[int, List[int]]] = (
+        {u: adj_a[u][a_only[u]].tolist() for u in active},
+        {u: adj_b[u][b_only[u]].tolist() for u in active},
+    )
+    # One draw per edge of the symmetric difference (each is walked exactly once)
+    draws = rng.random(int(a_only.sum())).tolist()
+    step = 0
+    cycles = []
+    for start in active:
+        while remaining[0][start]:
+            # Edge i of the walk leaves path[i]: A-edges at even i, B-edges at odd i
+            path = [start]
+            seen: Dict[Tuple[int, int], List[int]] = {(start, 0): [0]}
+            while len(path) > 1 or remaining[0][start]:
+                k = len(path)
+                edges = remaining[(k - 1) % 2]
+                current = path[-1]
+                options = edges[current]
+                nxt = options[int(draws[step] * len(options))]
+                step += 1
+                options.remove(nxt)
+                edges[nxt].remove(current)
+
+                # The walk closes an alternating cycle when it returns to a vertex
+                # whose outgoing edge has the other type (same index parity as k)
+                stack = seen.get((nxt, k % 2))
+                if not stack:
+                    seen.setdefault((nxt, k % 2), []).append(k)
+                    path.append(nxt)
+                    continue
+                j = stack[-1]
+                cycle = path[j:]
+                cycles.append(cycle if j % 2 == 0 else cycle[1:] + cycle[:1])
+                for i in range(k - 1, j, -1):
+                    seen[(path[i], i % 2)].pop()
+                del path[j + 1:]
+    return cycles
+
+def _merge_subtours(adjacency: np.ndarray, distance_matrix: DistanceMatrix, neighbors: np.ndarray):
+    """
+    Joins the subtours of a degree-2 adjacency array (n, 2) into one tour, in
+    place: the smallest subtour is repeatedly merged into another by the
+    cheapest exchange of one edge from each (2-opt style). Exchanges are
+    evaluated in one vectorized step over the neighbor lists of the subtour,
+    falling back to every outside city when no neighbor lies outside it.
+    """
+    size = len(adjacency)
+    component = np.full(size, -1, dtype=np.int64)
+    members: Dict[int, List[int]] = {}
+    adj = adjacency.tolist()
+    for start in range(size):
+        if component[start] >= 0:
+            continue
+        cities, prev, current = [], -1, start
+        while component[current] < 0:
+            component[current] = start
+            cities.append(current)
+            a, b = adj[current]
+            prev, current = current, (b if a == prev else a)
+        members[start] = cities
+
+    while len(members) > 1:
+        label = min(members, key=lambda c: len(members[c]))
+        u = np.array(members[label])
+        candidates = neighbors[u]
+        if (component[candidates] == label).all():
+            outside = np.flatnonzero(component != label)
+            candidates = np.broadcast_to(outside, (len(u), len(outside)))
+
+        # Axes: (city u, its edge e, candidate v, v's edge f)
+        cu = u[:, None, None, None]
+        cu2 = adjacency[u][:, :, None, None]
+        cv = candidates[:, None, :, None]
+        cv2 = adjacency[candidates][:, None, :, :]
+        removed = _distances(distance_matrix, cu, cu2) + _distances(distance_matrix, cv, cv2)
+        straight = _distances(distance_matrix, cu, cv) + _distances(distance_matrix, cu2, cv2) - removed
+        crossed = _distances(distance_matrix, cu, cv2) + _distances(distance_matrix, cu2, cv) - removed
+        inside = (component[candidates] == label)[:, None, :, None]
+        straight = np.where(inside, np.inf, straight)
+        crossed = np.where(inside, np.inf, crossed)
+
+        gains = np.stack((straight, crossed))
+        orientation, i, e, k, f = np.unravel_index(int(np.argmin(gains)), gains.shape)
+        a, a2 = int(u[i]), int(adjacency[u[i], e])
+        b, b2 = int(candidates[i, k]), int(adjacency[candidates[i, k], f])
+        x, y = (b, b2) if orientation == 0 else (b2, b)
+        # Remove (a, a2) and (b, b2), add (a, x) and (a2, y)
+        adjacency[a, e] = x
+        adjacency[a2, int(np.flatnonzero(adjacency[a2] == a)[0])] = y
+        adjacency[x, int(np.flatnonzero(adjacency[x] == y)[0])] = a
+        adjacency[y, int(np.flatnonzero(adjacency[y] == x)[0])] = a2
+        target = int(component[x])
+        component[u] = target
+        members[target].extend(members.pop(label))
+
+def eax_child(p_a: np.ndarray, p_b: np.ndarray, distance_matrix: DistanceMatrix,
+              rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Builds one EAX-style child (single AB-cycle E-set) with O(n) adjacency arrays:
+    the A/B symmetric difference is split into AB-cycles, the one with the
+    largest length reduction replaces its A-edges by its B-edges in A, and the
+    resulting subtours are merged greedily using the neighbor lists.
+    """
+    if len(p_a) < 5:
+        return p_a.copy()
+    return _eax(p_a, _tour_adjacency(p_a), _tour_adjacency(p_b), distance_matrix, make_rng(rng))
+
+def _eax(p_a: np.ndarray, adj_a: np.ndarray, adj_b: np.ndarray, distance_matrix: DistanceMatrix,
+         rng: np.random.Generator) -> np.ndarray:
+    size = len(p_a)
+    cycles = _ab_cycles(adj_a, adj_b, rng)
+    if not cycles:
+        return p_a.copy()
+
+    # A-edges leave even positions of a cycle, B-edges odd ones
+    def gain(cycle: List[int]) -> float:
+        c = np.array(cycle)
+        w = _distances(distance_matrix, c, np.roll(c, -1))
+        return float(w[0::2].sum() - w[1::2].sum())
+    cycle = max(cycles, key=gain)
+
+    # E-set application: only the cycle's vertices change neighbors
+    touched = {u: adj_a[u].tolist() for u in cycle}
+    length = len(cycle)
+    for i in range(0, length, 2):
+        u, v = cycle[i], cycle[i + 1]
+        touched[u].remove(v)
+        touched[v].remove(u)
+    for i in range(1, length, 2):
+        u, v = cycle[i], cycle[(i + 1) % length]
+        touched[u].append(v)
+        touched[v].append(u)
+    adjacency = adj_a.copy()
+    for u, pair in touched.items():
+        adjacency[u] = pair
+    _merge_subtours(adjacency, distance_matrix, candidate_lists(distance_matrix, EAX_NEIGHBORS))
+
+    adj = adjacency.tolist()
+    child = [int(p_a[0])]
+    prev = -1
+    while len(child) < size:
+        a, b = adj[child[-1]]
+        nxt = b if a == prev else a
+        prev = child[-1]
+        child.append(nxt)
+    return np.array(child, dtype=p_a.dtype)
+
+def batch_eax_crossover(parents1: np.ndarray, parents2: np.ndarray, distance_matrix: DistanceMatrix,
+                        rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    EAX-style crossover over a whole mating pool (one child per parent order).
+    Adjacency arrays are built for the whole pool at once; pairs of tours with
+    identical edge sets are copied without running the per-pair assembly.
+    """
+    rng = make_rng(rng)
+    children1 = parents1.copy()
+    children2 = parents2.copy()
+    if parents1.shape[1] < 5:
+        return children1, children2
+    adj1, adj2 = _tour_adjacency(parents1), _tour_adjacency(parents2)
+    same_edges = (adj1[:, :, :, None] == adj2[:, :, None, :]).any(axis=3).all(axis=(1, 2))
+    for i in np.flatnonzero(~same_edges):
+        children1[i] = _eax(parents1[i], adj1[i], adj2[i], distance_matrix, rng)
+        children2[i] = _eax(parents2[i], adj2[i], adj1[i], distance_matrix, rng)
+    return children1, children2
+
+# --- Registry ---------------------------------------------------------------
+# Batch operators with a common signature:
+# (parents1, parents2, distance_matrix, rng) -> (children1, children2)
+
+CROSSOVERS: Dict[str, Callable[[np.ndarray, np.ndarray, DistanceMatrix, np.random.Generator],
+                               Tuple[np.ndarray, np.ndarray]]] = {
+    'ox1': lambda p1, p2, dm, rng: batch_ordered_crossover(p1, p2, rng=rng),
+    'cx': lambda p1, p2, dm, rng: batch_cycle_crossover(p1, p2),
+    'pmx': lambda p1, p2, dm, rng: batch_pmx_crossover(p1, p2, rng=rng),
+    'erx': batch_erx_crossover,
+    'eax': batch_eax_crossover,
+}
@@ -0,0 +1,362 @@
+import copy
+import math
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..tsp.city import City
+from ..tsp.route import Route
+from ..tsp.distance_matrix import DistanceMatrix
+from ..tsp.instance_loader import LazyCities
+from ..tsp.spatial_index import project_coordinates
+from .genetic_algorithm import GeneticAlgorithm
+from .local_search import LocalSearch
+from .termination import Termination, TargetDistance
+from .rng import RandomSource, make_rng, seed_sequence
+
+PARTITION_METHODS = ('kmeans', 'grid')
+
+# Points assigned per step in k-means (bounds the (chunk, k) distance block)
+KMEANS_CHUNK = 4096
+
+# Share of the time left after partitioning that goes to the cluster GAs; the
+# outer GA gets half of what remains and stitching/seams use the rest
+CLUSTER_TIME_SHARE = 0.8
+
+
+def _nearest_center(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    labels = np.empty(len(points), dtype=np.int64)
+    for start in range(0, len(points), KMEANS_CHUNK):
+        block = points[start:start + KMEANS_CHUNK]
+        d2 = ((block[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels[start:start + KMEANS_CHUNK] = np.argmin(d2, axis=1)
+    return labels
+
+
+def kmeans_partition(points: np.ndarray, k: int, rng: RandomSource = None, iterations: int = 20) -> List[np.ndarray]:
+    """
+    Lloyd's k-means with k-means++ initialization on planar points.
+    Returns the indices of each non-empty cluster.
+    """
+    rng = make_rng(rng)
+    n = len(points)
+    k = max(1, min(k, n))
+    centers = np.empty((k, 2))
+    centers[0] = points[rng.integers(n)]
+    d2 = ((points - centers[0]) ** 2).sum(axis=1)
+    for c in range(1, k):
+        total = d2.sum()
+        pick = rng.choice(n, p=d2 / total) if total > 0 else rng.integers(n)
+        centers[c] = points[pick]
+        d2 = np.minimum(d2, ((points - centers[c]) ** 2).sum(axis=1))
+
+    labels = _nearest_center(points, centers)
+    for _ in range(iterations):
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros((k, 2))
+        np.add.at(sums, labels, points)
+        filled = counts > 0
+        centers[filled] = sums[filled] / counts[filled, None]
+        new_labels = _nearest_center(points, centers)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    order = np.argsort(labels, kind='stable')
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    return np.split(order, bounds)
+
+
+def grid_partition(points: np.ndarray, cluster_size: int) -> List[np.ndarray]:
+    """
+    Balanced grid: vertical strips with the same number of points, each cut
+    into cells of `cluster_size` points along y.
+    """
+    n = len(points)
+    k = max(1, math.ceil(n / cluster_size))
+    strips = max(1, math.ceil(math.sqrt(k)))
+    clusters = []
+    for strip in np.array_split(np.argsort(points[:, 0], kind='stable'), strips):
+        strip = strip[np.argsort(points[strip, 1], kind='stable')]
+        cells = max(1, math.ceil(len(strip) / cluster_size))
+        clusters.extend(cell for cell in np.array_split(strip, cells) if len(cell))
+    return clusters
+
+
+def partition_clusters(coords: np.ndarray, is_geo: bool, cluster_size: int, method: str = 'kmeans',
+                       rng: RandomSource = None) -> List[np.ndarray]:
+    """
+    Splits the cities into clusters of about `cluster_size` (indices per cluster).
+    Geo coordinates are projected to a local plane (km) first. k-means
+    clusters larger than twice the target are split again.
+    """
+    if method not in PARTITION_METHODS:
+        raise ValueError(f"Unknown partition method '{method}'. Options: {', '.join(PARTITION_METHODS)}")
+    points = project_coordinates(coords, is_geo)
+    if method == 'grid':
+        return grid_partition(points, cluster_size)
+
+    rng = make_rng(rng)
+    clusters = []
+    pending = [np.arange(len(points))]
+    while pending:
+        members = pending.pop()
+        if len(members) <= 2 * cluster_size:
+            clusters.append(members)
+            continue
+        parts = kmeans_partition(points[members], math.ceil(len(members) / cluster_size), rng)
+        if len(parts) == 1:
+            clusters.append(members)
+            continue
+        pending.extend(members[part] for part in parts)
+    return clusters
+
+
+def _subproblem_matrix(coords: np.ndarray, is_geo: bool = False, metric: Optional[str] = None) -> DistanceMatrix:
+    """
+    Distance matrix of a subproblem (cluster or centroids). Its lazy city
+    sequence, needed by GeneticAlgorithm.run() to build a Route, is labeled by local index.
+    """
+    cities = LazyCities(np.arange(len(coords)).astype(str), coords, is_geo)
+    return DistanceMatrix.from_cities(cities, metric=metric)
+
+
+def _solve_cluster(coords: np.ndarray, is_geo: bool, metric: str, ga_kwargs: Dict[str, Any], generations: int,
+                   time_limit: Optional[float], termination: Optional[Termination],
+                   seed: np.random.SeedSequence) -> np.ndarray:
+    """Worker: sub-tour of one cluster (local indices) from an independent GA run."""
+    if len(coords) <= 3:
+        return np.arange(len(coords), dtype=np.int32)
+    distance_matrix = _subproblem_matrix(coords, is_geo, metric)
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, seed=seed, **ga_kwargs)
+    ga.run(generations, progress=False, time_limit=time_limit, termination=termination)
+    return ga.population[int(np.argmin(ga.fitness))].copy()
+
+
+def improve_path(path: np.ndarray, distance_matrix: DistanceMatrix, method: str = 'both',
+                 neighbors: int = 10) -> np.ndarray:
+    """
+    Local search on an open path with fixed endpoints: the path is closed by
+    an edge of large negative length, so no improving move ever removes it,
+    and the resulting cycle is opened there again.
+    """
+    m = len(path)
+    if m < 5:
+        return path
+    block = distance_matrix.block(path, path).astype(np.float64)
+    block[0, -1] = block[-1, 0] = -(block.max() * m + 1.0)
+    window = DistanceMatrix(distance_matrix.coords[path], is_geo=distance_matrix.is_geo, matrix=block)
+    tour = np.arange(m, dtype=np.int32)
+    LocalSearch(window, method, min(neighbors, m - 1)).improve(tour)
+    tour = np.roll(tour, -int(np.flatnonzero(tour == 0)[0]))
+    if tour[-1] != m - 1:
+        tour[1:] = tour[1:][::-1]
+    return path[tour]
+
+
+class ClusterSolver:
+    """
+    Hierarchical solver for large instances (10k+ stops), where a GA over the
+    full permutation is out of reach:
+
+    1. partition the cities into clusters of about `cluster_size` (k-means or grid);
+    2. solve each cluster's sub-tour with an independent GeneticAlgorithm, in
+       parallel worker processes (only the cluster coordinates are sent);
+    3. order the clusters with a small outer GA over their centroids;
+    4. stitch the sub-tours, choosing where each one is opened and in which
+       direction (exact DP over the `stitch_candidates` most promising cuts per cluster);
+    5. improve a window of `seam_window` stops around every seam with local search.
+
+    Wall time of each phase is kept in `timings`.
+    """
+    def __init__(self, cities: Optional[List[City]], cluster_size: int = 200, partition: str = 'kmeans',
+                 workers: Optional[int] = None, distance_matrix: Optional[DistanceMatrix] = None,
+                 seed: RandomSource = None, stitch_candidates: int = 8, seam_window: int = 30,
+                 seam_search: str = 'both', outer_generations: int = 200, **ga_kwargs):
+        if partition not in PARTITION_METHODS:
+            raise ValueError(f"Unknown partition method '{partition}'. Options: {', '.join(PARTITION_METHODS)}")
+        self.distance_matrix = distance_matrix or DistanceMatrix.from_cities(cities)
+        if self.distance_matrix.metric == 'explicit':
+            raise ValueError("Cluster decomposition needs city coordinates (explicit matrices are not supported)")
+        self.cluster_size = max(4, cluster_size)
+        self.partition = partition
+        self.workers = workers or os.cpu_count()
+        self.seed_sequence = seed_sequence(seed)
+        self.rng = make_rng(self.seed_sequence)
+        self.stitch_candidates = max(1, stitch_candidates)
+        self.seam_window = seam_window
+        self.seam_search = seam_search
+        self.outer_generations = outer_generations
+        self.ga_kwargs = ga_kwargs
+        self.clusters: List[np.ndarray] = []
+        self.timings: Dict[str, float] = {}
+
+    @staticmethod
+    def _cluster_termination(termination: Optional[Termination]) -> Optional[Termination]:
+        """
+        Fresh copy of the stopping criteria for one cluster GA (they keep state,
+        e.g. restarts done). Distance targets refer to the full tour, so they are left out.
+        """
+        if termination is None:
+            return None
+        criteria = [copy.deepcopy(c) for c in termination.criteria if not isinstance(c, TargetDistance)]
+        if not criteria:
+            return None
+        return Termination(criteria, termination.restarts, termination.restart_keep)
+
+    def _solve_clusters(self, generations: int, time_limit: Optional[float],
+                        termination: Optional[Termination]) -> List[np.ndarray]:
+        """
+        Sub-tour of every cluster, in global indices (results kept in cluster order).
+        time_limit is the budget of the whole phase: clusters run in waves of
+        `workers`, and each one gets an equal share of it.
+        """
+        dm = self.distance_matrix
+        seeds = self.seed_sequence.spawn(len(self.clusters))
+        if time_limit is not None:
+            waves = math.ceil(len(self.clusters) / max(1, min(self.workers, len(self.clusters))))
+            time_limit = time_limit / waves
+        args = [(dm.coords[cluster], dm.is_geo, dm.metric, self.ga_kwargs, generations, time_limit,
+                 self._cluster_termination(termination), seeds[i]) for i, cluster in enumerate(self.clusters)]
+        if self.workers <= 1:
+            local = [_solve_cluster(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                local = [f.result() for f in [executor.submit(_solve_cluster, *a) for a in args]]
+        return [cluster[tour] for cluster, tour in zip(self.clusters, local)]
+
+    def _order_clusters(self, centroids: np.ndarray, time_limit: Optional[float] = None) -> np.ndarray:
+        """Visiting order of the clusters: small GA with 2-opt over the (planar) centroids."""
+        k = len(centroids)
+        if k <= 3:
+            return np.arange(k)
+        outer = GeneticAlgorithm(None, distance_matrix=_subproblem_matrix(centroids), pop_size=50,
+                                 mutation='or_opt', local_search='2opt', seeding_ratio=0.2,
+                                 seed=self.rng)
+        route, _ = outer.run(self.outer_generations, progress=False, time_limit=time_limit)
+        return route.indices
+
+    def _cut_options(self, tour: np.ndarray, points: np.ndarray, prev_center: np.ndarray,
+                     next_center: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Candidate ways of opening a sub-tour into a path: (cut position, reversed flag,
+        internal length saving). Ranked by the removed edge and how close the
+        resulting entry/exit are to the neighboring clusters.
+        """
+        m = len(tour)
+        nxt = np.roll(tour, -1)
+        edge = self.distance_matrix.pair_distances(tour, nxt).astype(np.float64)
+        p_here = points[tour]
+        p_next = points[nxt]
+        # Forward: enter at tour[j+1], leave at tour[j]; reversed: enter at tour[j], leave at tour[j+1]
+        forward = np.linalg.norm(p_next - prev_center, axis=1) + np.linalg.norm(p_here - next_center, axis=1)
+        backward = np.linalg.norm(p_here - prev_center, axis=1) + np.linalg.norm(p_next - next_center, axis=1)
+        score = np.concatenate((forward, backward)) - np.concatenate((edge, edge))
+        best = np.argsort(score, kind='stable')[:self.stitch_candidates]
+        return best % m, best >= m, edge[best % m]
+
+    @staticmethod
+    def _open_path(tour: np.ndarray, cut: int, reverse: bool) -> np.ndarray:
+        path = np.roll(tour, -(cut + 1))
+        return path[::-1] if reverse else path
+
+    def _stitch(self, tours: List[np.ndarray], points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """
+        Joins the ordered sub-tours into one tour. For each cluster a few cut
+        options are kept; a cyclic DP picks the combination minimizing the
+        connecting edges minus the removed ones.
+        """
+        k = len(tours)
+        if k == 1:
+            return tours[0]
+        dm = self.distance_matrix
+        options = []
+        for i, tour in enumerate(tours):
+            if len(tour) == 1:
+                options.append((np.zeros(1, dtype=np.int64), np.zeros(1, dtype=bool), np.zeros(1)))
+                continue
+            options.append(self._cut_options(tour, points, centroids[(i - 1) % k], centroids[(i + 1) % k]))
+        paths = [[self._open_path(tour, int(c), bool(r)) for c, r in zip(opts[0], opts[1])]
+                 for tour, opts in zip(tours, options)]
+        entries = [np.array([p[0] for p in cluster_paths]) for cluster_paths in paths]
+        exits = [np.array([p[-1] for p in cluster_paths]) for cluster_paths in paths]
+        savings = [opts[2] for opts in options]
+
+        # cost[s, b]: best cost from start option s (cluster 0) to option b of the current cluster
+        cost = np.where(np.eye(len(entries[0]), dtype=bool), -savings[0][:, None], np.inf)
+        back = []
+        for i in range(1, k):
+            link = dm.block(exits[i - 1], entries[i]).astype(np.float64)
+            total = cost[:, :, None] + link[None, :, :]
+            back.append(np.argmin(total, axis=1))
+            cost = np.min(total, axis=1) - savings[i][None, :]
+        closing = dm.block(exits[-1], entries[0]).astype(np.float64)
+        final = cost + closing.T
+        start, last = np.unravel_index(np.argmin(final), final.shape)
+
+        chosen = [int(last)]
+        for i in range(k - 1, 0, -1):
+            chosen.append(int(back[i - 1][start, chosen[-1]]))
+        chosen.reverse()
+        return np.concatenate([paths[i][c] for i, c in enumerate(chosen)]).astype(np.int32)
+
+    def _improve_seams(self, tour: np.ndarray, seams: List[int], deadline: float = math.inf) -> np.ndarray:
+        """
+        Local search on a window of seam_window stops on each side of every seam
+        (endpoints fixed). Seams left when the deadline passes are kept as stitched.
+        """
+        n = len(tour)
+        w = min(self.seam_window, (n - 2) // 2)
+        if w < 2:
+            return tour
+        for seam in seams:
+            if time.perf_counter() >= deadline:
+                break
+            positions = (seam + np.arange(-w - 1, w + 1)) % n
+            tour[positions] = improve_path(tour[positions], self.distance_matrix, self.seam_search)
+        return tour
+
+    def run(self, generations: int, time_limit: Optional[float] = None,
+            termination: Optional[Termination] = None) -> Tuple[Route, List[np.ndarray]]:
+        """
+        Solves the instance. generations and termination apply to each
+        cluster's GA (distance targets excepted); time_limit is the wall-clock
+        budget of the whole run, split between the phases.
+        Returns: (best_route, sub-tours in visiting order)
+        """
+        dm = self.distance_matrix
+        deadline = time.perf_counter() + time_limit if time_limit is not None else math.inf
+
+        def remaining(share: float = 1.0) -> Optional[float]:
+            if time_limit is None:
+                return None
+            return max(0.0, deadline - time.perf_counter()) * share
+
+        points = project_coordinates(dm.coords, dm.is_geo)
+
+        start = time.perf_counter()
+        self.clusters = partition_clusters(dm.coords, dm.is_geo, self.cluster_size, self.partition, self.rng)
+        self.timings['partition'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tours = self._solve_clusters(generations, remaining(CLUSTER_TIME_SHARE), termination)
+        self.timings['clusters'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        centroids = np.array([points[cluster].mean(axis=0) for cluster in self.clusters])
+        order = self._order_clusters(centroids, remaining(0.5))
+        tours = [tours[i] for i in order]
+        centroids = centroids[order]
+        self.timings['outer'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tour = self._stitch(tours, points, centroids)
+        self.timings['stitch'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        seams = np.cumsum([0] + [len(t) for t in tours[:-1]]).tolist() if len(tours) > 1 else []
+        tour = self._improve_seams(tour, seams, deadline)
+        self.timings['seams'] = time.perf_counter() - start
+
+        return Route.from_indices(tour, dm), tours
@@ -0,0 +1,39 @@
+import numpy as np
+from ..tsp.distance_matrix import DistanceMatrix
+
+class BatchEvaluator:
+    """
+    Vectorized fitness evaluator.
+    Computes the tour lengths of a whole population matrix (one row of city
+    indices per individual) with a single gather-and-sum over the distance matrix.
+
+    Any callable with the same signature (population -> distances) can be
+    passed to GeneticAlgorithm as a replacement.
+    """
+    # Upper bound on gathered elements per chunk (bounds temporary memory)
+    CHUNK_ELEMENTS = 1 << 22
+
+    def __init__(self, distance_matrix: DistanceMatrix):
+        self.distance_matrix = distance_matrix
+        self.evaluations = 0
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        population = np.atleast_2d(population)
+        n_rows, n_cities = population.shape
+        self.evaluations += n_rows
+
+        matrix = self.distance_matrix.matrix
+        if matrix is None:
+            # Row-cache mode: no full matrix to gather from
+            return np.array([self.distance_matrix.tour_length(row) for row in population],
+                            dtype=np.float64)
+
+        distances = np.empty(n_rows, dtype=np.float64)
+        chunk = max(1, self.CHUNK_ELEMENTS // max(1, n_cities))
+        for start in range(0, n_rows, chunk):
+            block = population[start:start + chunk]
+            # Open path edges plus the closing edge (last -> first)
+            total = matrix[block[:, :-1], block[:, 1:]].sum(axis=1, dtype=np.float64)
+            total += matrix[block[:, -1], block[:, 0]]
+            distances[start:start + chunk] = total
+        return distances
\ No newline at end of file
@@ -1,94 +1,632 @@
-import random
-from typing import List, Tuple, Optional
+import time
+import numpy as np
+from functools import partial
+from typing import List, Dict, Tuple, Optional, Callable, Sequence
 from tqdm import tqdm
 
 from ..tsp.city import City
 from ..tsp.route import Route
-from .selection import tournament_selection
-from .crossover import ordered_crossover
-from .mutation import inversion_mutation
+from ..tsp.distance_matrix import DistanceMatrix
+from ..tsp.changes import StopChange, stop_index
+from .selection import batch_tournament_selection
+from .crossover import CROSSOVERS
+from .mutation import DELTA_MUTATIONS, NEIGHBOR_MUTATIONS, MUTATION_DRAWS, inversion_delta
+from .evaluation import BatchEvaluator
+from .local_search import LocalSearch, candidate_lists
+from .seeding import PopulationSeeder
+from .instrumentation import Instrumentation, Observer
+from .repair import cheapest_insertion, batch_cheapest_insertion
+from .checkpoint import save_checkpoint
+from .termination import Termination, TimeLimit
+from .replacement import REPLACEMENT_STRATEGIES, top_k, worst_k, default_offspring_size
+from .rng import RandomSource, make_rng, scaled_index
+from .tour_hash import FitnessCache, CachedEvaluator, tour_hashes, update_hash
+
+# What to do with clones (same canonical tour) after each generation
+DUPLICATE_POLICIES = ('allow', 'mutate', 'reseed')
+# Random 2-opt moves tried per clone by the 'mutate' policy until it is unique
+DEDUP_ATTEMPTS = 4
 
 class GeneticAlgorithm:
-    def __init__(self, cities: List[City], pop_size: int = 100, 
-                 mutation_rate: float = 0.01, crossover_rate: float = 0.9, 
-                 elitism: bool = True):
+    def __init__(self, cities: Optional[List[City]], pop_size: int = 100,
+                 mutation_rate: float = 0.01, crossover_rate: float = 0.9,
+                 elitism: bool = True, distance_matrix: Optional[DistanceMatrix] = None,
+                 evaluator: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 mutation: str = 'inversion', debug_delta: bool = False,
+                 local_search: Optional[str] = None, ls_rate: float = 0.05, ls_elites: int = 1,
+                 neighbors: int = 10, seeding_ratio: float = 0.0,
+                 observers: Optional[List[Observer]] = None, diversity_every: int = 1,
+                 elite_size: int = 1, replacement: str = 'generational',
+                 offspring_size: Optional[int] = None, crossover: str = 'ox1',
+                 seed: RandomSource = None, fitness_cache: int = 0, duplicates: str = 'allow'):
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"Unknown crossover '{crossover}'. Options: {', '.join(CROSSOVERS)}")
+        if mutation not in DELTA_MUTATIONS:
+            raise ValueError(f"Unknown mutation '{mutation}'. Options: {', '.join(DELTA_MUTATIONS)}")
+        if replacement not in REPLACEMENT_STRATEGIES:
+            raise ValueError(f"Unknown replacement '{replacement}'. Options: {', '.join(REPLACEMENT_STRATEGIES)}")
+        if duplicates not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicates policy '{duplicates}'. Options: {', '.join(DUPLICATE_POLICIES)}")
         self.cities = cities
+        # Single explicit random stream for every stochastic step (initialization,
+        # selection, crossover, mutation, local search sampling): a fixed seed
+        # reproduces the run bit for bit
+        self.rng = make_rng(seed)
         self.pop_size = pop_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elitism = elitism
-        self.population: List[Route] = []
-        
+        # Survivor strategy; elite_size best individuals are kept by generational/(μ,λ)
+        self.replacement = replacement
+        self.elite_size = min(max(0, elite_size), pop_size) if elitism else 0
+        self.offspring_size = offspring_size or default_offspring_size(replacement, pop_size, self.elite_size)
+        if replacement == 'generational':
+            self.offspring_size = pop_size - self.elite_size
+        elif replacement == 'mu_comma_lambda' and self.offspring_size < pop_size - self.elite_size:
+            raise ValueError("mu_comma_lambda needs offspring_size >= pop_size - elite_size")
+        # Batch crossover operator: (parents1, parents2, distance_matrix, rng) -> (children1, children2)
+        self.crossover = crossover
+        self._crossover = CROSSOVERS[crossover]
+        # Mutation operator: applies a move in place (from MUTATION_DRAWS pre-drawn
+        # uniforms) and returns its length delta
+        self.mutation = mutation
+        self._mutate = DELTA_MUTATIONS[mutation]
+        # Cross-check every delta update against a full recomputation (slow)
+        self.debug_delta = debug_delta
+        # Distance matrix built once per instance and shared by every Route
+        # (cities may be None when a prebuilt matrix is given, e.g. inside island workers)
+        self.distance_matrix = distance_matrix or DistanceMatrix.from_cities(cities)
+        self.n_cities = len(self.distance_matrix)
+        # Batch fitness evaluator (population matrix -> tour lengths), pluggable
+        self.evaluator = evaluator or BatchEvaluator(self.distance_matrix)
+        # Optional LRU memo of tour lengths by canonical tour hash (fitness_cache = capacity):
+        # known tours and clones skip evaluation; the population is stored every generation
+        self.fitness_cache = FitnessCache(fitness_cache) if fitness_cache > 0 else None
+        if self.fitness_cache is not None:
+            self.evaluator = CachedEvaluator(self.evaluator, self.fitness_cache)
+        # Clone handling: 'mutate' applies random 2-opt moves to clones, 'reseed'
+        # replaces them with fresh individuals (one copy of each tour is kept)
+        self.duplicates = duplicates
+        self.duplicates_replaced = 0
+        # Distinct tours in the population after the last generation (None when not tracked)
+        self.unique_individuals: Optional[int] = None
+
+        # Optional memetic stage: local search on the best `ls_elites` individuals
+        # and on a random `ls_rate` fraction of the offspring every generation
+        # k-nearest-neighbor candidate lists, built once and shared by the
+        # neighbor-restricted mutations and the local search
+        self.neighbors = neighbors
+        if mutation in NEIGHBOR_MUTATIONS:
+            self._mutate = partial(self._mutate, neighbors=candidate_lists(self.distance_matrix, neighbors))
+        self.local_search = LocalSearch(self.distance_matrix, local_search, neighbors,
+                                        candidate_lists(self.distance_matrix, neighbors)) if local_search else None
+        self.ls_rate = ls_rate
+        self.ls_elites = ls_elites
+        # Fraction of the initial population built by constructive heuristics
+        self.seeding_ratio = seeding_ratio
+        # Number of tour evaluations (full batch evaluations plus delta-evaluated mutants)
+        self.evaluations = 0
+        # Accumulated wall time (seconds) spent in each stage
+        self.timings = {'evolution': 0.0, 'local_search': 0.0}
+        self.generation = 0
+        # Best distance per generation, kept across run() calls (and checkpoints)
+        self.history: List[float] = []
+        self.restarts = 0
+        # Per-generation operator statistics (mutation acceptance, improvement per evaluation)
+        self.stats_history: List[Dict[str, float]] = []
+        self._reset_generation_counts()
+        # Why the last run() stopped: 'generations' or the name of a termination criterion
+        self.stop_reason: Optional[str] = None
+        # Per-phase timers/counters and event stream; None (zero cost) without observers
+        self.instrumentation = Instrumentation(observers, diversity_every) if observers else None
+
+        # Population: one row of city indices per individual, plus a parallel fitness vector.
+        # Kept unsorted; the best individuals are found by partial selection when needed.
+        self.population = np.empty((pop_size, self.n_cities), dtype=np.int32)
+        self.fitness = np.empty(pop_size, dtype=np.float64)
+        # Work buffer reused every generation: next population (generational),
+        # parents + offspring pool (μ+λ), elites + offspring pool (μ,λ) or offspring (steady state)
+        pool_size = {
+            'generational': pop_size,
+            'steady_state': self.offspring_size,
+            'mu_plus_lambda': pop_size + self.offspring_size,
+            'mu_comma_lambda': self.elite_size + self.offspring_size,
+        }[replacement]
+        self._pool = np.empty((pool_size, self.n_cities), dtype=np.int32)
+        self._pool_fitness = np.empty(pool_size, dtype=np.float64)
+
         self._initialize_population()
 
+    def _new_individuals(self, count: int) -> np.ndarray:
+        """Fresh tours: heuristic seeds (seeding_ratio of them) plus random permutations."""
+        # Random permutations of city indices, one per row
+        keys = self.rng.random((count, self.n_cities))
+        individuals = np.argsort(keys, axis=1).astype(np.int32)
+
+        n_seeded = min(count, int(round(self.seeding_ratio * count)))
+        if n_seeded > 0 and self.n_cities > 3:
+            individuals[:n_seeded] = PopulationSeeder(self.distance_matrix, rng=self.rng).seed(n_seeded)
+        return individuals
+
+    def _evaluate(self, tours: np.ndarray) -> np.ndarray:
+        """Batch evaluation; counts only the tours actually evaluated (not fitness cache hits)."""
+        distances = self.evaluator(tours)
+        evaluated = self.evaluator.last_evaluated if self.fitness_cache is not None else len(tours)
+        self.evaluations += evaluated
+        if self.instrumentation is not None:
+            self.instrumentation.count('evaluations', evaluated)
+        return distances
+
     def _initialize_population(self):
-        """Creates initial random population."""
-        self.population = []
-        for _ in range(self.pop_size):
-            # Create random permutation of cities
-            shuffled_cities = random.sample(self.cities, len(self.cities))
-            self.population.append(Route(shuffled_cities))
+        """Creates initial population: heuristic seeds (seeding_ratio) plus random tours."""
+        self.population[:] = self._new_individuals(self.pop_size)
+        self.fitness[:] = self._evaluate(self.population)
+
+    def restart(self, keep_ratio: float = 0.1):
+        """
+        Partial restart: keeps the best keep_ratio of the population (at least one)
+        and replaces everyone else with fresh individuals.
+        """
+        keep = min(self.pop_size, max(1, int(round(keep_ratio * self.pop_size))))
+        replaced = np.ones(self.pop_size, dtype=bool)
+        replaced[top_k(self.fitness, keep)] = False
+        slots = np.flatnonzero(replaced)
+        if len(slots) == 0:
+            return
+        self.population[slots] = self._new_individuals(len(slots))
+        self.fitness[slots] = self._evaluate(self.population[slots])
+        self.restarts += 1
+        if self.instrumentation is not None:
+            self.instrumentation.count('restarts')
 
     def _get_best_route(self) -> Route:
         """Returns the route with the shortest distance in current population."""
-        # Sort population by distance (ascending)
-        self.population.sort(key=lambda x: x.distance)
-        return self.population[0]
+        best = int(np.argmin(self.fitness))
+        return Route.from_indices(self.population[best], self.distance_matrix, float(self.fitness[best]))
+
+    def warm_start(self, tours: List[np.ndarray], copies_ratio: float = 0.1):
+        """
+        Seeds the population with previously found tours (e.g. from routes/ manifests).
+        Cities missing from a tour are added by cheapest insertion; each tour replaces
+        the worst individuals together with mutated copies, up to copies_ratio of the population.
+        """
+        copies = max(1, int(round(copies_ratio * self.pop_size)) // max(1, len(tours)))
+        all_cities = np.arange(self.n_cities)
+        for tour in tours:
+            tour = np.asarray(tour, dtype=np.int32)
+            missing = np.setdiff1d(all_cities, tour)
+            tour = cheapest_insertion(tour, missing.tolist(), self.distance_matrix)
+            distance = self.distance_matrix.tour_length(tour)
+
+            slots = worst_k(self.fitness, copies)
+            draws = self.rng.random((len(slots), 3, MUTATION_DRAWS)).tolist()
+            for n, slot in enumerate(slots):
+                self.population[slot] = tour
+                self.fitness[slot] = distance
+                # Keep the first copy intact; diversify the others with a few mutations
+                for move in draws[n][:min(n, 3)]:
+                    _, delta = self._mutate(self.population[slot], self.distance_matrix, move)
+                    self.fitness[slot] += delta
+
+    def emigrants(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns copies of the `count` best individuals (genes, distances)."""
+        best = top_k(self.fitness, count)
+        return self.population[best].copy(), self.fitness[best].copy()
+
+    def immigrate(self, genes: np.ndarray, distances: np.ndarray):
+        """Replaces the worst individuals with incoming migrants."""
+        if len(genes) == 0:
+            return
+        worst = worst_k(self.fitness, len(genes))
+        self.population[worst] = genes[:len(worst)]
+        self.fitness[worst] = distances[:len(worst)]
+
+    # --- Dynamic instances ----------------------------------------------------
+    # Stops can be added, removed or moved between run() calls. The distance
+    # matrix is patched in place (only the affected rows/columns are computed),
+    # the current population is repaired instead of rebuilt, and evolution
+    # continues from it, which is far cheaper than a cold solve.
+
+    def add_stops(self, coords: np.ndarray, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Adds stops (returns their indices); each individual gets them by cheapest insertion."""
+        if names is not None and self.distance_matrix.cities is not None:
+            existing = stop_index(self.distance_matrix.cities)
+            if len(set(names)) != len(names) or any(name in existing for name in names):
+                raise ValueError("Names of added stops must be new and distinct")
+        added = self._add_stops(coords, names)
+        self._instance_changed()
+        return added
+
+    def remove_stops(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Removes stops, splicing them out of every individual (the remaining
+        order is kept). Returns the old -> new index map (-1 for removed stops).
+        """
+        mapping = self._remove_stops(self._stop_indices(indices))
+        self._instance_changed()
+        return mapping
+
+    def move_stops(self, indices: Sequence[int], coords: np.ndarray):
+        """Moves stops to new coordinates; they are spliced out and reinserted where they now fit best."""
+        self._move_stops(self._stop_indices(indices), coords)
+        self._instance_changed()
+
+    def apply_changes(self, changes: Sequence[StopChange]):
+        """
+        Applies stop changes identified by name: removals first, then moves,
+        then additions, each group as a single repair of the population.
+        The whole batch is validated before anything changes and counts as
+        one instance change (one history entry, one re-evaluation).
+        """
+        if self.distance_matrix.cities is None:
+            raise ValueError("Stop changes by name need the cities of the instance")
+        index_of = stop_index(self.distance_matrix.cities)
+        names = [c.name for c in changes]
+        repeated = sorted({name for name in names if names.count(name) > 1})
+        if repeated:
+            raise ValueError(f"Stops changed more than once in the same batch: {', '.join(repeated)}")
+        for change in changes:
+            if change.op == 'add' and change.name in index_of:
+                raise ValueError(f"Stop '{change.name}' already exists")
+            if change.op != 'add' and change.name not in index_of:
+                raise ValueError(f"Unknown stop '{change.name}'")
+        if not changes:
+            return
+
+        removed = [index_of[c.name] for c in changes if c.op == 'remove']
+        moved = [c for c in changes if c.op == 'move']
+        added = [c for c in changes if c.op == 'add']
+        moved_indices = np.array([index_of[c.name] for c in moved], dtype=np.int32)
+        if removed:
+            moved_indices = self._remove_stops(self._stop_indices(removed))[moved_indices]
+        if moved:
+            self._move_stops(moved_indices, [(c.c1, c.c2) for c in moved])
+        if added:
+            self._add_stops([(c.c1, c.c2) for c in added], [c.name for c in added])
+        self._instance_changed()
+
+    def reoptimize(self, changes: Sequence[StopChange], generations: int = 100,
+                   time_limit: Optional[float] = None, progress: bool = False) -> Tuple[Route, List[float]]:
+        """Applies the changes and continues evolving the repaired population for a short budget."""
+        self.apply_changes(changes)
+        return self.run(generations, progress=progress, time_limit=time_limit)
+
+    def _stop_indices(self, indices: Sequence[int]) -> np.ndarray:
+        """Validates stop indices for removal/moves: in range and without repetitions."""
+        indices = np.asarray(indices, dtype=np.int32).reshape(-1)
+        if len(indices) and (indices.min() < 0 or indices.max() >= self.n_cities):
+            raise ValueError(f"Stop indices must be in [0, {self.n_cities})")
+        if len(np.unique(indices)) != len(indices):
+            raise ValueError("Stop indices must not repeat")
+        return indices
+
+    def _add_stops(self, coords: np.ndarray, names: Optional[Sequence[str]]) -> np.ndarray:
+        added = self.distance_matrix.add_points(coords, names)
+        self.population = batch_cheapest_insertion(self.population, added.tolist(), self.distance_matrix)
+        return added
+
+    def _remove_stops(self, indices: np.ndarray) -> np.ndarray:
+        mapping = self.distance_matrix.remove_points(indices)
+        mapped = mapping[self.population]
+        self.population = mapped[mapped >= 0].reshape(self.pop_size, -1)
+        return mapping
+
+    def _move_stops(self, indices: np.ndarray, coords: np.ndarray):
+        self.distance_matrix.update_points(indices, coords)
+        moved = np.isin(self.population, indices)
+        kept = self.population[~moved].reshape(self.pop_size, -1)
+        self.population = batch_cheapest_insertion(kept, indices.tolist(), self.distance_matrix)
+
+    def _instance_changed(self):
+        """
+        Rebinds everything derived from the instance after stops changed:
+        buffers, candidate lists of the neighbor mutations and local search,
+        fitness (re-evaluated) and the fitness cache (hashes use the old
+        indices). The repaired best is appended to the history as the
+        baseline of the next run().
+        """
+        dm = self.distance_matrix
+        self.n_cities = len(dm)
+        self.cities = dm.cities
+        self.population = np.ascontiguousarray(self.population, dtype=np.int32)
+        self._pool = np.empty((len(self._pool), self.n_cities), dtype=np.int32)
+        self._mutate = DELTA_MUTATIONS[self.mutation]
+        if self.mutation in NEIGHBOR_MUTATIONS:
+            self._mutate = partial(self._mutate, neighbors=candidate_lists(dm, self.neighbors))
+        if self.local_search is not None:
+            self.local_search = LocalSearch(dm, self.local_search.method, self.neighbors,
+                                            candidate_lists(dm, self.neighbors))
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+        self.fitness[:] = self._evaluate(self.population)
+        self.history.append(float(self.fitness.min()))
+
+    def _check_distance(self, genes: np.ndarray, distance: float):
+        """Debug check: incremental distance must match a full recomputation."""
+        expected = self.distance_matrix.tour_length(genes)
+        if not np.isclose(distance, expected, rtol=1e-6, atol=1e-6):
+            raise RuntimeError(f"Delta evaluation mismatch: cached {distance:.6f}, recomputed {expected:.6f}")
+
+    def _apply_local_search(self, population: np.ndarray, fitness: np.ndarray, indices: np.ndarray) -> int:
+        """Improves the given individuals in place. Returns how many."""
+        for i in indices:
+            fitness[i] += self.local_search.improve(population[i])
+            if self.debug_delta:
+                self._check_distance(population[i], fitness[i])
+        return len(indices)
+
+    def _make_offspring(self, offspring: np.ndarray, offspring_fitness: np.ndarray):
+        """
+        Fills the offspring buffers: selection, crossover, batch evaluation,
+        mutation (delta-evaluated) and the optional local search on a fraction of the children.
+        """
+        inst = self.instrumentation
+        n_offspring = len(offspring)
+        n_pairs = (n_offspring + 1) // 2
+        rng = self.rng
+        # Crossover, mutation and local search masks of the generation in one draw
+        crossover_draws, mutation_draws, ls_draws = rng.random((3, n_offspring))
+
+        # Selection: every tournament of the generation drawn at once
+        parents = batch_tournament_selection(self.fitness, 2 * n_pairs, rng=rng)
+        # Children start as copies of their parents and inherit their distance
+        np.take(self.population, parents[:n_offspring], axis=0, out=offspring)
+        offspring_fitness[:] = self.fitness[parents[:n_offspring]]
+        needs_eval = np.zeros(n_offspring, dtype=bool)
+        if inst is not None:
+            inst.lap('selection')
+
+        # Crossover: the whole mating pool is crossed in one call
+        pairs = np.flatnonzero(crossover_draws[:n_pairs] < self.crossover_rate)
+        if len(pairs):
+            first, second = 2 * pairs, 2 * pairs + 1
+            children1, children2 = self._crossover(self.population[parents[first]],
+                                                   self.population[parents[second]], self.distance_matrix, rng)
+            offspring[first] = children1
+            needs_eval[first] = True
+            # The last pair may only have room for one child
+            valid = second < n_offspring
+            offspring[second[valid]] = children2[valid]
+            needs_eval[second[valid]] = True
+        if inst is not None:
+            inst.lap('crossover')
+            inst.count('crossovers', len(pairs))
+
+        # Fitness: crossover children are evaluated as one batch
+        if needs_eval.any():
+            offspring_fitness[needs_eval] = self._evaluate(offspring[needs_eval])
+        if inst is not None:
+            inst.lap('evaluation')
+
+        # Mutation: moves applied in place, distance updated in O(1) from the cached length
+        mutants = np.flatnonzero(mutation_draws < self.mutation_rate)
+        self.evaluations += len(mutants)
+        counts = self._mutation_counts
+        # Random numbers of every move drawn at once, one row per mutant
+        moves = rng.random((len(mutants), MUTATION_DRAWS)).tolist()
+        for i, move in zip(mutants, moves):
+            _, delta = self._mutate(offspring[i], self.distance_matrix, move)
+            offspring_fitness[i] += delta
+            if delta < 0:
+                counts['improving'] += 1
+                counts['gain'] -= delta
+            if self.debug_delta:
+                self._check_distance(offspring[i], offspring_fitness[i])
+        counts['attempted'] += len(mutants)
+        if inst is not None:
+            inst.lap('mutation')
+            inst.count('mutations', len(mutants))
+            inst.count('evaluations', len(mutants))
+
+        # Memetic stage on a random fraction of the children
+        if self.local_search is not None:
+            ls_start = time.perf_counter()
+            chosen = np.flatnonzero(ls_draws < self.ls_rate)
+            improved = self._apply_local_search(offspring, offspring_fitness, chosen)
+            self.timings['local_search'] += time.perf_counter() - ls_start
+            if inst is not None:
+                inst.lap('local_search')
+                inst.count('local_searches', improved)
+
+    def _replace(self):
+        """Builds the next population according to the survivor strategy."""
+        pop_size, k = self.pop_size, self.elite_size
+        pool, pool_fitness = self._pool, self._pool_fitness
+
+        if self.replacement == 'generational':
+            # Elites (partial selection) + offspring, then swap buffers
+            elites = top_k(self.fitness, k)
+            pool[:k] = self.population[elites]
+            pool_fitness[:k] = self.fitness[elites]
+            self._make_offspring(pool[k:], pool_fitness[k:])
+            self._pool, self.population = self.population, pool
+            self._pool_fitness, self.fitness = self.fitness, pool_fitness
+
+        elif self.replacement == 'steady_state':
+            # Offspring replace the worst individuals
+            self._make_offspring(pool, pool_fitness)
+            worst = worst_k(self.fitness, len(pool))
+            self.population[worst] = pool
+            self.fitness[worst] = pool_fitness
+
+        elif self.replacement == 'mu_plus_lambda':
+            pool[:pop_size] = self.population
+            pool_fitness[:pop_size] = self.fitness
+            self._make_offspring(pool[pop_size:], pool_fitness[pop_size:])
+            survivors = top_k(pool_fitness, pop_size)
+            np.take(pool, survivors, axis=0, out=self.population)
+            np.take(pool_fitness, survivors, out=self.fitness)
+
+        else:  # mu_comma_lambda
+            elites = top_k(self.fitness, k)
+            pool[:k] = self.population[elites]
+            pool_fitness[:k] = self.fitness[elites]
+            self._make_offspring(pool[k:], pool_fitness[k:])
+            survivors = np.concatenate((np.arange(k), k + top_k(pool_fitness[k:], pop_size - k)))
+            np.take(pool, survivors, axis=0, out=self.population)
+            np.take(pool_fitness, survivors, out=self.fitness)
+
+    def _track_duplicates(self):
+        """
+        Hashes the new population: counts distinct tours, replaces clones
+        according to the duplicates policy and memoizes every tour length.
+        """
+        hashes = tour_hashes(self.population)
+        _, first = np.unique(hashes, return_index=True)
+        self.unique_individuals = len(first)
+        clones = np.setdiff1d(np.arange(self.pop_size), first)
+        if len(clones) and self.duplicates != 'allow':
+            self._replace_clones(clones, hashes, set(hashes[first].tolist()))
+            self.duplicates_replaced += len(clones)
+            if self.instrumentation is not None:
+                self.instrumentation.count('duplicates_replaced', len(clones))
+        if self.fitness_cache is not None:
+            self.fitness_cache.store(hashes, self.fitness)
+
+    def _replace_clones(self, clones: np.ndarray, hashes: np.ndarray, seen: set):
+        """Turns every clone into a new tour in place (hashes and fitness updated)."""
+        if self.duplicates == 'reseed':
+            self.population[clones] = self._new_individuals(len(clones))
+            self.fitness[clones] = self._evaluate(self.population[clones])
+            hashes[clones] = tour_hashes(self.population[clones])
+            return
+
+        # 'mutate': random 2-opt moves, delta-evaluated, with the hash updated
+        # in O(1) from the two edges each move swaps, until the tour is new
+        size = self.n_cities
+        draws = self.rng.random((len(clones), DEDUP_ATTEMPTS, 2)).tolist()
+        for i, attempts in zip(clones.tolist(), draws):
+            tour = self.population[i]
+            h = int(hashes[i])
+            for u, v in attempts:
+                start = scaled_index(u, size)
+                end = scaled_index(v, size - 1)
+                start, end = sorted((start, end + (end >= start)))
+                if end - start >= size - 1:
+                    # Reversing the whole tour leaves the cycle unchanged, and its
+                    # two "removed" edges coincide, which would corrupt the hash
+                    continue
+                a, b =int(tour[start - 1]), int(tour[start])
+                c, e = int(tour[end]), int(tour[(end + 1) % size])
+                self.fitness[i] += inversion_delta(tour, self.distance_matrix, start, end)
+                tour[start:end + 1] = tour[start:end + 1][::-1]
+                h = update_hash(h, ((a, b), (c, e)), ((a, c), (b, e)))
+                if h not in seen:
+                    break
+            seen.add(h)
+            hashes[i] = h
+            self.evaluations += 1
+            if self.debug_delta:
+                self._check_distance(tour, self.fitness[i])
 
     def _evolve(self):
         """Executes one generation of evolution."""
-        new_population = []
-
-        # Elitism: Keep the best individual
-        if self.elitism:
-            new_population.append(self.population[0])
-
-        # Generate offspring
-        while len(new_population) < self.pop_size:
-            # Selection
-            p1 = tournament_selection(self.population)
-            p2 = tournament_selection(self.population)
-
-            # Crossover
-            if random.random() < self.crossover_rate:
-                # Operates on list of cities (genes)
-                child1_cities, child2_cities = ordered_crossover(p1.cities, p2.cities)
-                c1, c2 = Route(child1_cities), Route(child2_cities)
-            else:
-                c1, c2 = p1, p2
-
-            # Mutation
-            for child in [c1, c2]:
-                if len(new_population) < self.pop_size:
-                    if random.random() < self.mutation_rate:
-                        mutated_cities = inversion_mutation(child.cities)
-                        child = Route(mutated_cities)
-                    new_population.append(child)
-
-        self.population = new_population
-        # Ensure population is sorted after evolution step
-        self.population.sort(key=lambda x: x.distance)
-
-    def run(self, generations: int) -> Tuple[Route, List[float]]:
-        """
-        Runs the GA loop.
+        start_time = time.perf_counter()
+        ls_before = self.timings['local_search']
+        inst = self.instrumentation
+        if inst is not None:
+            inst.start()
+
+        self._replace()
+        if self.duplicates != 'allow' or self.fitness_cache is not None:
+            self._track_duplicates()
+        if inst is not None:
+            inst.lap('replacement')
+
+        # Memetic stage on the best individuals
+        if self.local_search is not None and self.ls_elites > 0:
+            ls_start = time.perf_counter()
+            improved = self._apply_local_search(self.population, self.fitness,
+                                                top_k(self.fitness, self.ls_elites))
+            self.timings['local_search'] += time.perf_counter() - ls_start
+            if inst is not None:
+                inst.lap('local_search')
+                inst.count('local_searches', improved)
+
+        self.generation += 1
+        ls_time = self.timings['local_search'] - ls_before
+        self.timings['evolution'] += time.perf_counter() - start_time - ls_time
+
+    def _reset_generation_counts(self):
+        """Starts the per-generation operator counters (fitness cache counters as a snapshot)."""
+        cache = self.fitness_cache
+        self._mutation_counts = {'attempted': 0, 'improving': 0, 'gain': 0.0}
+        self._cache_counts = (cache.hits, cache.hits + cache.misses) if cache is not None else (0, 0)
+
+    def _generation_stats(self, improvement: float, evaluations: int) -> Dict[str, float]:
+        """
+        Operator statistics of the generation just evolved: share of mutations
+        that shortened their tour, mean mutation gain, best-distance
+        improvement per evaluation spent, fitness cache hit rate and number of
+        distinct tours in the population (None unless clones are tracked).
+        """
+        counts = self._mutation_counts
+        attempted = counts['attempted']
+        cache = self.fitness_cache
+        hits, lookups = (cache.hits - self._cache_counts[0],
+                         cache.hits + cache.misses - self._cache_counts[1]) if cache is not None else (0, 0)
+        return {
+            'mutation_acceptance': counts['improving'] / attempted if attempted else 0.0,
+            'mutation_gain': counts['gain'] / attempted if attempted else 0.0,
+            'improvement_per_evaluation': improvement / evaluations if evaluations else 0.0,
+            'cache_hit_rate': hits / lookups if lookups else 0.0,
+            'unique_individuals': self.unique_individuals,
+        }
+
+    def run(self, generations: int, progress: bool = True,
+            callback: Optional[Callable[[int, float], None]] = None,
+            checkpoint_path: Optional[str] = None, checkpoint_every: int = 0,
+            time_limit: Optional[float] = None,
+            termination: Optional[Termination] = None) -> Tuple[Route, List[float]]:
+        """
+        Runs the GA loop for at most `generations` more generations.
+        time_limit (seconds) and termination (combined stopping criteria, with
+        optional restarts) can end it earlier; the reason is left in stop_reason.
+        callback(generation, best_distance) is called after every generation.
+        With checkpoint_path and checkpoint_every > 0 the full state is saved periodically
+        (and at the end), so the run can be resumed with restore_checkpoint.
         Returns: (best_route, distance_history)
         """
-        distance_history = []
-        
-        # Initial sort
-        self.population.sort(key=lambda x: x.distance)
-        initial_best = self.population[0]
-        distance_history.append(initial_best.distance)
+        distance_history = self.history
+
+        if not distance_history:
+            distance_history.append(float(self.fitness.min()))
+
+        if time_limit is not None:
+            criteria = [TimeLimit(time_limit)] + (termination.criteria if termination else [])
+            termination = Termination(criteria, termination.restarts, termination.restart_keep) \
+                if termination else Termination(criteria)
+        if termination is not None:
+            termination.start(self)
+        self.stop_reason = 'generations'
+        progress_bar = tqdm(range(generations), desc="Evolving", unit="gen", disable=not progress)
 
-        progress_bar = tqdm(range(generations), desc="Evolving", unit="gen")
-        
         for _ in progress_bar:
+            evaluations = self.evaluations
+            self._reset_generation_counts()
             self._evolve()
-            best_current = self.population[0]
-            distance_history.append(best_current.distance)
-            
+            best_distance = float(self.fitness.min())
+            self.stats_history.append(self._generation_stats(distance_history[-1] - best_distance,
+                                                             self.evaluations - evaluations))
+            distance_history.append(best_distance)
+
             # Update progress bar description with current best
-            progress_bar.set_postfix({"Best Dist": f"{best_current.distance:.2f}"})
+            if progress:
+                progress_bar.set_postfix({"Best Dist": f"{best_distance:.2f}"})
+            if callback is not None:
+                callback(self.generation, best_distance)
+            if self.instrumentation is not None:
+                self.instrumentation.end_generation(self)
+            if checkpoint_path and checkpoint_every > 0 and self.generation % checkpoint_every == 0:
+                save_checkpoint(self, checkpoint_path)
+            if termination is not None:
+                reason = termination.check(self)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
 
-        return self.population[0], distance_history
\ No newline at end of file
+        if checkpoint_path and checkpoint_every > 0:
+            save_checkpoint(self, checkpoint_path)
+        if self.instrumentation is not None:
+            self.instrumentation.end_run()
+        return self._get_best_route(), list(distance_history)
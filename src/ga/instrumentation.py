@@ -0,0 +1,150 @@
+import json
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional, TextIO
+
+from .tour_hash import tour_hashes
+
+# Phases of one GeneticAlgorithm._evolve call, in execution order
+PHASES = ('selection', 'crossover', 'evaluation', 'mutation', 'local_search', 'replacement')
+
+
+def edge_similarity(population: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Mean fraction of the reference tour's (undirected) edges present in each individual.
+    1.0 means the population has collapsed onto the reference.
+    """
+    n = population.shape[1]
+    succ = np.empty(n, dtype=population.dtype)
+    succ[reference] = np.roll(reference, -1)
+    nxt = np.roll(population, -1, axis=1)
+    shared = (succ[population] == nxt) | (succ[nxt] == population)
+    return float(shared.mean())
+
+
+def unique_individuals(population: np.ndarray) -> int:
+    """Number of distinct tours (rotations and reversals of a tour count as the same tour)."""
+    return len(np.unique(tour_hashes(population)))
+
+
+class Observer:
+    """
+    Base class for GeneticAlgorithm observers. Override the hooks you need.
+    """
+    def on_phase(self, phase: str, elapsed: float):
+        pass
+
+    def on_generation(self, event: Dict[str, Any]):
+        pass
+
+    def on_run_end(self, summary: Dict[str, Any]):
+        pass
+
+
+class JsonlEventWriter(Observer):
+    """
+    Writes one JSON object per generation (plus a summary at the end of each run)
+    to a JSON-lines file. The writer outlives individual runs, since
+    GeneticAlgorithm.run() may be called again (resume, reoptimize); the caller
+    closes it, explicitly or as a context manager.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[TextIO] = open(path, 'w', encoding='utf-8')
+
+    def on_generation(self, event: Dict[str, Any]):
+        self._file.write(json.dumps(event) + "\n")
+
+    def on_run_end(self, summary: Dict[str, Any]):
+        self._file.write(json.dumps({'event': 'run_end', **summary}) + "\n")
+        self._file.flush()
+
+    def __enter__(self) -> 'JsonlEventWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Instrumentation:
+    """
+    Low-overhead timers and counters for the evolution loop.
+
+    GeneticAlgorithm only creates one when observers are given; otherwise every
+    hook in the hot loop is skipped by a single `is None` test.
+    """
+    def __init__(self, observers: List[Observer], diversity_every: int = 1):
+        self.observers = list(observers)
+        self.diversity_every = max(1, diversity_every)
+        self.phase_totals: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counters: Dict[str, int] = {'evaluations': 0, 'crossovers': 0, 'mutations': 0, 'local_searches': 0}
+        self._phase_times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self._mark = time.perf_counter()
+
+    def start(self):
+        """Marks the beginning of a generation."""
+        self._phase_times = dict.fromkeys(PHASES, 0.0)
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Closes the current phase: time since the previous mark is charged to `phase`."""
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        self._mark = now
+        self._phase_times[phase] += elapsed
+        self.phase_totals[phase] += elapsed
+        for observer in self.observers:
+            observer.on_phase(phase, elapsed)
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def end_generation(self, ga) -> Dict[str, Any]:
+        """Builds the generation event and dispatches it to the observers."""
+        fitness = ga.fitness
+        event: Dict[str, Any] = {
+            'event': 'generation',
+            'generation': ga.generation,
+            'best': float(fitness.min()),
+            'mean': float(fitness.mean()),
+            'worst': float(fitness.max()),
+            'phases': dict(self._phase_times),
+            'counters': dict(self.counters),
+            'distance_cache': ga.distance_matrix.cache_info(),
+        }
+        if ga.fitness_cache is not None:
+            cache = ga.fitness_cache
+            event['fitness_cache'] = {'size': len(cache), 'hits': cache.hits, 'misses': cache.misses,
+                                      'hit_rate': cache.hit_rate}
+        if ga.stats_history:
+            event['operators'] = ga.stats_history[-1]
+        if ga.generation % self.diversity_every == 0:
+            best = ga.population[int(np.argmin(fitness))]
+            event['diversity'] = {
+                'unique': unique_individuals(ga.population),
+                'edge_similarity_to_best': edge_similarity(ga.population, best),
+                'fitness_std': float(fitness.std()),
+            }
+        for observer in self.observers:
+            observer.on_generation(event)
+        return event
+
+    def summary(self) -> Dict[str, Any]:
+        total = sum(self.phase_totals.values())
+        return {
+            'phase_totals': dict(self.phase_totals),
+            'phase_share': {p: (t / total if total else 0.0) for p, t in self.phase_totals.items()},
+            'counters': dict(self.counters),
+        }
+
+    def end_run(self) -> Dict[str, Any]:
+        summary = self.summary()
+        for observer in self.observers:
+            observer.on_run_end(summary)
+        return summary
@@ -0,0 +1,191 @@
+import time
+import multiprocessing as mp
+import numpy as np
+from multiprocessing import shared_memory
+from typing import List, Tuple, Optional, Dict, Any
+from tqdm import tqdm
+
+from ..tsp.city import City
+from ..tsp.route import Route
+from ..tsp.distance_matrix import DistanceMatrix
+from .genetic_algorithm import GeneticAlgorithm
+from .rng import RandomSource, make_rng, seed_sequence
+
+TOPOLOGIES = ('ring', 'full', 'random')
+
+
+def _island_worker(conn, shm_name: Optional[str], shape: Tuple[int, int], dtype: str,
+                   coords: np.ndarray, is_geo: bool, metric: str, ga_kwargs: Dict[str, Any],
+                   seed: np.random.SeedSequence):
+    """
+    Worker process owning one island.
+    Attaches to the shared distance matrix (no per-worker rebuild or pickling of
+    cities) and answers ('evolve', generations, immigrants) / ('best',) / ('stop',).
+    """
+    shm = None
+    matrix = None
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        matrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    # Without a shared matrix, rows are recomputed here with the parent's metric
+    distance_matrix = DistanceMatrix(coords, is_geo=is_geo, dtype=dtype, matrix=matrix, metric=metric)
+
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, seed=seed, **ga_kwargs)
+    conn.send(float(ga.fitness.min()))
+
+    try:
+        while True:
+            message = conn.recv()
+            command = message[0]
+            if command == 'evolve':
+                _, generations, migrants, immigrants = message
+                if immigrants is not None:
+                    ga.immigrate(*immigrants)
+                history = []
+                for _ in range(generations):
+                    ga._evolve()
+                    history.append(float(ga.fitness.min()))
+                conn.send((history, ga.emigrants(migrants)))
+            elif command == 'best':
+                conn.send(ga.emigrants(1))
+            else:
+                break
+    finally:
+        # Release our view before closing; the parent owns (and unlinks) the segment
+        del ga, distance_matrix, matrix
+        if shm is not None:
+            shm.close()
+        conn.close()
+
+
+class IslandModel:
+    """
+    Island-model GA: N independent GeneticAlgorithm populations evolving in
+    separate processes, exchanging their best individuals every
+    `migration_interval` generations along a migration topology
+    ('ring', 'full' or 'random'). The distance matrix is placed in shared
+    memory once and attached by every island.
+    Each island evolves its own stream spawned from `seed` (SeedSequence.spawn),
+    so a seeded run is repeatable regardless of process scheduling.
+    """
+    def __init__(self, cities: List[City], n_islands: int = 4, migration_interval: int = 50,
+                 migrants: int = 2, topology: str = 'ring',
+                 distance_matrix: Optional[DistanceMatrix] = None, seed: RandomSource = None, **ga_kwargs):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{topology}'. Options: {', '.join(TOPOLOGIES)}")
+        self.cities = cities
+        self.n_islands = n_islands
+        self.migration_interval = max(1, migration_interval)
+        self.migrants = migrants
+        self.topology = topology
+        self.ga_kwargs = ga_kwargs
+        self.seed_sequence = seed_sequence(seed)
+        # Topology draws (random migration sources) use the root stream itself
+        self.rng = make_rng(self.seed_sequence)
+        self.distance_matrix = distance_matrix or DistanceMatrix.from_cities(cities)
+
+    def _migration_sources(self, island: int) -> List[int]:
+        """Islands whose emigrants are sent to `island` under the configured topology."""
+        if self.n_islands < 2:
+            return []
+        if self.topology == 'ring':
+            return [(island - 1) % self.n_islands]
+        if self.topology == 'full':
+            return [i for i in range(self.n_islands) if i != island]
+        # random: one source island, redrawn at every migration
+        source = int(self.rng.integers(0, self.n_islands - 1))
+        return [source if source < island else source + 1]
+
+    def _select_immigrants(self, island: int, emigrants: List[Tuple[np.ndarray, np.ndarray]]):
+        sources = self._migration_sources(island)
+        if not sources or self.migrants <= 0:
+            return None
+        genes = np.concatenate([emigrants[s][0] for s in sources])
+        distances = np.concatenate([emigrants[s][1] for s in sources])
+        best = np.argsort(distances, kind='stable')[:self.migrants]
+        return genes[best], distances[best]
+
+    def run(self, generations: int, time_limit: Optional[float] = None) -> Tuple[Route, List[float], List[List[float]]]:
+        """
+        Runs all islands in parallel. time_limit (seconds) is checked between
+        migration epochs, so the run may overshoot it by up to one epoch.
+        Returns: (best_route, global_history, island_histories)
+        """
+        dm = self.distance_matrix
+        if dm.matrix is None and dm.metric == 'explicit':
+            raise ValueError("Explicit-metric instances need the full distance matrix to share with the islands")
+        shm = None
+        shm_name = None
+        shape = (dm.n, dm.n)
+        if dm.matrix is not None:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, dm.matrix.nbytes))
+            shared = np.ndarray(shape, dtype=dm.dtype, buffer=shm.buf)
+            shared[:] = dm.matrix
+            shm_name = shm.name
+            del shared
+
+        seeds = self.seed_sequence.spawn(self.n_islands)
+        connections = []
+        processes = []
+        try:
+            for island in range(self.n_islands):
+                parent_conn, child_conn = mp.Pipe()
+                process = mp.Process(
+                    target=_island_worker,
+                    args=(child_conn, shm_name, shape, dm.dtype.str, dm.coords, dm.is_geo, dm.metric,
+                          self.ga_kwargs, seeds[island]),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                processes.append(process)
+
+            island_histories = [[conn.recv()] for conn in connections]
+            immigrants = [None] * self.n_islands
+
+            progress_bar = tqdm(total=generations, desc="Evolving islands", unit="gen")
+            deadline = time.perf_counter() + time_limit if time_limit is not None else None
+            done = 0
+            while done < generations and (deadline is None or time.perf_counter() < deadline):
+                epoch = min(self.migration_interval, generations - done)
+                for island, conn in enumerate(connections):
+                    conn.send(('evolve', epoch, self.migrants, immigrants[island]))
+
+                emigrants = []
+                for island, conn in enumerate(connections):
+                    history, outgoing = conn.recv()
+                    island_histories[island].extend(history)
+                    emigrants.append(outgoing)
+
+                # Migration
+                immigrants = [self._select_immigrants(i, emigrants) for i in range(self.n_islands)]
+
+                done += epoch
+                progress_bar.update(epoch)
+                best_now = min(h[-1] for h in island_histories)
+                progress_bar.set_postfix({"Best Dist": f"{best_now:.2f}"})
+            progress_bar.close()
+
+            best_genes, best_distance = None, float('inf')
+            for conn in connections:
+                conn.send(('best',))
+                genes, distances = conn.recv()
+                if distances[0] < best_distance:
+                    best_genes, best_distance = genes[0], float(distances[0])
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(('stop',))
+                except (BrokenPipeError, OSError):
+                    pass
+                conn.close()
+            for process in processes:
+                process.join()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        global_history = np.min(np.array(island_histories), axis=0).tolist()
+        best_route = Route.from_indices(best_genes, dm, best_distance)
+        return best_route, global_history, island_histories
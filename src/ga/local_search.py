@@ -0,0 +1,224 @@
+import weakref
+import numpy as np
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from ..tsp.distance_matrix import DistanceMatrix
+from ..tsp.spatial_index import GridIndex, project_coordinates
+
+LOCAL_SEARCH_METHODS = ('2opt', 'oropt', 'both')
+
+# Minimum gain accepted as an improvement (guards against float noise loops)
+EPSILON = 1e-9
+
+
+def nearest_neighbors(distance_matrix: DistanceMatrix, k: int = 10) -> np.ndarray:
+    """
+    Builds the k-nearest-neighbor candidate lists of every city.
+    Returns an (n, k) array, each row sorted by increasing distance (self excluded).
+    Without a full matrix, coordinate instances use a grid index over the
+    (projected) coordinates instead of computing all n² distances.
+    """
+    n = len(distance_matrix)
+    k = max(1, min(k, n - 1))
+    if distance_matrix.matrix is None and distance_matrix.metric != 'explicit':
+        index = GridIndex(project_coordinates(distance_matrix.coords, distance_matrix.is_geo))
+        return np.array([index.k_nearest(i, k) for i in range(n)], dtype=np.int32).reshape(n, k)
+    neighbors = np.empty((n, k), dtype=np.int32)
+    block = DistanceMatrix.BLOCK_ROWS
+    for start in range(0, n, block):
+        rows = np.arange(start, min(start + block, n))
+        dist = np.array([distance_matrix.row(i) for i in rows], dtype=np.float64)
+        dist[np.arange(len(rows)), rows] = np.inf
+        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k] if k < n - 1 else np.argsort(dist, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(dist, nearest, axis=1), axis=1)
+        neighbors[rows] = np.take_along_axis(nearest, order, axis=1)
+    return neighbors
+
+
+# Candidate lists per distance matrix (and its version) and k, shared by the operators of a run
+_CANDIDATE_CACHE: "weakref.WeakKeyDictionary[DistanceMatrix, Tuple[int, Dict[int, np.ndarray]]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def candidate_lists(distance_matrix: DistanceMatrix, k: int = 10) -> np.ndarray:
+    """
+    nearest_neighbors(distance_matrix, k), computed once per matrix and reused
+    until the instance changes (stops added, removed or moved).
+    """
+    version, cached = _CANDIDATE_CACHE.get(distance_matrix, (None, None))
+    if version != distance_matrix.version:
+        cached = {}
+        _CANDIDATE_CACHE[distance_matrix] = (distance_matrix.version, cached)
+    if k not in cached:
+        cached[k] = nearest_neighbors(distance_matrix, k)
+    return cached[k]
+
+
+class LocalSearch:
+    """
+    Neighbor-list local search (2-opt and Or-opt) with don't-look bits.
+
+    Only moves that connect a city to one of its k nearest neighbors are
+    considered and the gains of all candidates of a city are evaluated in one
+    vectorized step, so a pass is near-linear instead of O(n²). Tours are
+    index arrays improved in place; improve() returns the length change.
+    """
+    def __init__(self, distance_matrix: DistanceMatrix, method: str = '2opt', neighbors: int = 10,
+                 candidate_lists: Optional[np.ndarray] = None):
+        if method not in LOCAL_SEARCH_METHODS:
+            raise ValueError(f"Unknown local search '{method}'. Options: {', '.join(LOCAL_SEARCH_METHODS)}")
+        self.distance_matrix = distance_matrix
+        self.method = method
+        self.neighbors = candidate_lists if candidate_lists is not None else nearest_neighbors(distance_matrix, neighbors)
+        # Distance to each candidate (ascending per row), used to prune hopeless moves early
+        rows = np.repeat(np.arange(len(self.neighbors)), self.neighbors.shape[1]).reshape(self.neighbors.shape)
+        self.neighbor_dist = self._d(rows, self.neighbors)
+        self._nearest_dist = self.neighbor_dist[:, 0].tolist()
+
+    def _d(self, u, v) -> np.ndarray:
+        """Pairwise distances d(u[i], v[i]) for index arrays."""
+        matrix = self.distance_matrix.matrix
+        if matrix is not None:
+            return matrix[u, v].astype(np.float64, copy=False)
+        return np.array([self.distance_matrix.distance(a, b) for a, b in zip(np.ravel(u), np.ravel(v))],
+                        dtype=np.float64).reshape(np.shape(u))
+
+    @staticmethod
+    def _reverse(tour: np.ndarray, pos: np.ndarray, i: int, j: int):
+        """Reverses the cyclic segment tour[i..j], choosing the shorter side."""
+        n = len(tour)
+        inner = (j - i) % n + 1
+        if 2 * inner > n:
+            # Reversing the complement gives the same cycle
+            i, j = (j + 1) % n, (i - 1) % n
+            inner = n - inner
+        if inner < 2:
+            return
+        if i <= j:
+            tour[i:j + 1] = tour[i:j + 1][::-1]
+            pos[tour[i:j + 1]] = np.arange(i, j + 1)
+        else:
+            idx = (i + np.arange(inner)) % n
+            tour[idx] = tour[idx[::-1]]
+            pos[tour[idx]] = idx
+
+    def two_opt(self, tour: np.ndarray) -> float:
+        """2-opt with neighbor lists and don't-look bits. Returns the length change."""
+        n = len(tour)
+        if n < 5:
+            return 0.0
+        pos = np.empty(n, dtype=np.intp)
+        pos[tour] = np.arange(n)
+        active = np.ones(n, dtype=bool)
+        queue = deque(tour.tolist())
+        total = 0.0
+
+        while queue:
+            a = queue.popleft()
+            active[a] = False
+            for step in (1, -1):
+                i = pos[a]
+                b = tour[(i + step) % n]
+                # Candidates are sorted by d(a,c): only those closer than b can yield a gain
+                d_ab = self.distance_matrix.distance(a, b)
+                if d_ab - self._nearest_dist[a] <= EPSILON:
+                    continue
+                g1 = d_ab - self.neighbor_dist[a]
+                m = int(np.count_nonzero(g1 > EPSILON))
+                if m == 0:
+                    continue
+                candidates = self.neighbors[a, :m]
+                d = tour[(pos[candidates] + step) % n]
+                # Replace (a,b),(c,d) by (a,c),(b,d)
+                gain = g1[:m] + self._d(candidates, d) - self._d(np.full(m, b), d)
+                gain[(candidates == b) | (d == a)] = -np.inf
+                best = int(np.argmax(gain))
+                if gain[best] <= EPSILON:
+                    continue
+
+                c, dd = int(candidates[best]), int(d[best])
+                if step == 1:
+                    self._reverse(tour, pos, (i + 1) % n, pos[c])
+                else:
+                    self._reverse(tour, pos, i, pos[dd])
+                total -= float(gain[best])
+                for city in (a, b, c, dd):
+                    if not active[city]:
+                        active[city] = True
+                        queue.append(city)
+                break
+        return total
+
+    def or_opt(self, tour: np.ndarray, max_segment: int = 3) -> float:
+        """Or-opt (segment relocation, both orientations) with neighbor lists. Returns the length change."""
+        n = len(tour)
+        if n < 5:
+            return 0.0
+        pos = np.empty(n, dtype=np.intp)
+        pos[tour] = np.arange(n)
+        active = np.ones(n, dtype=bool)
+        queue = deque(tour.tolist())
+        total = 0.0
+
+        while queue:
+            a = queue.popleft()
+            active[a] = False
+            for length in range(1, min(max_segment, n - 3) + 1):
+                i = pos[a]
+                segment = tour[(i + np.arange(length)) % n]
+                first, last = segment[0], segment[-1]
+                prev, nxt = tour[(i - 1) % n], tour[(i + length) % n]
+                distance = self.distance_matrix.distance
+                removal_gain = distance(prev, first) + distance(last, nxt) - distance(prev, nxt)
+                if removal_gain <= EPSILON or min(self._nearest_dist[first], self._nearest_dist[last]) >= removal_gain:
+                    continue
+
+                # Insert between c and its successor e, in either orientation;
+                # only neighbors closer than the removal gain are worth trying
+                c = np.concatenate((self.neighbors[first][self.neighbor_dist[first] < removal_gain],
+                                    self.neighbors[last][self.neighbor_dist[last] < removal_gain]))
+                if len(c) == 0:
+                    continue
+                e = tour[(pos[c] + 1) % n]
+                d_ce = self._d(c, e)
+                cost_fwd = self._d(c, np.full_like(c, first)) + self._d(np.full_like(e, last), e) - d_ce
+                cost_rev = self._d(c, np.full_like(c, last)) + self._d(np.full_like(e, first), e) - d_ce
+                cost = np.minimum(cost_fwd, cost_rev)
+                invalid = np.zeros(len(c), dtype=bool)
+                for city in segment:
+                    invalid |= (c == city) | (e == city)
+                cost[invalid] = np.inf
+                best = int(np.argmin(cost))
+                gain = removal_gain - float(cost[best])
+                if gain <= EPSILON:
+                    continue
+
+                target = int(c[best])
+                moved = segment if cost_fwd[best] <= cost_rev[best] else segment[::-1]
+                # Rebuild: rotate so the segment comes first, then splice it after the target
+                rest = np.roll(tour, -i)[length:]
+                k = (pos[target] - i) % n - length
+                tour[:] = np.concatenate((rest[:k + 1], moved, rest[k + 1:]))
+                pos[tour] = np.arange(n)
+                total -= gain
+                for city in (prev, nxt, target, int(e[best]), first, last):
+                    if not active[city]:
+                        active[city] = True
+                        queue.append(city)
+                break
+        return total
+
+    def improve(self, tour: np.ndarray) -> float:
+        """Improves the tour in place with the configured method. Returns the length change."""
+        if self.method == '2opt':
+            return self.two_opt(tour)
+        if self.method == 'oropt':
+            return self.or_opt(tour)
+
+        total = 0.0
+        while True:
+            change = self.two_opt(tour) + self.or_opt(tour)
+            total += change
+            if change > -EPSILON:
+                return total
@@ -1,7 +1,10 @@
-import random
-from typing import List, Any
+import numpy as np
+from typing import List, Any, Tuple, Set, Dict, Callable, Optional, Sequence
+from ..tsp.distance_matrix import DistanceMatrix
+from .local_search import candidate_lists
+from .rng import make_rng, scaled_index
 
-def swap_mutation(chromosome: List[Any]) -> List[Any]:
+def swap_mutation(chromosome: List[Any], rng: Optional[np.random.Generator] = None) -> List[Any]:
     """
     Performs Swap Mutation.
     Selects two genes at random and swaps their positions.
@@ -9,12 +12,12 @@ def swap_mutation(chromosome: List[Any]) -> List[Any]:
     mutated = chromosome[:]
     size = len(mutated)
     
-    idx1, idx2 = random.sample(range(size), 2)
+    idx1, idx2 = make_rng(rng).choice(size, size=2, replace=False).tolist()
     mutated[idx1], mutated[idx2] = mutated[idx2], mutated[idx1]
     
     return mutated
 
-def inversion_mutation(chromosome: List[Any]) -> List[Any]:
+def inversion_mutation(chromosome: List[Any], rng: Optional[np.random.Generator] = None) -> List[Any]:
     """
     Performs Inversion Mutation (2-opt).
     Selects a sub-sequence and reverses its order.
@@ -23,10 +26,203 @@ def inversion_mutation(chromosome: List[Any]) -> List[Any]:
     mutated = chromosome[:]
     size = len(mutated)
     
-    start, end = sorted(random.sample(range(size), 2))
+    start, end = sorted(make_rng(rng).choice(size, size=2, replace=False).tolist())
     
     # Reverse the slice [start:end+1]
     # Adding 1 to end because python slices are exclusive at the upper bound
     mutated[start:end+1] = mutated[start:end+1][::-1]
     
-    return mutated
\ No newline at end of file
+    return mutated
+
+# --- In-place operators with delta evaluation -----------------------------
+# These operate on a tour of city indices (np.ndarray), apply the move in place
+# and return the move descriptor plus the change in tour length, computed in
+# O(1) from the edges the move touches (symmetric TSP).
+# Randomness comes in as `draws`, MUTATION_DRAWS uniforms in [0, 1) that
+# GeneticAlgorithm draws for all mutants of a generation in one call; without
+# them a fresh generator is used.
+
+MUTATION_DRAWS = 4
+
+def _draws(draws: Optional[Sequence[float]]) -> Sequence[float]:
+    return make_rng().random(MUTATION_DRAWS).tolist() if draws is None else draws
+
+def _distinct_pair(draws: Sequence[float], size: int) -> Tuple[int, int]:
+    """Two distinct positions in [0, size) from the first two draws."""
+    i = scaled_index(draws[0], size)
+    j = scaled_index(draws[1], size - 1)
+    return i, j + (j >= i)
+
+def inversion_delta(tour: np.ndarray, distance_matrix: DistanceMatrix, start: int, end: int) -> float:
+    """
+    Length change of reversing tour[start:end+1]: only the two boundary edges change.
+    """
+    size = len(tour)
+    if end - start + 1 >= size:
+        # Reversing the whole cycle yields the same tour
+        return 0.0
+    d = distance_matrix.distance
+    a, b = tour[start - 1], tour[start]
+    c, e = tour[end], tour[(end + 1) % size]
+    return d(a, c) + d(b, e) - d(a, b) - d(c, e)
+
+def _edges_length(tour: np.ndarray, distance_matrix: DistanceMatrix, edges: Set[int]) -> float:
+    size = len(tour)
+    return sum(distance_matrix.distance(tour[k], tour[(k + 1) % size]) for k in edges)
+
+def inversion_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                             draws: Optional[Sequence[float]] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    Inversion (2-opt) move applied in place.
+    Returns (('inversion', start, end), delta).
+    """
+    start, end = sorted(_distinct_pair(_draws(draws), len(tour)))
+    delta = inversion_delta(tour, distance_matrix, start, end)
+    tour[start:end+1] = tour[start:end+1][::-1]
+    return ('inversion', start, end), delta
+
+def swap_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                        draws: Optional[Sequence[float]] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    Swap move applied in place; at most four edges change.
+    Returns (('swap', i, j), delta).
+    """
+    size = len(tour)
+    i, j = _distinct_pair(_draws(draws), size)
+    # Edges are identified by their starting position; adjacent swaps share edges
+    edges = {(i - 1) % size, i, (j - 1) % size, j}
+
+    before = _edges_length(tour, distance_matrix, edges)
+    tour[i], tour[j] = tour[j], tour[i]
+    after = _edges_length(tour, distance_matrix, edges)
+    return ('swap', i, j), after - before
+
+# --- Neighbor-restricted operators ------------------------------------------
+# The second endpoint of the move is drawn from the k-nearest-neighbor list of
+# the first city, so moves create short edges instead of random long-range ones.
+# `neighbors` is an (n, k) candidate list; by default the cached 10-NN lists.
+
+# Longest segment moved by or_opt_mutation_delta / inside a double bridge
+OR_OPT_SEGMENT = 3
+DOUBLE_BRIDGE_SEGMENT = 50
+
+def _position(tour: np.ndarray, city: int) -> int:
+    return int(np.flatnonzero(tour == city)[0])
+
+def _neighbor_of(tour: np.ndarray, distance_matrix: DistanceMatrix, draws: Optional[Sequence[float]],
+                 neighbors: Optional[np.ndarray]) -> Tuple[int, int]:
+    """Random position i and the position j of a random candidate neighbor of tour[i]."""
+    if neighbors is None:
+        neighbors = candidate_lists(distance_matrix)
+    draws = _draws(draws)
+    i = scaled_index(draws[0], len(tour))
+    candidates = neighbors[tour[i]]
+    return i, _position(tour, candidates[scaled_index(draws[1], len(candidates))])
+
+def neighbor_inversion_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                                      draws: Optional[Sequence[float]] = None,
+                                      neighbors: Optional[np.ndarray] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    2-opt move that makes a random city adjacent to one of its nearest neighbors
+    (reverses the segment between them), applied in place.
+    Returns (('neighbor_inversion', start, end), delta).
+    """
+    i, j = _neighbor_of(tour, distance_matrix, draws, neighbors)
+    start, end = (i + 1, j) if j > i else (j, i - 1)
+    if start >= end:
+        # Already adjacent
+        return ('neighbor_inversion', start, end), 0.0
+    delta = inversion_delta(tour, distance_matrix, start, end)
+    tour[start:end+1] = tour[start:end+1][::-1]
+    return ('neighbor_inversion', start, end), delta
+
+def neighbor_swap_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                                 draws: Optional[Sequence[float]] = None,
+                                 neighbors: Optional[np.ndarray] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    Swap that moves one of a random city's nearest neighbors right after it, in place.
+    Returns (('neighbor_swap', i, j), delta).
+    """
+    size = len(tour)
+    i, j = _neighbor_of(tour, distance_matrix, draws, neighbors)
+    i = (i + 1) % size
+    if i == j:
+        return ('neighbor_swap', i, j), 0.0
+    edges = {(i - 1) % size, i, (j - 1) % size, j}
+    before = _edges_length(tour, distance_matrix, edges)
+    tour[i], tour[j] = tour[j], tour[i]
+    after = _edges_length(tour, distance_matrix, edges)
+    return ('neighbor_swap', i, j), after - before
+
+def or_opt_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                          draws: Optional[Sequence[float]] = None,
+                          neighbors: Optional[np.ndarray] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    Or-opt move: a segment of 1-3 cities is reinserted next to a nearest
+    neighbor of its first city, in the cheaper orientation, in place.
+    Returns (('or_opt', start, length), delta).
+    """
+    size = len(tour)
+    if neighbors is None:
+        neighbors = candidate_lists(distance_matrix)
+    draws = _draws(draws)
+    length = 1 + scaled_index(draws[0], min(OR_OPT_SEGMENT, size - 3)) if size > 4 else 1
+    start = scaled_index(draws[1], size - length + 1)
+    segment = tour[start:start + length].copy()
+    first, last = segment[0], segment[-1]
+    outside = [c for c in neighbors[first].tolist() if c not in segment]
+    if not outside or size < 4:
+        return ('or_opt', start, length), 0.0
+    target = outside[scaled_index(draws[2], len(outside))]
+
+    d = distance_matrix.distance
+    prev, nxt = tour[start - 1], tour[(start + length) % size]
+    rest = np.concatenate((tour[:start], tour[start + length:]))
+    k = _position(rest, target)
+    after_target = rest[(k + 1) % len(rest)]
+    removed = d(prev, first) + d(last, nxt) - d(prev, nxt)
+    forward = d(target, first) + d(last, after_target) - d(target, after_target)
+    backward = d(target, last) + d(first, after_target) - d(target, after_target)
+    if backward < forward:
+        segment = segment[::-1]
+    tour[:] = np.concatenate((rest[:k + 1], segment, rest[k + 1:]))
+    return ('or_opt', start, length), min(forward, backward) - removed
+
+def double_bridge_mutation_delta(tour: np.ndarray, distance_matrix: DistanceMatrix,
+                                 draws: Optional[Sequence[float]] = None,
+                                 neighbors: Optional[np.ndarray] = None) -> Tuple[Tuple[str, int, int], float]:
+    """
+    Segment-restricted double bridge (A B C D -> A C B D, with B and C of at
+    most DOUBLE_BRIDGE_SEGMENT cities): a perturbation no sequence of 2-opt
+    moves undoes easily, applied in place. Returns (('double_bridge', i, k), delta).
+    """
+    size = len(tour)
+    draws = _draws(draws)
+    if size < 8:
+        return inversion_mutation_delta(tour, distance_matrix, draws)
+    max_len = min(DOUBLE_BRIDGE_SEGMENT, (size - 2) // 2)
+    len_b, len_c = 1 + scaled_index(draws[0], max_len), 1 + scaled_index(draws[1], max_len)
+    i = 1 + scaled_index(draws[2], size - 1 - len_b - len_c)
+    j, k = i + len_b, i + len_b + len_c
+
+    d = distance_matrix.distance
+    a_end, b_first, b_last = tour[i - 1], tour[i], tour[j - 1]
+    c_first, c_last, d_first = tour[j], tour[k - 1], tour[k]
+    removed = d(a_end, b_first) + d(b_last, c_first) + d(c_last, d_first)
+    added = d(a_end, c_first) + d(c_last, b_first) + d(b_last, d_first)
+    tour[i:k] = np.concatenate((tour[j:k], tour[i:j]))
+    return ('double_bridge', i, k), added - removed
+
+# Mutation operators available to GeneticAlgorithm (by name)
+# Common signature: (tour, distance_matrix, draws) -> (move, delta)
+DELTA_MUTATIONS: Dict[str, Callable[[np.ndarray, DistanceMatrix, Sequence[float]], Tuple[tuple, float]]] = {
+    'inversion': inversion_mutation_delta,
+    'swap': swap_mutation_delta,
+    'neighbor_inversion': neighbor_inversion_mutation_delta,
+    'neighbor_swap': neighbor_swap_mutation_delta,
+    'or_opt': or_opt_mutation_delta,
+    'double_bridge': double_bridge_mutation_delta,
+}
+
+# Operators that take the candidate lists (neighbors=...) built by GeneticAlgorithm
+NEIGHBOR_MUTATIONS = ('neighbor_inversion', 'neighbor_swap', 'or_opt')
\ No newline at end of file
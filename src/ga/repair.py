@@ -0,0 +1,53 @@
+import numpy as np
+from typing import Iterable
+
+from ..tsp.distance_matrix import DistanceMatrix
+
+
+def cheapest_insertion(tour: np.ndarray, cities: Iterable[int], distance_matrix: DistanceMatrix) -> np.ndarray:
+    """
+    Inserts each city at the position that increases the tour length the least.
+    The cost of every edge is evaluated in one vectorized step per inserted city.
+    """
+    tour = np.asarray(tour, dtype=np.int32)
+    for city in cities:
+        if len(tour) < 2:
+            tour = np.append(tour, np.int32(city))
+            continue
+        nxt = np.roll(tour, -1)
+        row = distance_matrix.row(city)
+        if distance_matrix.matrix is not None:
+            edge = distance_matrix.matrix[tour, nxt]
+        else:
+            edge = np.array([distance_matrix.distance(a, b) for a, b in zip(tour.tolist(), nxt.tolist())])
+        cost = row[tour] + row[nxt] - edge
+        position = int(np.argmin(cost)) + 1
+        tour = np.insert(tour, position, np.int32(city))
+    return tour
+
+def batch_cheapest_insertion(population: np.ndarray, cities: Iterable[int],
+                             distance_matrix: DistanceMatrix) -> np.ndarray:
+    """
+    cheapest_insertion applied to every row of a population matrix.
+    With a full matrix each city is inserted into all tours at once: one
+    (pop, n) cost gather, a row-wise argmin and a shifted gather that opens the slot.
+    """
+    population = np.asarray(population, dtype=np.int32)
+    cities = list(cities)
+    if distance_matrix.matrix is None or population.shape[1] < 2:
+        return np.array([cheapest_insertion(tour, cities, distance_matrix) for tour in population],
+                        dtype=np.int32).reshape(len(population), -1)
+    matrix = distance_matrix.matrix
+    rows = np.arange(len(population))
+    for city in cities:
+        nxt = np.roll(population, -1, axis=1)
+        row = matrix[city]
+        cost = row[population] + row[nxt] - matrix[population, nxt]
+        position = np.argmin(cost, axis=1) + 1
+        # Column j of the new tour takes old column j, or j - 1 past the slot
+        columns = np.arange(population.shape[1] + 1)
+        source = columns - (columns[None, :] >= position[:, None])
+        grown = np.take_along_axis(population, source, axis=1)
+        grown[rows, position] = city
+        population = grown
+    return population
@@ -0,0 +1,46 @@
+import numpy as np
+
+# Survivor strategies supported by GeneticAlgorithm
+#   generational    - elite_size best parents + (pop_size - elite_size) offspring
+#   steady_state    - offspring_size children replace the worst individuals
+#   mu_plus_lambda  - best pop_size of parents ∪ offspring
+#   mu_comma_lambda - best (pop_size - elite_size) offspring, plus the elites
+REPLACEMENT_STRATEGIES = ('generational', 'steady_state', 'mu_plus_lambda', 'mu_comma_lambda')
+
+
+def top_k(fitness: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k smallest distances, in ascending order.
+    Partial selection (argpartition) costs O(P + k log k) instead of a full sort.
+    """
+    size = len(fitness)
+    k = max(0, min(k, size))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < size:
+        idx = np.argpartition(fitness, k - 1)[:k]
+    else:
+        idx = np.arange(size)
+    return idx[np.argsort(fitness[idx], kind='stable')]
+
+
+def worst_k(fitness: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest distances (unordered)."""
+    size = len(fitness)
+    k = max(0, min(k, size))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < size:
+        return np.argpartition(fitness, size - k)[size - k:]
+    return np.arange(size)
+
+
+def default_offspring_size(strategy: str, pop_size: int, elite_size: int) -> int:
+    """Default number of children per generation (λ) for each strategy."""
+    if strategy == 'generational':
+        return pop_size - elite_size
+    if strategy == 'steady_state':
+        return max(1, pop_size // 10)
+    if strategy == 'mu_plus_lambda':
+        return pop_size
+    return 2 * pop_size
\ No newline at end of file
@@ -0,0 +1,36 @@
+import numpy as np
+from typing import List, Union
+
+# Anything that can seed a random stream: None (fresh OS entropy), an int,
+# a SeedSequence (e.g. spawned for a worker) or an existing Generator (shared as is)
+RandomSource = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def make_rng(seed: RandomSource = None) -> np.random.Generator:
+    """NumPy Generator for `seed`; an existing Generator is returned unchanged."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def seed_sequence(seed: RandomSource = None) -> np.random.SeedSequence:
+    """SeedSequence behind `seed` (the one a Generator was built from, if given one)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq
+    return np.random.SeedSequence(seed)
+
+
+def spawn(seed: RandomSource, n: int) -> List[np.random.SeedSequence]:
+    """
+    n independent child seeds (SeedSequence.spawn), one per parallel worker.
+    Children are picklable and non-overlapping, so parallel runs stay
+    uncorrelated and bit-for-bit repeatable for a fixed root seed.
+    """
+    return seed_sequence(seed).spawn(n)
+
+
+def scaled_index(u: float, n: int) -> int:
+    """Maps a uniform draw u in [0, 1) to an index in [0, n)."""
+    return min(int(u * n), n - 1)
@@ -0,0 +1,202 @@
+import numpy as np
+from typing import List, Dict, Callable, Optional
+
+from ..tsp.distance_matrix import DistanceMatrix
+from ..tsp.spatial_index import GridIndex, project_coordinates
+from .rng import RandomSource, make_rng
+
+SEEDING_METHODS = ('nearest_neighbor', 'greedy_edge', 'space_filling_curve', 'random_insertion')
+
+
+def _hilbert_keys(points: np.ndarray, order: int = 16) -> np.ndarray:
+    """Hilbert curve index of each point (vectorized xy -> d conversion)."""
+    side = (1 << order) - 1
+    lo = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - lo, 1e-12)
+    scaled = np.floor((points - lo) / span.max() * side).astype(np.int64)
+    x, y = scaled[:, 0].copy(), scaled[:, 1].copy()
+
+    d = np.zeros(len(points), dtype=np.int64)
+    s = 1 << (order - 1)
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant
+        flip = ~ry
+        swap_x = flip & rx
+        x = np.where(swap_x, side - x, x)
+        y = np.where(swap_x, side - y, y)
+        x, y = np.where(flip, y, x), np.where(flip, x, y)
+        s >>= 1
+    return d
+
+
+class PopulationSeeder:
+    """
+    Constructive heuristics for the initial population, built on a grid
+    spatial index over the (projected) city coordinates:
+    nearest neighbor, greedy edge, space-filling curve and randomized insertion.
+    Every tour is an index permutation compatible with GeneticAlgorithm.
+    """
+    def __init__(self, distance_matrix: DistanceMatrix, neighbors: int = 8, rng: RandomSource = None):
+        self.distance_matrix = distance_matrix
+        self.rng = make_rng(rng)
+        self.n = len(distance_matrix)
+        self.points = project_coordinates(distance_matrix.coords, distance_matrix.is_geo)
+        self.neighbors = neighbors
+        self._candidate_edges: Optional[np.ndarray] = None
+        self.methods: Dict[str, Callable[[], np.ndarray]] = {
+            'nearest_neighbor': self.nearest_neighbor_tour,
+            'greedy_edge': self.greedy_edge_tour,
+            'space_filling_curve': self.space_filling_curve_tour,
+            'random_insertion': self.random_insertion_tour,
+        }
+
+    def nearest_neighbor_tour(self, start: Optional[int] = None) -> np.ndarray:
+        """Nearest-neighbor tour from a (random) start city."""
+        index = GridIndex(self.points)
+        current = int(self.rng.integers(self.n)) if start is None else start
+        tour = [current]
+        index.remove(current)
+        while index.size:
+            current = index.nearest(current)
+            index.remove(current)
+            tour.append(current)
+        return np.array(tour, dtype=np.int32)
+
+    def _edges(self) -> np.ndarray:
+        """Candidate edges (i, j) from the k-nearest neighbors, sorted by length."""
+        if self._candidate_edges is None:
+            index = GridIndex(self.points)
+            k = min(self.neighbors, self.n - 1)
+            pairs = {(min(i, j), max(i, j)) for i in range(self.n) for j in index.k_nearest(i, k)}
+            edges = np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+            lengths = np.array([self.distance_matrix.distance(i, j) for i, j in edges])
+            self._candidate_edges = edges[np.argsort(lengths, kind='stable')]
+        return self._candidate_edges
+
+    def greedy_edge_tour(self) -> np.ndarray:
+        """Greedy edge matching over candidate edges; fragments joined by nearest free endpoint."""
+        n = self.n
+        if n < 3:
+            return np.arange(n, dtype=np.int32)
+        degree = [0] * n
+        parent = list(range(n))
+        adjacency: List[List[int]] = [[] for _ in range(n)]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def link(i: int, j: int):
+            adjacency[i].append(j)
+            adjacency[j].append(i)
+            degree[i] += 1
+            degree[j] += 1
+            parent[find(i)] = find(j)
+
+        for i, j in self._edges().tolist():
+            if degree[i] < 2 and degree[j] < 2 and find(i) != find(j):
+                link(i, j)
+
+        # Collect the path fragments (isolated cities are one-city fragments)
+        fragments: List[List[int]] = []
+        fragment_of = [-1] * n
+        for start in range(n):
+            if degree[start] < 2 and fragment_of[start] < 0:
+                path = [start]
+                prev, current = -1, start
+                while True:
+                    fragment_of[current] = len(fragments)
+                    nxt = [c for c in adjacency[current] if c != prev]
+                    if not nxt:
+                        break
+                    prev, current = current, nxt[0]
+                    path.append(current)
+                fragments.append(path)
+
+        # Join fragments nearest-neighbor style over their free endpoints
+        endpoints = GridIndex(self.points, populate=False)
+        for path in fragments[1:]:
+            endpoints.insert(path[0])
+            endpoints.insert(path[-1])
+        tour = list(fragments[0])
+        while endpoints.size:
+            j = endpoints.nearest(tour[-1])
+            path = fragments[fragment_of[j]]
+            endpoints.remove(path[0])
+            endpoints.remove(path[-1])
+            tour.extend(path if j == path[0] else reversed(path))
+        return np.array(tour, dtype=np.int32)
+
+    def space_filling_curve_tour(self) -> np.ndarray:
+        """Cities ordered along a Hilbert curve (O(n log n))."""
+        return np.argsort(_hilbert_keys(self.points), kind='stable').astype(np.int32)
+
+    def random_insertion_tour(self) -> np.ndarray:
+        """
+        Randomized insertion: cities arrive in random order and are linked next to
+        their nearest already-inserted city, on whichever side is cheaper.
+        """
+        n = self.n
+        order = self.rng.permutation(n).tolist()
+        if n < 3:
+            return np.array(order, dtype=np.int32)
+        d = self.distance_matrix.distance
+        succ = [-1] * n
+        pred = [-1] * n
+        a, b, c = order[:3]
+        succ[a], succ[b], succ[c] = b, c, a
+        pred[b], pred[c], pred[a] = a, b, c
+
+        inserted = GridIndex(self.points, populate=False)
+        for i in (a, b, c):
+            inserted.insert(i)
+        for city in order[3:]:
+            near = inserted.nearest(city)
+            after, before = succ[near], pred[near]
+            cost_after = d(near, city) + d(city, after) - d(near, after)
+            cost_before = d(before, city) + d(city, near) - d(before, near)
+            left = near if cost_after <= cost_before else before
+            right = succ[left]
+            succ[left], pred[city], succ[city], pred[right] = city, left, right, city
+            inserted.insert(city)
+
+        tour = [a]
+        while len(tour) < n:
+            tour.append(succ[tour[-1]])
+        return np.array(tour, dtype=np.int32)
+
+    def _perturb(self, tour: np.ndarray, moves: int) -> np.ndarray:
+        """Random segment reversals, to diversify copies of deterministic tours."""
+        tour = tour.copy()
+        size = len(tour)
+        first = self.rng.integers(0, size, moves)
+        second = (first + self.rng.integers(1, size, moves)) % size
+        for start, end in zip(np.minimum(first, second).tolist(), np.maximum(first, second).tolist()):
+            tour[start:end + 1] = tour[start:end + 1][::-1]
+        return tour
+
+    def seed(self, count: int, methods=SEEDING_METHODS, perturbation: int = 3) -> np.ndarray:
+        """
+        Produces `count` tours cycling through `methods`. Repeated deterministic
+        tours (greedy edge, space-filling curve) are perturbed so seeded
+        individuals stay diverse.
+        """
+        tours = np.empty((count, self.n), dtype=np.int32)
+        cache: Dict[str, np.ndarray] = {}
+        for i in range(count):
+            method = methods[i % len(methods)]
+            if method in ('greedy_edge', 'space_filling_curve'):
+                if method not in cache:
+                    cache[method] = self.methods[method]()
+                    tour = cache[method]
+                else:
+                    tour = self._perturb(cache[method], perturbation) if self.n > 3 else cache[method]
+            else:
+                tour = self.methods[method]()
+            tours[i] = tour
+        return tours
@@ -1,16 +1,19 @@
-import random
-from typing import List
+import numpy as np
+from typing import List, Optional
 from ..tsp.route import Route
+from .rng import make_rng
 
-def tournament_selection(population: List[Route], k: int = 3) -> Route:
+def tournament_selection(population: List[Route], k: int = 3,
+                         rng: Optional[np.random.Generator] = None) -> Route:
     """
     Selects the best individual from a random subset of size k.
     """
-    candidates = random.sample(population, k)
+    picks = make_rng(rng).choice(len(population), size=k, replace=False)
+    candidates = [population[i] for i in picks]
     # Returns the route with the smallest distance
     return min(candidates, key=lambda x: x.distance)
 
-def roulette_selection(population: List[Route]) -> Route:
+def roulette_selection(population: List[Route], rng: Optional[np.random.Generator] = None) -> Route:
     """
     Selects an individual based on fitness probability (Fitness = 1/Distance).
     """
@@ -18,7 +21,7 @@ def roulette_selection(population: List[Route]) -> Route:
     fitnesses = [1 / route.distance for route in population]
     total_fitness = sum(fitnesses)
     
-    pick = random.uniform(0, total_fitness)
+    pick = make_rng(rng).uniform(0, total_fitness)
     current = 0
     
     for route, fitness in zip(population, fitnesses):
@@ -26,4 +29,14 @@ def roulette_selection(population: List[Route]) -> Route:
         if current > pick:
             return route
             
-    return population[-1]
\ No newline at end of file
+    return population[-1]
+
+def batch_tournament_selection(fitness: np.ndarray, n: int, k: int = 3,
+                               rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draws n k-way tournaments at once (candidates sampled with replacement).
+    Returns the indices of the n winners.
+    """
+    candidates = make_rng(rng).integers(0, len(fitness), size=(n, k))
+    winners = np.argmin(fitness[candidates], axis=1)
+    return candidates[np.arange(n), winners]
\ No newline at end of file
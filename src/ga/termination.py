@@ -0,0 +1,138 @@
+import time
+import numpy as np
+from typing import List, Optional
+
+from .instrumentation import edge_similarity
+
+
+class Criterion:
+    """
+    Base class for stopping criteria, checked by GeneticAlgorithm.run after every
+    generation. check() returns True when the run should stop.
+    Restartable criteria (stagnation, diversity collapse) may trigger a restart instead.
+    """
+    name = 'criterion'
+    restartable = False
+
+    def start(self, ga):
+        pass
+
+    def check(self, ga) -> bool:
+        return False
+
+
+class TimeLimit(Criterion):
+    """Wall-clock budget in seconds, counted from the start of run()."""
+    name = 'time_limit'
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._deadline = 0.0
+
+    def start(self, ga):
+        self._deadline = time.perf_counter() + self.seconds
+
+    def check(self, ga) -> bool:
+        return time.perf_counter() >= self._deadline
+
+
+class MaxEvaluations(Criterion):
+    """Total number of fitness evaluations (including those before run())."""
+    name = 'max_evaluations'
+
+    def __init__(self, evaluations: int):
+        self.evaluations = evaluations
+
+    def check(self, ga) -> bool:
+        return ga.evaluations >= self.evaluations
+
+
+class Stagnation(Criterion):
+    """No relative improvement above `tolerance` of the best distance for `window` generations."""
+    name = 'stagnation'
+    restartable = True
+
+    def __init__(self, window: int, tolerance: float = 0.0):
+        self.window = window
+        self.tolerance = tolerance
+        self._best = float('inf')
+        self._last_improvement = 0
+
+    def start(self, ga):
+        self._best = float(ga.fitness.min())
+        self._last_improvement = ga.generation
+
+    def check(self, ga) -> bool:
+        best = float(ga.fitness.min())
+        if best < self._best * (1 - self.tolerance):
+            self._best = best
+            self._last_improvement = ga.generation
+        return ga.generation - self._last_improvement >= self.window
+
+
+class TargetDistance(Criterion):
+    """Best distance at or below a target (e.g. within a gap of the known optimum)."""
+    name = 'target'
+
+    def __init__(self, target: float):
+        self.target = target
+
+    @classmethod
+    def from_gap(cls, optimum: float, gap_pct: float) -> 'TargetDistance':
+        return cls(optimum * (1 + gap_pct / 100))
+
+    def check(self, ga) -> bool:
+        return float(ga.fitness.min()) <= self.target
+
+
+class DiversityCollapse(Criterion):
+    """
+    Mean edge similarity to the best individual at or above `threshold`
+    (1.0 = every individual is the best tour). Checked every `every` generations
+    since it costs O(pop_size * n_cities).
+    """
+    name = 'diversity_collapse'
+    restartable = True
+
+    def __init__(self, threshold: float = 0.95, every: int = 10):
+        self.threshold = threshold
+        self.every = max(1, every)
+
+    def check(self, ga) -> bool:
+        if ga.generation % self.every:
+            return False
+        best = ga.population[int(np.argmin(ga.fitness))]
+        return edge_similarity(ga.population, best) >= self.threshold
+
+
+class Termination:
+    """
+    Combination of stopping criteria: the run stops as soon as any criterion fires.
+    With restarts > 0, a restartable criterion (stagnation, diversity collapse)
+    instead restarts the population keeping the best `restart_keep` fraction,
+    up to `restarts` times.
+    """
+    def __init__(self, criteria: List[Criterion], restarts: int = 0, restart_keep: float = 0.1):
+        self.criteria = list(criteria)
+        self.restarts = restarts
+        self.restart_keep = restart_keep
+        self.restarts_done = 0
+
+    def start(self, ga):
+        for criterion in self.criteria:
+            criterion.start(ga)
+
+    def check(self, ga) -> Optional[str]:
+        """Returns the name of the criterion that stopped the run, or None to continue."""
+        for criterion in self.criteria:
+            if not criterion.check(ga):
+                continue
+            if criterion.restartable and self.restarts_done < self.restarts:
+                ga.restart(self.restart_keep)
+                self.restarts_done += 1
+                for restarted in self.criteria:
+                    if restarted.restartable:
+                        restarted.start(ga)
+                return None
+            return criterion.name
+        return None
@@ -0,0 +1,129 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Iterable, Tuple
+
+# --- Canonical tour hash ------------------------------------------------------
+# A tour is hashed as the wrapping sum (mod 2^64) of one 64-bit key per
+# undirected edge. The sum does not depend on where the tour starts or on its
+# direction, so every rotation/reversal of a cycle gets the same hash, and a
+# move that swaps a few edges updates it in O(1) (update_hash).
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_MASK = (1 << 64) - 1
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer (uint64 arithmetic wraps around)."""
+    x = x + _GOLDEN
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def edge_keys(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Key of each undirected edge (u[i], v[i]); symmetric in u and v."""
+    u = np.asarray(u, dtype=np.uint64)
+    v = np.asarray(v, dtype=np.uint64)
+    return _splitmix64((np.minimum(u, v) << np.uint64(32)) | np.maximum(u, v))
+
+
+def tour_hashes(tours: np.ndarray) -> np.ndarray:
+    """Canonical hash of every row of a population matrix (or of a single tour), as uint64."""
+    tours = np.atleast_2d(tours)
+    keys = edge_keys(tours, np.roll(tours, -1, axis=1))
+    return keys.sum(axis=1, dtype=np.uint64)
+
+
+def _edge_key(u: int, v: int) -> int:
+    """Scalar edge_keys on Python ints (no array overhead for single moves)."""
+    x = ((min(u, v) << 32) | max(u, v)) + 0x9E3779B97F4A7C15
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def update_hash(h: int, removed: Iterable[Tuple[int, int]], added: Iterable[Tuple[int, int]]) -> int:
+    """Hash of a tour after replacing the `removed` edges with the `added` ones."""
+    for u, v in removed:
+        h -= _edge_key(u, v)
+    for u, v in added:
+        h += _edge_key(u, v)
+    return h & _MASK
+
+
+# --- Fitness memo cache ---------------------------------------------------------
+
+class FitnessCache:
+    """
+    Bounded LRU map from canonical tour hash to tour length.
+    hits/misses count lookups since creation; hit_rate is their ratio.
+    """
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = max(1, capacity)
+        self._entries: 'OrderedDict[int, float]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(found mask, distances) for an array of hashes; found entries become most recent."""
+        found = np.zeros(len(hashes), dtype=bool)
+        values = np.empty(len(hashes), dtype=np.float64)
+        entries = self._entries
+        for i, h in enumerate(hashes.tolist()):
+            value = entries.get(h)
+            if value is not None:
+                entries.move_to_end(h)
+                found[i] = True
+                values[i] = value
+        hits = int(found.sum())
+        self.hits += hits
+        self.misses += len(hashes) - hits
+        return found, values
+
+    def store(self, hashes: np.ndarray, distances: np.ndarray):
+        entries = self._entries
+        for h, distance in zip(hashes.tolist(), distances.tolist()):
+            entries[h] = distance
+            entries.move_to_end(h)
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class CachedEvaluator:
+    """
+    Wraps a batch evaluator (population -> distances) with a FitnessCache:
+    tours already seen, and repeated rows within a batch, are not evaluated again.
+    `last_evaluated` is the number of tours actually evaluated by the last call.
+    """
+    def __init__(self, evaluator: Callable[[np.ndarray], np.ndarray], cache: FitnessCache):
+        self.evaluator = evaluator
+        self.cache = cache
+        self.last_evaluated = 0
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        population = np.atleast_2d(population)
+        hashes = tour_hashes(population)
+        found, distances = self.cache.lookup(hashes)
+        missing = np.flatnonzero(~found)
+        self.last_evaluated = 0
+        if len(missing):
+            # Clones inside the batch are evaluated once
+            unique, first, inverse = np.unique(hashes[missing], return_index=True, return_inverse=True)
+            evaluated = np.asarray(self.evaluator(population[missing[first]]), dtype=np.float64)
+            distances[missing] = evaluated[inverse]
+            self.cache.store(unique, evaluated)
+            self.last_evaluated = len(unique)
+        return distances
@@ -1,15 +1,27 @@
 import os
 import sys
+import time
 import argparse
-import matplotlib.pyplot as plt
 
 # Adiciona o diretório pai ao sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.ga.genetic_algorithm import GeneticAlgorithm, DUPLICATE_POLICIES
+from src.ga.island_model import IslandModel, TOPOLOGIES
+from src.ga.decomposition import ClusterSolver, PARTITION_METHODS
+from src.ga.mutation import DELTA_MUTATIONS
+from src.ga.crossover import CROSSOVERS
+from src.ga.local_search import LOCAL_SEARCH_METHODS
+from src.ga.instrumentation import JsonlEventWriter, Observer
+from src.ga.replacement import REPLACEMENT_STRATEGIES
+from src.ga.termination import (Termination, MaxEvaluations, Stagnation, TargetDistance,
+                                DiversityCollapse)
+from src.ga.checkpoint import load_checkpoint, restore_checkpoint
+from src.ga.rng import seed_sequence
+from src.tsp.route_io import read_route_manifest
+from src.tsp.changes import read_stop_changes
 from src.tsp.instance_loader import InstanceLoader
-from src.visualization.plot_route import plot_route
-from src.visualization.evolution_plot import plot_evolution
+from src.output.sinks import RunResult, OutputPipeline, PlotSink, ROUTE_EXPORTS, HISTORY_POINTS
 
 def main():
     """
@@ -21,7 +33,7 @@ def main():
     # --- CONFIGURAÇÕES PADRÃO ATUALIZADAS (Recomendação IA) ---
     # Dataset padrão alterado para o de logística
     parser.add_argument('--dataset', type=str, default='logistica_brasil.csv', 
-                        help='Nome do arquivo CSV dentro da pasta datasets/')
+                        help='Nome do arquivo CSV ou TSPLIB (.tsp) dentro da pasta datasets/')
     
     # Aumentado para 200 para garantir diversidade genética em mapas complexos
     parser.add_argument('--pop_size', type=int, default=200, 
@@ -34,13 +46,152 @@ def main():
     parser.add_argument('--mutation_rate', type=float, default=0.01, 
                         help='Taxa de mutação')
     
+    parser.add_argument('--mutation', type=str, default='inversion', choices=list(DELTA_MUTATIONS),
+                        help='Operador de mutação (inversion/swap aleatórios; neighbor_* e or_opt usam listas de vizinhos; double_bridge)')
+    
     parser.add_argument('--crossover_rate', type=float, default=0.9, 
                         help='Taxa de crossover')
+
+    parser.add_argument('--crossover', type=str, default='ox1', choices=list(CROSSOVERS),
+                        help='Operador de crossover (OX1, CX, PMX, ERX ou EAX por arestas)')
     
     parser.add_argument('--elitism', action='store_true', default=True, 
                         help='Ativar elitismo')
+
+    parser.add_argument('--elite_size', type=int, default=1,
+                        help='Quantidade de melhores indivíduos preservados a cada geração')
+
+    parser.add_argument('--replacement', type=str, default='generational', choices=REPLACEMENT_STRATEGIES,
+                        help='Estratégia de sobrevivência (geracional, steady-state, (μ+λ), (μ,λ))')
+
+    parser.add_argument('--offspring_size', type=int, default=None,
+                        help='Filhos por geração (λ); padrão depende da estratégia')
+
+    # Semeadura da população inicial com heurísticas construtivas
+    parser.add_argument('--seeding_ratio', type=float, default=0.1,
+                        help='Fração da população inicial gerada por heurísticas (vizinho mais próximo, arestas gulosas, curva de Hilbert, inserção)')
+
+    # Busca local (estágio memético)
+    parser.add_argument('--local_search', type=str, default='none', choices=('none',) + LOCAL_SEARCH_METHODS,
+                        help='Busca local aplicada à elite e a uma fração dos filhos')
+
+    parser.add_argument('--ls_rate', type=float, default=0.05,
+                        help='Fração dos filhos que passa pela busca local')
+
+    parser.add_argument('--neighbors', type=int, default=10,
+                        help='Tamanho das listas de vizinhos mais próximos (busca local)')
+
+    parser.add_argument('--fitness_cache', type=int, default=0,
+                        help='Capacidade do cache de distâncias por hash canônico da rota (0 = desativado)')
+
+    parser.add_argument('--duplicates', type=str, default='allow', choices=DUPLICATE_POLICIES,
+                        help='Clones na população: manter, mutar (2-opt) ou substituir por novos indivíduos')
+
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Semente do gerador aleatório; a mesma semente reproduz a execução (padrão: aleatória)')
+
+    # Instrumentação
+    parser.add_argument('--profile', action='store_true',
+                        help='Mede o tempo de cada fase da evolução e mostra o resumo')
+
+    parser.add_argument('--events', type=str, default=None,
+                        help='Arquivo JSON-lines com um evento por geração (métricas, fases, diversidade)')
+
+    # Modelo de ilhas: populações independentes em processos paralelos
+    parser.add_argument('--islands', type=int, default=1,
+                        help='Número de ilhas (1 = AG único, >1 = modelo de ilhas multiprocesso)')
+
+    parser.add_argument('--migration_interval', type=int, default=50,
+                        help='Gerações entre migrações (modelo de ilhas)')
+
+    parser.add_argument('--migrants', type=int, default=2,
+                        help='Indivíduos enviados por migração (modelo de ilhas)')
+
+    parser.add_argument('--topology', type=str, default='ring', choices=TOPOLOGIES,
+                        help='Topologia de migração (modelo de ilhas)')
+
+    # Decomposição em clusters para instâncias grandes (10k+ paradas)
+    parser.add_argument('--cluster_size', type=int, default=0,
+                        help='Resolve por clusters de ~N paradas (sub-rotas em paralelo, costuradas no fim); 0 = desativado')
+
+    parser.add_argument('--partition', type=str, default='kmeans', choices=PARTITION_METHODS,
+                        help='Particionamento das paradas em clusters (--cluster_size)')
+
+    parser.add_argument('--cluster_workers', type=int, default=None,
+                        help='Processos que resolvem os clusters (padrão: nº de CPUs)')
+
+    # Critérios de parada (combináveis: o primeiro que disparar encerra a execução)
+    parser.add_argument('--time_limit', type=float, default=None,
+                        help='Tempo máximo de execução em segundos')
+
+    parser.add_argument('--max_evaluations', type=int, default=None,
+                        help='Número máximo de avaliações de aptidão')
+
+    parser.add_argument('--stagnation', type=int, default=None,
+                        help='Encerra (ou reinicia) após N gerações sem melhora da melhor rota')
+
+    parser.add_argument('--target', type=float, default=None,
+                        help='Distância alvo: encerra ao alcançá-la')
+
+    parser.add_argument('--optimum', type=float, default=None,
+                        help='Ótimo conhecido da instância (usado com --target_gap)')
+
+    parser.add_argument('--target_gap', type=float, default=None,
+                        help='Encerra quando a melhor rota estiver a até X%% do ótimo (--optimum)')
+
+    parser.add_argument('--diversity_threshold', type=float, default=None,
+                        help='Encerra (ou reinicia) quando a similaridade de arestas com a melhor rota atinge o limite (0-1)')
+
+    parser.add_argument('--restarts', type=int, default=0,
+                        help='Reinícios permitidos por estagnação/colapso de diversidade')
+
+    parser.add_argument('--restart_keep', type=float, default=0.1,
+                        help='Fração da população mantida em cada reinício')
+
+    # Checkpoints e retomada
+    parser.add_argument('--checkpoint_every', type=int, default=0,
+                        help='Salva o estado completo do AG a cada N gerações (0 = desativado)')
+
+    parser.add_argument('--checkpoint_dir', type=str, default=None,
+                        help='Pasta do checkpoint (padrão: checkpoints/<dataset>)')
+
+    parser.add_argument('--resume', action='store_true',
+                        help='Retoma a execução a partir do checkpoint, se existir')
+
+    parser.add_argument('--warm_start', type=str, nargs='+', default=None,
+                        help='Manifestos de rota (routes/*.txt, .json ou .csv) usados para semear a população')
+
+    # Reotimização dinâmica: alterações de paradas aplicadas sobre a população final
+    parser.add_argument('--changes', type=str, default=None,
+                        help='Arquivo JSON/JSON-lines de alterações de paradas (add/remove/move) aplicadas após a execução')
+
+    parser.add_argument('--reopt_generations', type=int, default=200,
+                        help='Gerações de reotimização após as alterações (--changes)')
+
+    parser.add_argument('--reopt_time', type=float, default=None,
+                        help='Tempo máximo da reotimização em segundos (--changes)')
+
+    # Saídas
+    parser.add_argument('--exports', type=str, nargs='+', default=list(ROUTE_EXPORTS), choices=list(ROUTE_EXPORTS),
+                        help='Formatos da rota gravados em routes/ (txt = manifesto de carga)')
+
+    parser.add_argument('--plots', type=str, default='background', choices=('background', 'inline', 'none'),
+                        help="Gráficos em processo separado, no próprio processo ou 'none' (sem matplotlib)")
+
+    parser.add_argument('--history_points', type=int, default=HISTORY_POINTS,
+                        help='Pontos máximos da curva de convergência (0 = todas as gerações)')
     
     args = parser.parse_args()
+    if args.changes and (args.islands > 1 or args.cluster_size):
+        parser.error('--changes não é suportado com --islands > 1 ou --cluster_size')
+    if args.cluster_size and args.islands > 1:
+        parser.error('--cluster_size e --islands > 1 são modos exclusivos')
+    if (args.warm_start or args.resume or args.checkpoint_every) and (args.islands > 1 or args.cluster_size):
+        parser.error('--warm_start, --resume e --checkpoint_every não são suportados com --islands > 1 ou --cluster_size')
+    if args.islands > 1 and (args.max_evaluations is not None or args.stagnation is not None or args.target is not None
+                             or args.target_gap is not None or args.diversity_threshold is not None or args.restarts):
+        parser.error('--islands > 1 aceita só --time_limit como critério de parada '
+                     '(sem --max_evaluations, --stagnation, --target, --target_gap, --diversity_threshold ou --restarts)')
 
     # Diretórios
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -48,6 +199,9 @@ def main():
     results_dir = os.path.join(base_dir, 'results')
     routes_dir = os.path.join(base_dir, 'routes')
 
+    dataset_name = os.path.splitext(args.dataset)[0]
+    checkpoint_dir = args.checkpoint_dir or os.path.join(base_dir, 'checkpoints', dataset_name)
+
     os.makedirs(results_dir, exist_ok=True)
     os.makedirs(routes_dir, exist_ok=True)
 
@@ -63,7 +217,10 @@ def main():
     print(f"📂 Carregando malha logística: {args.dataset}...")
     loader = InstanceLoader(dataset_path)
     try:
-        cities = loader.load_cities()
+        instance = loader.load()
+        cities = instance.cities
+        # Por clusters, a instância completa só é consultada em blocos: sem matriz N×N
+        distance_matrix = instance.distance_matrix(max_memory_mb=0) if args.cluster_size else instance.distance_matrix()
         print(f"✅ {len(cities)} pontos de parada carregados.")
     except Exception as e:
         print(f"❌ Erro ao ler o dataset: {e}")
@@ -73,56 +230,169 @@ def main():
     print("\n⚙️  Parâmetros da IA:")
     print(f"   - População: {args.pop_size} indivíduos")
     print(f"   - Gerações: {args.generations} ciclos evolutivos")
-    
-    ga = GeneticAlgorithm(
-        cities=cities,
+    # Sem --seed, sorteia uma e a mostra, para que a execução possa ser repetida
+    seed = args.seed if args.seed is not None else seed_sequence().entropy
+    print(f"   - Semente: {seed}")
+
+    ga_params = dict(
+        distance_matrix=distance_matrix,
         pop_size=args.pop_size,
         mutation_rate=args.mutation_rate,
+        mutation=args.mutation,
         crossover_rate=args.crossover_rate,
-        elitism=args.elitism
+        crossover=args.crossover,
+        elitism=args.elitism,
+        elite_size=args.elite_size,
+        replacement=args.replacement,
+        offspring_size=args.offspring_size,
+        local_search=None if args.local_search == 'none' else args.local_search,
+        ls_rate=args.ls_rate,
+        neighbors=args.neighbors,
+        seeding_ratio=args.seeding_ratio,
+        fitness_cache=args.fitness_cache,
+        duplicates=args.duplicates,
+        seed=seed
     )
 
+    criteria = []
+    if args.max_evaluations is not None:
+        criteria.append(MaxEvaluations(args.max_evaluations))
+    if args.stagnation is not None:
+        criteria.append(Stagnation(args.stagnation))
+    if args.target is not None:
+        criteria.append(TargetDistance(args.target))
+    if args.target_gap is not None:
+        if args.optimum is None:
+            parser.error('--target_gap exige --optimum')
+        criteria.append(TargetDistance.from_gap(args.optimum, args.target_gap))
+    if args.diversity_threshold is not None:
+        criteria.append(DiversityCollapse(args.diversity_threshold))
+    termination = Termination(criteria, restarts=args.restarts, restart_keep=args.restart_keep) if criteria else None
+
     # 3. Execução
     print("\n🚀 Calculando melhor rota de entrega...")
-    best_route, history = ga.run(generations=args.generations)
+    if args.cluster_size:
+        if distance_matrix.metric == 'explicit':
+            print("❌ Erro: a decomposição em clusters exige coordenadas (instância EXPLICIT)")
+            return
+        cluster_params = {key: value for key, value in ga_params.items() if key not in ('distance_matrix', 'seed')}
+        solver = ClusterSolver(None, cluster_size=args.cluster_size, partition=args.partition,
+                               workers=args.cluster_workers, distance_matrix=distance_matrix, seed=seed,
+                               **cluster_params)
+        best_route, _ = solver.run(generations=args.generations, time_limit=args.time_limit, termination=termination)
+        history = []
+        sizes = [len(cluster) for cluster in solver.clusters]
+        print(f"   - Clusters: {len(sizes)} ({args.partition}, {min(sizes)}-{max(sizes)} paradas cada)")
+        print("\n⏱️  Tempo por fase:")
+        for phase, seconds in solver.timings.items():
+            print(f"   - {phase:<10} {seconds:8.3f}s")
+    elif args.islands > 1:
+        print(f"   - Ilhas: {args.islands} (migração a cada {args.migration_interval} gerações, topologia {args.topology})")
+        model = IslandModel(
+            cities=cities,
+            n_islands=args.islands,
+            migration_interval=args.migration_interval,
+            migrants=args.migrants,
+            topology=args.topology,
+            **ga_params
+        )
+        best_route, history, island_histories = model.run(generations=args.generations, time_limit=args.time_limit)
+        for i, island_history in enumerate(island_histories):
+            print(f"   Ilha {i + 1}: melhor distância {min(island_history):.2f}")
+    else:
+        observers = []
+        # O arquivo de eventos recebe a execução e a reotimização; é fechado só depois da última
+        events_writer = JsonlEventWriter(args.events) if args.events else None
+        if events_writer is not None:
+            observers.append(events_writer)
+        elif args.profile:
+            observers.append(Observer())
+        ga = GeneticAlgorithm(cities=cities, observers=observers, **ga_params)
+
+        if args.resume and os.path.exists(checkpoint_dir):
+            restore_checkpoint(ga, load_checkpoint(checkpoint_dir))
+            print(f"♻️  Retomando do checkpoint (geração {ga.generation}): {checkpoint_dir}")
+        elif args.warm_start:
+            index_of = {city.name: i for i, city in enumerate(cities)}
+            tours = []
+            for manifest in args.warm_start:
+                names = read_route_manifest(manifest)
+                # Paradas desconhecidas são ignoradas; as que faltam entram por inserção mais barata
+                tours.append([index_of[name] for name in dict.fromkeys(names) if name in index_of])
+                print(f"🔥 Warm start: {manifest} ({len(tours[-1])}/{len(cities)} paradas)")
+            ga.warm_start(tours)
+
+        remaining = max(0, args.generations - ga.generation)
+        checkpoint_path = checkpoint_dir if args.checkpoint_every > 0 else None
+        best_route, history = ga.run(generations=remaining, checkpoint_path=checkpoint_path,
+                                     checkpoint_every=args.checkpoint_every,
+                                     time_limit=args.time_limit, termination=termination)
+        if ga.stats_history:
+            window = ga.stats_history[-100:]
+            acceptance = sum(s['mutation_acceptance'] for s in window) / len(window)
+            per_eval = sum(s['improvement_per_evaluation'] for s in ga.stats_history) / len(ga.stats_history)
+            print(f"🧬 Mutação ({args.mutation}): {100 * acceptance:.1f}% de movimentos de melhora "
+                  f"(últimas {len(window)} gerações) | melhora média por avaliação: {per_eval:.4f}")
+        if ga.unique_individuals is not None:
+            print(f"🧬 Indivíduos distintos na última geração: {ga.unique_individuals}/{ga.pop_size} "
+                  f"| clones substituídos: {ga.duplicates_replaced}")
+        if ga.fitness_cache is not None:
+            print(f"🗃️  Cache de fitness: {100 * ga.fitness_cache.hit_rate:.1f}% de acertos "
+                  f"({ga.fitness_cache.hits} avaliações evitadas)")
+        print(f"⏹️  Parada: {ga.stop_reason} (geração {ga.generation}, {ga.evaluations} avaliações, "
+              f"{ga.restarts} reinícios)")
+        if checkpoint_path:
+            print(f"💾 Checkpoint salvo em: {checkpoint_path}")
+        if ga.instrumentation is not None:
+            summary = ga.instrumentation.summary()
+            print("\n⏱️  Tempo por fase:")
+            for phase, seconds in summary['phase_totals'].items():
+                print(f"   - {phase:<13} {seconds:8.3f}s ({100 * summary['phase_share'][phase]:5.1f}%)")
+            print(f"   Contadores: {summary['counters']}")
+        if args.changes:
+            changes = read_stop_changes(args.changes)
+            print(f"\n🔄 Aplicando {len(changes)} alterações de paradas: {args.changes}")
+            start = time.perf_counter()
+            previous = best_route.distance
+            best_route, history = ga.reoptimize(changes, generations=args.reopt_generations,
+                                                time_limit=args.reopt_time, progress=True)
+            print(f"⚡ Reotimizado em {time.perf_counter() - start:.2f}s: {len(ga.distance_matrix)} paradas, "
+                  f"{previous:.2f} -> {best_route.distance:.2f} km")
+        if events_writer is not None:
+            events_writer.close()
+            print(f"📈 Eventos por geração salvos em: {args.events}")
+        if ga.local_search is not None:
+            print(f"⏱️  Tempo em evolução: {ga.timings['evolution']:.2f}s | busca local: {ga.timings['local_search']:.2f}s")
 
     # 4. Resultados
     print("\n🏆 Otimização Concluída!")
     print(f"🚚 Distância Total Estimada: {best_route.distance:.2f} km")
 
-    # 5. Salvando Rota
-    dataset_name = os.path.splitext(args.dataset)[0]
-    solution_filename = os.path.join(routes_dir, f"{dataset_name}_route.txt")
-    
-    route_names = [city.name for city in best_route.cities]
-    route_names_closed = route_names + [route_names[0]]
-    
-    with open(solution_filename, 'w', encoding='utf-8') as f:
-        f.write(f"Malha Logística: {args.dataset}\n")
-        f.write(f"Distância Total: {best_route.distance:.2f} km\n")
-        f.write("-" * 30 + "\n")
-        f.write("SEQUÊNCIA DE ENTREGA SUGERIDA:\n")
-        for i, city_name in enumerate(route_names_closed):
-            f.write(f"{i+1}. {city_name}\n")
-    
-    print(f"📝 Manifesto de carga salvo em: {solution_filename}")
+    # 5. Saídas: manifestos da rota e gráficos (em segundo plano, se pedidos)
+    exports = [ROUTE_EXPORTS[fmt](routes_dir) for fmt in dict.fromkeys(args.exports)]
+    sinks = list(exports)
+    if args.plots != 'none':
+        sinks.append(PlotSink(results_dir, background=args.plots == 'background',
+                              history_points=args.history_points))
+    result = RunResult.from_route(dataset_name, args.dataset, best_route, history)
 
-    # Exibe prévia
-    print("\n🗺️  Resumo do Itinerário:")
-    print(f"   Início: {route_names_closed[0]}")
-    print(f"   Passando por: {', '.join(route_names_closed[1:4])}...")
-    print(f"   Fim: {route_names_closed[-1]}")
+    with OutputPipeline(sinks) as pipeline:
+        if args.plots != 'none':
+            print("\n📊 Gerando mapas e relatórios...")
+        pipeline.write(result)
+        for sink in exports:
+            for path in sink.files:
+                print(f"📝 Manifesto de carga salvo em: {path}")
 
-    # 6. Gráficos
-    print("\n📊 Gerando mapas e relatórios...")
-    
-    plot_route(best_route, filename=os.path.join(results_dir, f"{dataset_name}_map.png"), 
-               title=f"Rota Logística Otimizada - Total: {best_route.distance:.0f} km")
+        # Exibe prévia
+        route_names_closed = result.names + [result.names[0]]
+        print("\n🗺️  Resumo do Itinerário:")
+        print(f"   Início: {route_names_closed[0]}")
+        print(f"   Passando por: {', '.join(route_names_closed[1:4])}...")
+        print(f"   Fim: {route_names_closed[-1]}")
 
-    plot_evolution(history, filename=os.path.join(results_dir, f"{dataset_name}_convergence.png"), 
-                   title=f"Curva de Aprendizado da IA ({dataset_name})")
-    
-    print(f"✅ Mapas salvos na pasta 'results/'.")
+    if args.plots != 'none':
+        print(f"✅ Mapas salvos na pasta 'results/'.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
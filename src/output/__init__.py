@@ -0,0 +1,22 @@
+# src/output/__init__.py
+
+"""
+Pacote output.
+Pipeline de saída de uma execução: manifestos de rota (txt/json/csv) e gráficos,
+estes gerados sob demanda num processo separado (matplotlib só é importado lá).
+"""
+
+from .sinks import (RunResult, OutputSink, ManifestSink, JsonRouteSink, CsvRouteSink, PlotSink,
+                    OutputPipeline, ROUTE_EXPORTS, render_plots)
+
+__all__ = [
+    'RunResult',
+    'OutputSink',
+    'ManifestSink',
+    'JsonRouteSink',
+    'CsvRouteSink',
+    'PlotSink',
+    'OutputPipeline',
+    'ROUTE_EXPORTS',
+    'render_plots'
+]
@@ -0,0 +1,167 @@
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Type
+import numpy as np
+
+from ..tsp.route import Route
+from ..tsp.route_io import write_route_manifest, write_route_json, write_route_csv
+
+# Pontos máximos do gráfico de convergência (históricos longos são reduzidos)
+HISTORY_POINTS = 2000
+
+
+@dataclass
+class RunResult:
+    """
+    Resultado de uma execução entregue aos sinks, só com arrays e tipos simples
+    (pode ser enviado a outro processo sem os objetos City/DistanceMatrix).
+    """
+    name: str                 # prefixo dos arquivos (ex.: nome do dataset)
+    dataset: str              # arquivo de origem
+    names: List[str]          # paradas na ordem de visita
+    coords: np.ndarray        # (n, 2) na ordem de visita
+    distance: float
+    history: List[float] = field(default_factory=list)
+    is_geo: bool = False
+
+    @classmethod
+    def from_route(cls, name: str, dataset: str, route: Route, history: Sequence[float]) -> 'RunResult':
+        from ..visualization.plot_route import route_arrays
+        coords, names = route_arrays(route)
+        is_geo = bool(route.cities[0].is_geo) if len(route) else False
+        return cls(name=name, dataset=dataset, names=names, coords=coords,
+                   distance=float(route.distance), history=list(history), is_geo=is_geo)
+
+
+class OutputSink:
+    """Destino de saída de uma execução. write() recebe o resultado; close() conclui pendências."""
+    def __init__(self):
+        self.files: List[str] = []
+
+    def write(self, result: RunResult):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ManifestSink(OutputSink):
+    """Manifesto de carga em texto (<nome>_route.txt)."""
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+
+    def write(self, result: RunResult):
+        path = os.path.join(self.directory, f"{result.name}_route.txt")
+        write_route_manifest(path, result.dataset, result.names, result.distance)
+        self.files.append(path)
+
+
+class JsonRouteSink(ManifestSink):
+    """Rota em JSON (<nome>_route.json), com coordenadas de cada parada."""
+    def write(self, result: RunResult):
+        path = os.path.join(self.directory, f"{result.name}_route.json")
+        write_route_json(path, result.dataset, result.names, result.coords, result.distance, result.is_geo)
+        self.files.append(path)
+
+
+class CsvRouteSink(ManifestSink):
+    """Rota em CSV (<nome>_route.csv), na ordem de visita."""
+    def write(self, result: RunResult):
+        path = os.path.join(self.directory, f"{result.name}_route.csv")
+        write_route_csv(path, result.names, result.coords, result.is_geo)
+        self.files.append(path)
+
+
+# Exportações de rota disponíveis (por formato)
+ROUTE_EXPORTS: Dict[str, Type[ManifestSink]] = {
+    'txt': ManifestSink,
+    'json': JsonRouteSink,
+    'csv': CsvRouteSink,
+}
+
+
+def render_plots(result: RunResult, directory: str, history_points: int = HISTORY_POINTS) -> List[str]:
+    """Gera o mapa da rota e a curva de convergência (executado no processo de plotagem)."""
+    import matplotlib
+    # Sem janela: os gráficos só vão para arquivo
+    matplotlib.use('Agg')
+    from ..visualization.plot_route import plot_tour
+    from ..visualization.evolution_plot import plot_evolution
+
+    map_path = os.path.join(directory, f"{result.name}_map.png")
+    plot_tour(result.coords, result.names, filename=map_path,
+              title=f"Rota Logística Otimizada - Total: {result.distance:.0f} km")
+    files = [map_path]
+    if result.history:
+        convergence_path = os.path.join(directory, f"{result.name}_convergence.png")
+        plot_evolution(result.history, filename=convergence_path,
+                       title=f"Curva de Aprendizado da IA ({result.name})", max_points=history_points)
+        files.append(convergence_path)
+    return files
+
+
+class PlotSink(OutputSink):
+    """
+    Mapa da rota e curva de convergência em PNG.
+    Com background=True os gráficos são gerados num processo separado (o
+    chamador segue sem esperar o matplotlib); close() aguarda os pendentes.
+    """
+    def __init__(self, directory: str, background: bool = True, history_points: int = HISTORY_POINTS):
+        super().__init__()
+        self.directory = directory
+        self.background = background
+        self.history_points = history_points
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def write(self, result: RunResult):
+        if not self.background:
+            self.files.extend(render_plots(result, self.directory, self.history_points))
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        self._pending.append(self._executor.submit(render_plots, result, self.directory, self.history_points))
+
+    def close(self):
+        try:
+            for future in self._pending:
+                try:
+                    self.files.extend(future.result())
+                except Exception as e:
+                    print(f"⚠️  Falha ao gerar gráficos: {e}", file=sys.stderr)
+        finally:
+            self._pending = []
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+class OutputPipeline:
+    """
+    Encadeia os sinks de saída: cada resultado passa por todos, na ordem.
+    Usado como context manager, fecha os sinks (aguardando gráficos em segundo plano) na saída.
+    """
+    def __init__(self, sinks: Sequence[OutputSink]):
+        self.sinks = list(sinks)
+
+    def write(self, result: RunResult):
+        for sink in self.sinks:
+            sink.write(result)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    @property
+    def files(self) -> List[str]:
+        return [path for sink in self.sinks for path in sink.files]
+
+    def __enter__(self) -> 'OutputPipeline':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,69 @@
+import os
+import sys
+import signal
+import argparse
+
+# Adiciona o diretório pai ao sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ga.mutation import DELTA_MUTATIONS
+from src.ga.crossover import CROSSOVERS
+from src.ga.local_search import LOCAL_SEARCH_METHODS
+from src.service.daemon import SolverDaemon, DEFAULT_SOCKET, STREAM_INTERVAL
+
+
+def main():
+    parser = argparse.ArgumentParser(description='evoTSP - solver residente (socket Unix)')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET, help='Caminho do socket Unix')
+    parser.add_argument('--workers', type=int, default=None, help='Processos no pool (padrão: nº de CPUs)')
+    parser.add_argument('--cache_mb', type=float, default=1024.0,
+                        help='Memória máxima do cache de instâncias e matrizes (MB)')
+    parser.add_argument('--matrix_mb', type=float, default=512.0,
+                        help='Maior matriz de distâncias mantida completa; acima disso, linhas sob demanda (MB)')
+    parser.add_argument('--datasets_dir', type=str, default=None,
+                        help='Pasta dos datasets referidos pelo nome (padrão: datasets/)')
+    parser.add_argument('--time_limit', type=float, default=1.0, help='Tempo padrão por requisição (s)')
+    parser.add_argument('--max_time_limit', type=float, default=60.0, help='Tempo máximo aceito por requisição (s)')
+    parser.add_argument('--stream_interval', type=float, default=STREAM_INTERVAL,
+                        help='Intervalo mínimo entre rotas parciais enviadas (s)')
+    # Parâmetros padrão do AG (cada requisição pode sobrescrever em "params")
+    parser.add_argument('--pop_size', type=int, default=100, help='Tamanho da população')
+    parser.add_argument('--mutation', type=str, default='or_opt', choices=list(DELTA_MUTATIONS),
+                        help='Operador de mutação')
+    parser.add_argument('--crossover', type=str, default='ox1', choices=list(CROSSOVERS),
+                        help='Operador de crossover')
+    parser.add_argument('--local_search', type=str, default='2opt', choices=('none',) + LOCAL_SEARCH_METHODS,
+                        help='Busca local aplicada à elite e a uma fração dos filhos')
+    parser.add_argument('--seeding_ratio', type=float, default=0.1,
+                        help='Fração da população inicial gerada por heurísticas')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ga_params = dict(
+        pop_size=args.pop_size,
+        mutation=args.mutation,
+        crossover=args.crossover,
+        local_search=None if args.local_search == 'none' else args.local_search,
+        seeding_ratio=args.seeding_ratio,
+    )
+    solver = SolverDaemon(args.socket, workers=args.workers, cache_mb=args.cache_mb, matrix_mb=args.matrix_mb,
+                          datasets_dir=args.datasets_dir or os.path.join(base_dir, 'datasets'),
+                          ga_params=ga_params, default_time_limit=args.time_limit,
+                          max_time_limit=args.max_time_limit, stream_interval=args.stream_interval)
+
+    signal.signal(signal.SIGTERM, lambda *_: solver.shutdown())
+    signal.signal(signal.SIGINT, lambda *_: solver.shutdown())
+    solver.start()
+    print(f"🛰️  evoTSP ouvindo em {args.socket} ({solver.workers} workers, cache de {args.cache_mb:.0f} MB)",
+          file=sys.stderr, flush=True)
+    try:
+        solver.serve_forever()
+    finally:
+        solver.close()
+        stats = solver.stats()
+        print(f"✅ Encerrado: {stats['requests']} requisições, {stats['errors']} com erro, "
+              f"{100 * stats['cache']['hit_rate']:.1f}% de acertos no cache", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
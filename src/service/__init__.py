@@ -0,0 +1,21 @@
+# src/service/__init__.py
+
+"""
+Pacote service.
+Solver residente (daemon) num socket Unix: cache LRU de instâncias e matrizes,
+pool de processos e envio das melhores rotas parciais durante a execução.
+"""
+
+from .instance_cache import InstanceCache, CachedInstance
+from .daemon import SolverDaemon, Cancelled, DEFAULT_SOCKET, REQUEST_PARAMS
+from .client import SolverClient
+
+__all__ = [
+    'InstanceCache',
+    'CachedInstance',
+    'SolverDaemon',
+    'Cancelled',
+    'DEFAULT_SOCKET',
+    'REQUEST_PARAMS',
+    'SolverClient'
+]
@@ -0,0 +1,66 @@
+import json
+import socket
+from typing import Any, Dict, Iterator, Optional
+
+from .daemon import DEFAULT_SOCKET
+
+# Eventos que encerram uma requisição de solve
+FINAL_EVENTS = ('done', 'error')
+
+
+class SolverClient:
+    """
+    Cliente do SolverDaemon. solve() devolve os eventos da requisição à medida
+    que chegam ('accepted', 'improved'..., 'done'); interromper a iteração
+    (break ou close()) cancela a requisição no daemon.
+    """
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+    @staticmethod
+    def _send(sock: socket.socket, message: Dict[str, Any]):
+        sock.sendall((json.dumps(message) + "\n").encode('utf-8'))
+
+    def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Operação de resposta única ('stats', 'ping')."""
+        with self._connect() as sock:
+            self._send(sock, message)
+            with sock.makefile('r', encoding='utf-8') as reader:
+                return json.loads(reader.readline())
+
+    def stats(self) -> Dict[str, Any]:
+        return self.request({'op': 'stats'})
+
+    def solve(self, dataset: str, time_limit: Optional[float] = None, **options) -> Iterator[Dict[str, Any]]:
+        """
+        Envia uma requisição de solve e devolve seus eventos. options: generations,
+        seed, params (parâmetros do AG) e routes (False = rotas só no 'done').
+        """
+        message = dict(options, op='solve', dataset=dataset)
+        if time_limit is not None:
+            message['time_limit'] = time_limit
+        sock = self._connect()
+        finished = False
+        try:
+            self._send(sock, message)
+            with sock.makefile('r', encoding='utf-8') as reader:
+                for line in reader:
+                    event = json.loads(line)
+                    finished = event['event'] in FINAL_EVENTS
+                    yield event
+                    if finished:
+                        return
+        finally:
+            if not finished:
+                try:
+                    self._send(sock, {'op': 'cancel'})
+                except OSError:
+                    pass
+            sock.close()
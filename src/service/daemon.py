@@ -0,0 +1,418 @@
+import os
+import json
+import time
+import queue
+import select
+import socket
+import itertools
+import threading
+import socketserver
+import multiprocessing as mp
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from ..tsp.distance_matrix import DistanceMatrix
+from ..tsp.instance_loader import LazyCities
+from ..ga.genetic_algorithm import GeneticAlgorithm
+from ..ga.termination import Criterion, Termination
+from ..ga.rng import seed_sequence
+from .instance_cache import InstanceCache, CachedInstance
+
+DEFAULT_SOCKET = '/tmp/evotsp.sock'
+# Intervalo mínimo (s) entre duas rotas parciais enviadas para a mesma requisição
+STREAM_INTERVAL = 0.05
+# Gerações máximas quando a requisição só define o tempo
+MAX_GENERATIONS = 1_000_000
+# Folga (s) além do time_limit antes de dar como travado o worker de uma requisição
+WORKER_GRACE = 60.0
+
+# Parâmetros do AG que uma requisição pode definir
+REQUEST_PARAMS = ('pop_size', 'mutation_rate', 'crossover_rate', 'elitism', 'mutation', 'crossover',
+                  'local_search', 'ls_rate', 'ls_elites', 'neighbors', 'seeding_ratio', 'elite_size',
+                  'replacement', 'offspring_size', 'fitness_cache', 'duplicates')
+
+
+class Cancelled(Criterion):
+    """Encerra a execução quando o daemon marca a requisição como cancelada (flag do worker)."""
+    name = 'cancelled'
+
+    def __init__(self, flags, slot: int, request_id: int):
+        self.flags = flags
+        self.slot = slot
+        self.request_id = request_id
+
+    def check(self, ga) -> bool:
+        return self.flags[self.slot] == self.request_id
+
+
+def _run_task(task: Dict[str, Any], shm: Optional[shared_memory.SharedMemory], slot: int,
+              events, cancel_flags, stream_interval: float):
+    """Resolve uma requisição no worker, enviando cada melhora (no máximo uma por stream_interval)."""
+    rid = task['id']
+    spec = task['instance']
+    cities = LazyCities(spec['names'], spec['coords'], spec['is_geo'])
+    if shm is not None:
+        matrix = np.ndarray(spec['shape'], dtype=spec['dtype'], buffer=shm.buf)
+        distance_matrix = DistanceMatrix.from_cities(cities, dtype=spec['dtype'], matrix=matrix, metric=spec['metric'])
+    else:
+        distance_matrix = DistanceMatrix.from_cities(cities, metric=spec['metric'], max_memory_mb=0)
+
+    start = time.perf_counter()
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, seed=task['seed'], **task['params'])
+    last = {'distance': float('inf'), 'sent': float('-inf')}
+
+    def report(generation: int, distance: float):
+        now = time.perf_counter()
+        # Melhoras abaixo do ruído de ponto flutuante não geram evento
+        if distance < last['distance'] * (1 - 1e-9) and now - last['sent'] >= stream_interval:
+            best = int(np.argmin(ga.fitness))
+            events.put((rid, 'improved', {'generation': generation, 'distance': distance,
+                                          'tour': ga.population[best].copy()}))
+            last.update(distance=distance, sent=now)
+
+    # A população inicial (com as heurísticas de semeadura) já é a primeira resposta
+    report(0, float(ga.fitness.min()))
+    route, _ = ga.run(task['generations'], progress=False, callback=report, time_limit=task['time_limit'],
+                      termination=Termination([Cancelled(cancel_flags, slot, rid)]))
+    events.put((rid, 'done', {'generation': ga.generation, 'distance': route.distance, 'tour': route.indices,
+                              'evaluations': ga.evaluations, 'stop_reason': ga.stop_reason,
+                              'solve_s': time.perf_counter() - start}))
+
+
+def _solver_worker(slot: int, tasks, events, cancel_flags, stream_interval: float):
+    """
+    Processo do pool: pega requisições da fila comum, anexa a matriz em memória
+    compartilhada (sem copiar) e devolve os eventos pela fila de eventos.
+    """
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        events.put((task['id'], 'started', {'slot': slot}))
+        shm = None
+        try:
+            if task['instance']['shm_name'] is not None:
+                shm = shared_memory.SharedMemory(name=task['instance']['shm_name'])
+            _run_task(task, shm, slot, events, cancel_flags, stream_interval)
+        except Exception as e:
+            events.put((task['id'], 'error', {'error': str(e)}))
+        finally:
+            # As views da matriz morreram com _run_task; o daemon é dono (e remove) o segmento
+            if shm is not None:
+                shm.close()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Uma conexão: requisições JSON (uma por linha), respondidas com eventos JSON por linha."""
+    def handle(self):
+        solver = self.server.solver
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                self._send({'event': 'error', 'error': f"JSON inválido: {e}"})
+                continue
+            op = request.get('op', 'solve')
+            if op == 'solve':
+                if not solver.handle_solve(request, self):
+                    break
+            elif op == 'stats':
+                self._send(dict(solver.stats(), event='stats'))
+            elif op == 'ping':
+                self._send({'event': 'pong'})
+            elif op != 'cancel':
+                self._send({'event': 'error', 'error': f"Operação desconhecida: {op}"})
+
+    def _send(self, message: Dict[str, Any]) -> bool:
+        """Envia um evento; False se o cliente já fechou a conexão."""
+        try:
+            self.wfile.write((json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8'))
+            self.wfile.flush()
+            return True
+        except (BrokenPipeError, ConnectionResetError):
+            return False
+
+    def _client_stopped(self) -> bool:
+        """True se o cliente pediu cancelamento ou fechou a conexão (verificação sem bloquear)."""
+        readable, _, _ = select.select([self.connection], [], [], 0)
+        if not readable:
+            return False
+        try:
+            line = self.rfile.readline()
+        except (ConnectionResetError, OSError):
+            return True
+        if not line:
+            return True
+        try:
+            return json.loads(line).get('op') == 'cancel'
+        except ValueError:
+            return False
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class SolverDaemon:
+    """
+    Solver residente: escuta num socket Unix, mantém instâncias e matrizes de
+    distâncias num cache LRU (InstanceCache) e resolve as requisições num pool
+    de processos, devolvendo as melhores rotas parciais à medida que surgem.
+
+    Protocolo (JSON por linha): {"op": "solve", "dataset", "time_limit",
+    "generations", "seed", "params", "routes"} responde com 'accepted', zero
+    ou mais 'improved' e um 'done' (ou 'error'). Enviar {"op": "cancel"} ou
+    fechar a conexão encerra a requisição; {"op": "stats"} e {"op": "ping"}
+    respondem na hora.
+    """
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, workers: Optional[int] = None,
+                 cache_mb: float = 1024.0, matrix_mb: float = 512.0, datasets_dir: Optional[str] = None,
+                 ga_params: Optional[Dict[str, Any]] = None, default_time_limit: float = 1.0,
+                 max_time_limit: float = 60.0, stream_interval: float = STREAM_INTERVAL):
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count()
+        self.cache = InstanceCache(cache_mb, matrix_mb)
+        self.datasets_dir = datasets_dir
+        self.ga_params = dict(ga_params or {})
+        self.default_time_limit = default_time_limit
+        self.max_time_limit = max_time_limit
+        self.stream_interval = stream_interval
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # Fila de eventos de cada requisição em andamento e o worker que a executa (slot, início)
+        self._queues: Dict[int, 'queue.Queue[Tuple[str, Dict[str, Any]]]'] = {}
+        self._slots: Dict[int, Tuple[int, float]] = {}
+        self._cancelled: set = set()
+        self.requests = 0
+        self.errors = 0
+
+        self._tasks = None
+        self._events = None
+        self._cancel_flags = None
+        self._processes: List[mp.Process] = []
+        self._dispatcher: Optional[threading.Thread] = None
+        self._server: Optional[_UnixServer] = None
+
+    # --- Ciclo de vida -----------------------------------------------------------
+
+    def start(self):
+        """Inicia os workers (antes de qualquer thread), o despachante de eventos e o socket."""
+        # Workers herdam o rastreador de recursos do daemon: sem isso cada um
+        # iniciaria o seu e, ao sair, removeria os segmentos que anexou
+        resource_tracker.ensure_running()
+        self._tasks = mp.Queue()
+        self._events = mp.Queue()
+        self._cancel_flags = mp.Array('q', self.workers, lock=False)
+        self._processes = [self._spawn_worker(slot) for slot in range(self.workers)]
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._server = _UnixServer(self.socket_path, _RequestHandler)
+        self._server.solver = self
+        # Só o próprio usuário conversa com o daemon
+        os.chmod(self.socket_path, 0o600)
+
+    def _spawn_worker(self, slot: int) -> mp.Process:
+        process = mp.Process(target=_solver_worker, daemon=True,
+                             args=(slot, self._tasks, self._events, self._cancel_flags, self.stream_interval))
+        process.start()
+        return process
+
+    def serve_forever(self):
+        self._server.serve_forever(poll_interval=0.2)
+
+    def shutdown(self):
+        """Encerra o socket (a partir de outra thread ou de um handler de sinal)."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self):
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        if self._events is not None:
+            self._events.put(None)
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=5)
+        self.cache.close()
+
+    def __enter__(self) -> 'SolverDaemon':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # --- Requisições ---------------------------------------------------------------
+
+    def _dispatch(self):
+        """Encaminha os eventos dos workers para a fila da requisição correspondente."""
+        while True:
+            message = self._events.get()
+            if message is None:
+                break
+            rid, kind, payload = message
+            with self._lock:
+                if kind == 'started':
+                    self._slots[rid] = (payload['slot'], time.perf_counter())
+                    if rid in self._cancelled:
+                        self._cancel_flags[payload['slot']] = rid
+                    continue
+                events = self._queues.get(rid)
+            if events is not None:
+                events.put((kind, payload))
+
+    def cancel(self, rid: int):
+        """Pede ao worker que encerre a requisição (vale também para as que ainda estão na fila)."""
+        with self._lock:
+            self._cancelled.add(rid)
+            running = self._slots.get(rid)
+            if running is not None:
+                self._cancel_flags[running[0]] = rid
+
+    def _worker_failure(self, rid: int, time_limit: float) -> Optional[str]:
+        """
+        Erro da requisição se o worker que a executa morreu (OOM, sinal) ou passou de
+        time_limit + WORKER_GRACE sem terminar; o worker é substituído. None se segue normal.
+        """
+        with self._lock:
+            running = self._slots.get(rid)
+        if running is None:
+            # Ainda na fila (ou já terminou)
+            return None
+        slot, started = running
+        process = self._processes[slot]
+        if not process.is_alive():
+            error = f"Worker {slot} encerrado inesperadamente (código {process.exitcode})"
+        elif time.perf_counter() - started > time_limit + WORKER_GRACE:
+            process.terminate()
+            process.join()
+            error = f"Worker {slot} não respondeu em {time_limit + WORKER_GRACE:.0f}s"
+        else:
+            return None
+        with self._lock:
+            self._slots.pop(rid, None)
+            self._processes[slot] = self._spawn_worker(slot)
+        return error
+
+    def resolve_dataset(self, dataset: str) -> str:
+        """Caminho do dataset: absoluto ou relativo à pasta de datasets do daemon."""
+        if os.path.isabs(dataset) or self.datasets_dir is None:
+            return dataset
+        return os.path.join(self.datasets_dir, dataset)
+
+    def _task(self, request: Dict[str, Any], entry: CachedInstance, rid: int) -> Dict[str, Any]:
+        params = dict(self.ga_params)
+        for key, value in (request.get('params') or {}).items():
+            if key not in REQUEST_PARAMS:
+                raise ValueError(f"Parâmetro não permitido: {key}")
+            params[key] = value
+        time_limit = min(float(request.get('time_limit', self.default_time_limit)), self.max_time_limit)
+        seed = request.get('seed')
+        return {
+            'id': rid,
+            'instance': entry.spec(),
+            'params': params,
+            'generations': int(request.get('generations', MAX_GENERATIONS)),
+            'time_limit': time_limit,
+            'seed': seed if seed is not None else seed_sequence().entropy,
+        }
+
+    def handle_solve(self, request: Dict[str, Any], handler: _RequestHandler) -> bool:
+        """
+        Executa uma requisição de solve numa conexão, repassando os eventos ao cliente.
+        Retorna False se a conexão foi encerrada pelo cliente.
+        """
+        received = time.perf_counter()
+        rid = next(self._ids)
+        with self._lock:
+            self.requests += 1
+        try:
+            entry, cached = self.cache.acquire(self.resolve_dataset(str(request['dataset'])))
+        except Exception as e:
+            self._count_error()
+            return handler._send({'event': 'error', 'id': rid, 'error': str(e)})
+
+        events: 'queue.Queue[Tuple[str, Dict[str, Any]]]' = queue.Queue()
+        with self._lock:
+            self._queues[rid] = events
+        names = entry.instance.names
+        with_routes = bool(request.get('routes', True))
+        connected = True
+        try:
+            task = self._task(request, entry, rid)
+            self._tasks.put(task)
+            connected = handler._send({'event': 'accepted', 'id': rid, 'dataset': request['dataset'],
+                                       'n_stops': len(names), 'cached': cached, 'seed': task['seed'],
+                                       'time_limit': task['time_limit'],
+                                       'load_s': time.perf_counter() - received})
+            if not connected:
+                self.cancel(rid)
+            while True:
+                if connected and handler._client_stopped():
+                    self.cancel(rid)
+                    connected = False
+                try:
+                    kind, payload = events.get(timeout=0.05)
+                except queue.Empty:
+                    # Sem 'done' nem 'error' de um worker que morreu: a requisição não pode esperar para sempre
+                    failure = self._worker_failure(rid, task['time_limit'])
+                    if failure is None:
+                        continue
+                    kind, payload = 'error', {'error': failure}
+                if not connected and kind not in ('done', 'error'):
+                    continue
+                message = {'event': kind, 'id': rid, 'elapsed_s': time.perf_counter() - received}
+                tour = payload.pop('tour', None)
+                message.update(payload)
+                if tour is not None and (with_routes or kind == 'done'):
+                    message['route'] = names[tour].tolist()
+                if kind == 'error':
+                    self._count_error()
+                if connected:
+                    connected = handler._send(message)
+                    if not connected:
+                        self.cancel(rid)
+                if kind in ('done', 'error'):
+                    break
+        except Exception as e:
+            # Requisição inválida (antes de chegar a um worker)
+            self._count_error()
+            connected = handler._send({'event': 'error', 'id': rid, 'error': str(e)})
+        finally:
+            with self._lock:
+                self._queues.pop(rid, None)
+                self._slots.pop(rid, None)
+                self._cancelled.discard(rid)
+            # Só agora o worker não usa mais a matriz compartilhada
+            self.cache.release(entry)
+        return connected
+
+    def _count_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {'requests': self.requests, 'errors': self.errors, 'running': len(self._queues)}
+        return {
+            'workers': self.workers,
+            **counters,
+            'cache': self.cache.stats(),
+        }
@@ -0,0 +1,165 @@
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+from ..tsp.instance_loader import InstanceLoader, Instance
+
+
+@dataclass
+class CachedInstance:
+    """
+    Instância residente no cache do daemon: arrays da instância e, quando cabe
+    no limite, a matriz de distâncias completa em memória compartilhada (os
+    workers a anexam sem copiar). Sem matriz, os workers usam o cache de linhas.
+    """
+    key: str
+    path: str
+    instance: Instance
+    shm: Optional[shared_memory.SharedMemory]
+    shape: Tuple[int, int]
+    dtype: str
+    nbytes: int
+    # Requisições em andamento: a memória só é liberada quando chega a zero
+    users: int = 0
+    evicted: bool = field(default=False, repr=False)
+
+    def spec(self) -> Dict[str, Any]:
+        """Descrição da instância enviada aos workers (só arrays e tipos simples)."""
+        instance = self.instance
+        return {
+            'key': self.key,
+            'shm_name': self.shm.name if self.shm is not None else None,
+            'shape': self.shape,
+            'dtype': self.dtype,
+            'names': instance.names,
+            'coords': instance.coords,
+            'is_geo': instance.is_geo,
+            'metric': instance.metric,
+        }
+
+    def release(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+class InstanceCache:
+    """
+    Cache LRU de instâncias carregadas e matrizes de distâncias, indexado pelo
+    hash do arquivo e limitado em memória (max_mb). Instâncias em uso por uma
+    requisição não são liberadas antes de ela terminar (acquire/release).
+    Matrizes acima de matrix_mb ficam de fora: os workers calculam linhas sob demanda.
+    """
+    def __init__(self, max_mb: float = 1024.0, matrix_mb: float = 512.0):
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.matrix_mb = min(matrix_mb, max_mb)
+        self._entries: 'OrderedDict[str, CachedInstance]' = OrderedDict()
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._building: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, path: str) -> str:
+        """Hash do arquivo, recalculado só quando caminho, tamanho ou data de modificação mudam."""
+        stat = os.stat(path)
+        signature = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        key = self._hashes.get(signature)
+        if key is None:
+            key = InstanceLoader(path, verbose=False).file_hash()
+            self._hashes[signature] = key
+        return key
+
+    def _lookup(self, key: str) -> Optional[CachedInstance]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            entry.users += 1
+            self.hits += 1
+        return entry
+
+    def acquire(self, path: str) -> Tuple[CachedInstance, bool]:
+        """
+        Instância do arquivo (carregada e com a matriz calculada se preciso) e se
+        veio do cache. Cada acquire deve ser seguido de release(entry).
+        """
+        key = self._key(path)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry, True
+            building = self._building.setdefault(key, threading.Lock())
+
+        # Requisições simultâneas pela mesma instância esperam uma única construção
+        with building:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry, True
+            try:
+                entry = self._build(key, path)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+            with self._lock:
+                self.misses += 1
+                entry.users += 1
+                self._entries[key] = entry
+                self.bytes += entry.nbytes
+                self._evict()
+        return entry, False
+
+    def release(self, entry: CachedInstance):
+        with self._lock:
+            entry.users -= 1
+            if entry.evicted and entry.users == 0:
+                entry.release()
+
+    def _build(self, key: str, path: str) -> CachedInstance:
+        instance = InstanceLoader(path, verbose=False).load()
+        distance_matrix = instance.distance_matrix(max_memory_mb=self.matrix_mb)
+        nbytes = instance.coords.nbytes + instance.names.nbytes
+        shm = None
+        if distance_matrix.is_full:
+            # Mesmo esquema do modelo de ilhas: a matriz é copiada uma vez para memória compartilhada
+            matrix = distance_matrix.matrix
+            shm = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+            np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[:] = matrix
+            nbytes += matrix.nbytes
+        return CachedInstance(key=key, path=path, instance=instance, shm=shm,
+                              shape=(distance_matrix.n, distance_matrix.n), dtype=distance_matrix.dtype.str,
+                              nbytes=nbytes)
+
+    def _evict(self):
+        """Remove as menos usadas recentemente até caber no limite (a mais recente sempre fica)."""
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.bytes -= entry.nbytes
+            entry.evicted = True
+            if entry.users == 0:
+                entry.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            for entry in self._entries.values():
+                entry.release()
+            self._entries.clear()
+            self.bytes = 0
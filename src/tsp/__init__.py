@@ -2,15 +2,34 @@
 
 """
 Pacote tsp.
-Exposes core TSP domain entities: City, Route, and InstanceLoader.
+Exposes core TSP domain entities: City, Route, InstanceLoader (CSV/TSPLIB), DistanceMatrix and GridIndex.
 """
 
 from .city import City
 from .route import Route
-from .instance_loader import InstanceLoader
+from .instance_loader import InstanceLoader, Instance, LazyCities
+from .distance_matrix import DistanceMatrix
+from .spatial_index import GridIndex, project_coordinates
+from .route_io import read_route_manifest, write_route_manifest, write_route_json, write_route_csv
+from .tsplib import parse_tsplib
+from .changes import StopChange, CHANGE_OPS, read_stop_changes, stop_index
 
 __all__ = [
     'City',
     'Route',
-    'InstanceLoader'
+    'InstanceLoader',
+    'Instance',
+    'LazyCities',
+    'DistanceMatrix',
+    'GridIndex',
+    'project_coordinates',
+    'read_route_manifest',
+    'write_route_manifest',
+    'write_route_json',
+    'write_route_csv',
+    'parse_tsplib',
+    'StopChange',
+    'CHANGE_OPS',
+    'read_stop_changes',
+    'stop_index'
 ]
\ No newline at end of file
@@ -0,0 +1,63 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from .city import City
+
+# Tipos de alteração de parada aceitos
+CHANGE_OPS = ('add', 'remove', 'move')
+
+# Pares de colunas aceitos para as coordenadas (mesmos nomes dos datasets)
+_COORD_KEYS = (('lat', 'lon'), ('x', 'y'), ('c1', 'c2'))
+
+
+@dataclass
+class StopChange:
+    """
+    Alteração de uma parada durante a operação: inclusão ('add'), remoção
+    ('remove') ou nova posição ('move'). Paradas são identificadas pelo nome;
+    'add' e 'move' exigem as coordenadas (c1, c2 = lat/lon ou x/y).
+    """
+    op: str
+    name: str
+    c1: Optional[float] = None
+    c2: Optional[float] = None
+
+    def __post_init__(self):
+        if self.op not in CHANGE_OPS:
+            raise ValueError(f"Alteração desconhecida: {self.op}. Opções: {', '.join(CHANGE_OPS)}")
+        if self.op != 'remove' and (self.c1 is None or self.c2 is None):
+            raise ValueError(f"Alteração '{self.op}' da parada '{self.name}' exige coordenadas")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StopChange':
+        """Lê {"op", "name", e lat/lon, x/y ou c1/c2}."""
+        c1 = c2 = None
+        for k1, k2 in _COORD_KEYS:
+            if k1 in data and k2 in data:
+                c1, c2 = float(data[k1]), float(data[k2])
+                break
+        return cls(op=str(data['op']), name=str(data['name']), c1=c1, c2=c2)
+
+
+def read_stop_changes(file_path: str) -> List[StopChange]:
+    """
+    Lê alterações de paradas de um arquivo JSON (lista de objetos) ou JSON lines
+    (um objeto por linha), na ordem em que devem ser aplicadas.
+    """
+    with open(file_path, encoding='utf-8') as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith('['):
+        records = json.loads(stripped)
+    else:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [StopChange.from_dict(record) for record in records]
+
+
+def stop_index(cities: Sequence[City]) -> Dict[str, int]:
+    """Nome -> índice das paradas (LazyCities usa o array de nomes, sem criar City)."""
+    names = getattr(cities, 'names', None)
+    if names is None:
+        names = [city.name for city in cities]
+    return {str(name): i for i, name in enumerate(names)}
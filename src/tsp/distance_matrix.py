@@ -0,0 +1,343 @@
+import numpy as np
+from collections import OrderedDict
+from typing import List, Sequence, Dict, Optional
+from .city import City
+
+EARTH_RADIUS_KM = 6371.0
+# Constantes da distância GEO do TSPLIB (raio e PI como na especificação)
+TSPLIB_EARTH_RADIUS_KM = 6378.388
+TSPLIB_PI = 3.141592
+
+
+def euclidean_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distância Euclidiana vetorizada entre dois blocos de coordenadas.
+    a: (m, 2), b: (n, 2) -> (m, n)
+    """
+    dx = a[:, 0, None] - b[None, :, 0]
+    dy = a[:, 1, None] - b[None, :, 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def haversine_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distância Haversine vetorizada (km) entre dois blocos de coordenadas (lat, lon) em graus.
+    Mesma fórmula de City._haversine_distance.
+    """
+    lat1, lon1 = np.radians(a[:, 0])[:, None], np.radians(a[:, 1])[:, None]
+    lat2, lon2 = np.radians(b[:, 0])[None, :], np.radians(b[:, 1])[None, :]
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    h = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # clip evita NaN por erro de arredondamento em pontos coincidentes/antípodas
+    h = np.clip(h, 0.0, 1.0)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(h), np.sqrt(1 - h))
+
+
+def euc_2d_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distância EUC_2D do TSPLIB: Euclidiana arredondada para o inteiro mais próximo (nint)."""
+    return np.floor(euclidean_kernel(a, b) + 0.5)
+
+
+def ceil_2d_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distância CEIL_2D do TSPLIB: Euclidiana arredondada para cima."""
+    return np.ceil(euclidean_kernel(a, b))
+
+
+def att_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distância pseudo-Euclidiana do TSPLIB (ATT): r = sqrt((dx² + dy²) / 10),
+    arredondada para o inteiro mais próximo e somada de 1 se ficou abaixo de r.
+    """
+    r = euclidean_kernel(a, b) / np.sqrt(10.0)
+    t = np.floor(r + 0.5)
+    return np.where(t < r, t + 1.0, t)
+
+
+def tsplib_geo_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distância GEO do TSPLIB (km inteiros, RRR = 6378.388), entre coordenadas (lat, lon)
+    já convertidas de GGG.MM para graus. Reproduz os valores dos ótimos publicados;
+    pontos coincidentes ficam com distância 0 (a fórmula original daria 1).
+    """
+    lat1, lon1 = (TSPLIB_PI / 180.0) * a[:, 0, None], (TSPLIB_PI / 180.0) * a[:, 1, None]
+    lat2, lon2 = (TSPLIB_PI / 180.0) * b[None, :, 0], (TSPLIB_PI / 180.0) * b[None, :, 1]
+    q1 = np.cos(lon1 - lon2)
+    q2 = np.cos(lat1 - lat2)
+    q3 = np.cos(lat1 + lat2)
+    angle = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+    return np.where(angle > 0, np.floor(TSPLIB_EARTH_RADIUS_KM * angle + 1.0), 0.0)
+
+
+# Métricas suportadas: nome -> kernel vetorizado
+KERNELS = {
+    'euclidean': euclidean_kernel,
+    'haversine': haversine_kernel,
+    'euc_2d': euc_2d_kernel,
+    'ceil_2d': ceil_2d_kernel,
+    'att': att_kernel,
+    'geo': tsplib_geo_kernel,
+}
+
+
+class DistanceMatrix:
+    """
+    Matriz de distâncias pré-calculada para uma instância do TSP.
+
+    Calculada uma única vez (kernels vetorizados Euclidiano/Haversine) e
+    compartilhada por Route, pelos operadores e pelo GeneticAlgorithm.
+    Quando N² não cabe no limite de memória, as linhas são calculadas sob
+    demanda e mantidas num cache LRU limitado (com contadores de hit/miss).
+    """
+    # Tamanho do bloco de linhas usado na construção (limita memória temporária)
+    BLOCK_ROWS = 256
+
+    def __init__(self, coords: np.ndarray, is_geo: bool = False, dtype=np.float64,
+                 max_memory_mb: float = 512.0, cache_rows: int = 1024,
+                 matrix: Optional[np.ndarray] = None, metric: Optional[str] = None):
+        self.coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.n = len(self.coords)
+        self.is_geo = is_geo
+        self.dtype = np.dtype(dtype)
+        self.metric = metric or ('explicit' if matrix is not None else ('haversine' if is_geo else 'euclidean'))
+        if self.metric == 'explicit' and matrix is None:
+            raise ValueError("Métrica 'explicit' exige a matriz de distâncias")
+        if self.metric != 'explicit' and self.metric not in KERNELS:
+            raise ValueError(f"Métrica desconhecida: {self.metric}. Opções: {', '.join(KERNELS)}")
+        self._kernel = KERNELS.get(self.metric)
+
+        # Sequência de City (pode ser LazyCities); o índice reverso é montado sob demanda
+        self.cities: Optional[Sequence[City]] = None
+        self._index: Optional[Dict[City, int]] = None
+
+        # Alterações dinâmicas aplicadas (add_points/remove_points/update_points)
+        self.version = 0
+
+        # Estatísticas do cache de linhas (modo sob demanda)
+        self.hits = 0
+        self.misses = 0
+        self.cache_rows = max(1, cache_rows)
+        self._row_cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+
+        required_bytes = self.n * self.n * self.dtype.itemsize
+        self.matrix: Optional[np.ndarray] = None
+        if matrix is not None:
+            # Matriz já calculada (ex.: anexada de memória compartilhada por outro processo)
+            self.matrix = matrix
+            self.dtype = matrix.dtype
+        elif required_bytes <= max_memory_mb * 1024 ** 2:
+            self.matrix = self._build_full()
+
+    @classmethod
+    def from_cities(cls, cities: Sequence[City], **kwargs) -> 'DistanceMatrix':
+        """
+        Constrói a matriz a partir de uma sequência de City (modo Geo se todas forem Geo).
+        Sequências preguiçosas (LazyCities) fornecem as coordenadas diretamente, sem criar City.
+        """
+        coords = getattr(cities, 'coords', None)
+        if coords is not None:
+            is_geo = cities.is_geo
+        else:
+            coords = np.array([(c.c1, c.c2) for c in cities], dtype=np.float64)
+            is_geo = bool(cities) and all(c.is_geo for c in cities)
+        dm = cls(coords, is_geo=is_geo, **kwargs)
+        dm.cities = cities
+        return dm
+
+    @property
+    def is_full(self) -> bool:
+        """True se a matriz N×N completa está em memória."""
+        return self.matrix is not None
+
+    def _compute_rows(self, rows: np.ndarray) -> np.ndarray:
+        return self._kernel(self.coords[rows], self.coords).astype(self.dtype, copy=False)
+
+    def _build_full(self) -> np.ndarray:
+        matrix = np.empty((self.n, self.n), dtype=self.dtype)
+        for start in range(0, self.n, self.BLOCK_ROWS):
+            end = min(start + self.BLOCK_ROWS, self.n)
+            matrix[start:end] = self._compute_rows(np.arange(start, end))
+        return matrix
+
+    def row(self, i: int) -> np.ndarray:
+        """Retorna as distâncias da cidade i para todas as outras."""
+        if self.matrix is not None:
+            return self.matrix[i]
+
+        cached = self._row_cache.get(i)
+        if cached is not None:
+            self.hits += 1
+            self._row_cache.move_to_end(i)
+            return cached
+
+        self.misses += 1
+        row = self._compute_rows(np.array([i]))[0]
+        self._row_cache[i] = row
+        if len(self._row_cache) > self.cache_rows:
+            self._row_cache.popitem(last=False)
+        return row
+
+    def distance(self, i: int, j: int) -> float:
+        if self.matrix is not None:
+            return float(self.matrix[i, j])
+        return float(self.row(i)[j])
+
+    def block(self, rows: Sequence[int], cols: Sequence[int]) -> np.ndarray:
+        """Submatriz (len(rows), len(cols)) de distâncias, sem calcular linhas inteiras."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if self.matrix is not None:
+            return self.matrix[np.ix_(rows, cols)]
+        return self._kernel(self.coords[rows], self.coords[cols]).astype(self.dtype, copy=False)
+
+    def pair_distances(self, u: Sequence[int], v: Sequence[int]) -> np.ndarray:
+        """
+        Distâncias d(u[i], v[i]) par a par. Sem a matriz completa, cada bloco de
+        pares é calculado pelo kernel (diagonal do bloco), sem passar pelo cache de linhas.
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        if self.matrix is not None:
+            return self.matrix[u, v]
+        out = np.empty(len(u), dtype=self.dtype)
+        for start in range(0, len(u), self.BLOCK_ROWS):
+            end = min(start + self.BLOCK_ROWS, len(u))
+            out[start:end] = np.diagonal(self._kernel(self.coords[u[start:end]], self.coords[v[start:end]]))
+        return out
+
+    def tour_length(self, tour: Sequence[int]) -> float:
+        """
+        Comprimento do ciclo fechado descrito por uma sequência de índices.
+        """
+        tour = np.asarray(tour)
+        nxt = np.roll(tour, -1)
+        if self.matrix is not None:
+            return float(self.matrix[tour, nxt].sum(dtype=np.float64))
+        return float(self.pair_distances(tour, nxt).sum(dtype=np.float64))
+
+    # --- Alterações dinâmicas da instância ------------------------------------
+    # Paradas incluídas, removidas ou movidas atualizam só as linhas/colunas
+    # afetadas (nenhuma distância inalterada é recalculada). `version` conta as
+    # alterações, para que estruturas derivadas (listas de vizinhos) se renovem.
+
+    def _check_dynamic(self):
+        if self._kernel is None:
+            raise ValueError("Métrica 'explicit' não permite incluir ou mover paradas (sem coordenadas)")
+
+    def _patch_rows(self, rows: np.ndarray):
+        """Recalcula as linhas (e colunas, por simetria) das paradas `rows` na matriz completa."""
+        for start in range(0, len(rows), self.BLOCK_ROWS):
+            block = rows[start:start + self.BLOCK_ROWS]
+            values = self._compute_rows(block)
+            self.matrix[block] = values
+            self.matrix[:, block] = values.T
+
+    def _changed(self):
+        self._row_cache.clear()
+        self._index = None
+        self.version += 1
+
+    def add_points(self, coords: np.ndarray, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Inclui novas paradas no fim da instância e retorna seus índices.
+        Na matriz completa só as k novas linhas/colunas são calculadas; o bloco
+        existente é apenas copiado para a matriz ampliada.
+        """
+        self._check_dynamic()
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        old_n, k = self.n, len(coords)
+        new_indices = np.arange(old_n, old_n + k)
+        self.coords = np.concatenate((self.coords, coords))
+        self.n = old_n + k
+        if self.matrix is not None:
+            matrix = np.empty((self.n, self.n), dtype=self.dtype)
+            matrix[:old_n, :old_n] = self.matrix
+            self.matrix = matrix
+            self._patch_rows(new_indices)
+        if self.cities is not None:
+            if names is None:
+                names = [f"Ponto_{i + 1}" for i in new_indices.tolist()]
+            self._rebuild_cities(np.arange(old_n), list(names))
+        self._changed()
+        return new_indices
+
+    def remove_points(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Remove paradas e renumera as restantes (mantendo a ordem relativa).
+        Retorna o mapa índice antigo -> novo, com -1 nas paradas removidas.
+        Nenhuma distância é recalculada.
+        """
+        keep = np.ones(self.n, dtype=bool)
+        keep[np.asarray(indices, dtype=np.int64)] = False
+        kept = np.flatnonzero(keep)
+        mapping = np.full(self.n, -1, dtype=np.int32)
+        mapping[kept] = np.arange(len(kept), dtype=np.int32)
+        self.coords = self.coords[kept]
+        self.n = len(kept)
+        if self.matrix is not None:
+            self.matrix = self.matrix[np.ix_(kept, kept)]
+        if self.cities is not None:
+            self._rebuild_cities(kept)
+        self._changed()
+        return mapping
+
+    def update_points(self, indices: Sequence[int], coords: np.ndarray):
+        """Move paradas (mesmo nome) para novas coordenadas, recalculando no lugar só as suas linhas e colunas."""
+        self._check_dynamic()
+        indices = np.asarray(indices, dtype=np.int64)
+        # Cópia: as coordenadas podem ser compartilhadas com a Instance de origem
+        self.coords = self.coords.copy()
+        self.coords[indices] = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        if self.matrix is not None:
+            self._patch_rows(indices)
+        if self.cities is not None:
+            self._rebuild_cities(np.arange(self.n))
+        self._changed()
+
+    def _rebuild_cities(self, kept: np.ndarray, added_names: Sequence[str] = ()):
+        """
+        Refaz a sequência de cidades após uma alteração: as de índice `kept` seguidas
+        das incluídas, com as coordenadas atuais. LazyCities continua preguiçosa
+        (só o array de nomes é refeito).
+        """
+        old_names = getattr(self.cities, 'names', None)
+        if old_names is None:
+            old_names = [city.name for city in self.cities]
+        names = np.concatenate((np.asarray(old_names, dtype=object)[kept],
+                                np.asarray(list(added_names), dtype=object)))
+        if hasattr(self.cities, 'names'):
+            self.cities = type(self.cities)(names, self.coords, self.is_geo)
+        else:
+            self.cities = [City(name=str(name), c1=float(c1), c2=float(c2), is_geo=self.is_geo)
+                           for name, (c1, c2) in zip(names.tolist(), self.coords.tolist())]
+
+    def _city_index(self) -> Dict[City, int]:
+        if self._index is None:
+            self._index = {city: i for i, city in enumerate(self.cities or [])}
+        return self._index
+
+    def index_of(self, city: City) -> int:
+        return self._city_index()[city]
+
+    def indices_of(self, cities: List[City]) -> np.ndarray:
+        """Converte uma lista de City na permutação de índices correspondente."""
+        index = self._city_index()
+        return np.fromiter((index[c] for c in cities), dtype=np.int32, count=len(cities))
+
+    def cache_info(self) -> Dict[str, int]:
+        """Contadores do cache de linhas (relevante apenas no modo sob demanda)."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'cached_rows': len(self._row_cache),
+            'max_rows': self.cache_rows,
+        }
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        mode = "full" if self.is_full else f"row-cache({self.cache_rows})"
+        return f"DistanceMatrix(n={self.n}, {self.metric}, {self.dtype}, {mode})"
@@ -1,62 +1,207 @@
-import pandas as pd
 import os
-from typing import List
+import csv
+import hashlib
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Union, overload
 from .city import City
+from .distance_matrix import DistanceMatrix
+from .tsplib import parse_tsplib
+
+# Incrementar quando o formato do cache binário mudar
+CACHE_VERSION = 3
+CACHE_DIR_NAME = '.cache'
+
+
+class LazyCities(Sequence[City]):
+    """
+    Sequência de City criada sob demanda a partir dos arrays de nomes e coordenadas.
+    Evita materializar 100k objetos no carregamento; City só existe quando é acessada
+    (rotas de saída, gráficos, manifestos).
+    """
+    def __init__(self, names: np.ndarray, coords: np.ndarray, is_geo: bool = False):
+        self.names = names
+        self.coords = coords
+        self.is_geo = is_geo
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    @overload
+    def __getitem__(self, index: int) -> City: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[City]: ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        c1, c2 = self.coords[index]
+        return City(name=str(self.names[index]), c1=float(c1), c2=float(c2), is_geo=self.is_geo)
+
+    def __repr__(self) -> str:
+        return f"LazyCities(n={len(self)}, {'Geo' if self.is_geo else 'Cartesian'})"
+
+
+@dataclass
+class Instance:
+    """
+    Instância carregada em arrays: nomes, coordenadas (n, 2), métrica e,
+    para instâncias TSPLIB EXPLICIT, a matriz de distâncias do arquivo.
+    """
+    name: str
+    names: np.ndarray
+    coords: np.ndarray
+    is_geo: bool = False
+    metric: str = 'euclidean'
+    matrix: Optional[np.ndarray] = None
+
+    @property
+    def cities(self) -> LazyCities:
+        return LazyCities(self.names, self.coords, self.is_geo)
+
+    def distance_matrix(self, **kwargs) -> DistanceMatrix:
+        """Constrói o DistanceMatrix da instância (usando a matriz explícita, se houver)."""
+        if self.matrix is not None:
+            dtype = np.dtype(kwargs.pop('dtype', np.float64))
+            kwargs.pop('max_memory_mb', None)
+            return DistanceMatrix.from_cities(self.cities, matrix=self.matrix.astype(dtype, copy=False), **kwargs)
+        return DistanceMatrix.from_cities(self.cities, metric=self.metric, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
 
 class InstanceLoader:
     """
     Carregador Inteligente: Detecta automaticamente se o dataset
     é Geográfico (Lat/Lon) ou Euclidiano (X/Y).
+
+    Lê CSV e TSPLIB (.tsp) direto para arrays NumPy e guarda o resultado num
+    cache binário (.npz) em <pasta do dataset>/.cache, indexado pelo hash do
+    arquivo: recarregar a mesma instância não reprocessa o texto.
     """
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, use_cache: bool = True, cache_dir: Optional[str] = None,
+                 verbose: bool = True):
         self.file_path = file_path
+        self.verbose = verbose
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(file_path)), CACHE_DIR_NAME)
+
+    def load_cities(self) -> LazyCities:
+        return self.load().cities
 
-    def load_cities(self) -> List[City]:
+    def load(self) -> Instance:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Arquivo não encontrado: {self.file_path}")
 
+        cache_path = self._cache_path() if self.use_cache else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                instance = self._read_cache(cache_path)
+                self._log(f"   -> Cache binário: {os.path.basename(cache_path)}")
+                return instance
+            except (OSError, ValueError, KeyError):
+                pass  # Cache corrompido: reprocessa o arquivo
+
+        try:
+            if self.file_path.lower().endswith('.tsp'):
+                instance = self._parse_tsplib()
+            else:
+                instance = self._parse_csv()
+        except Exception as e:
+            raise RuntimeError(f"Erro ao processar arquivo {self.file_path}: {e}")
+
+        if cache_path:
+            self._write_cache(cache_path, instance)
+        return instance
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
+    def file_hash(self) -> str:
+        """Hash do conteúdo do arquivo (e da versão do cache), usado para indexar caches da instância."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(CACHE_VERSION).encode())
+        with open(self.file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _cache_path(self) -> str:
+        base = os.path.basename(self.file_path)
+        return os.path.join(self.cache_dir, f"{base}.{self.file_hash()}.npz")
+
+    def _read_cache(self, path: str) -> Instance:
+        with np.load(path, allow_pickle=False) as data:
+            return Instance(
+                name=str(data['name']),
+                names=data['names'],
+                coords=data['coords'],
+                is_geo=bool(data['is_geo']),
+                metric=str(data['metric']),
+                matrix=data['matrix'] if 'matrix' in data.files else None,
+            )
+
+    def _write_cache(self, path: str, instance: Instance):
+        arrays = dict(name=np.array(instance.name), names=instance.names, coords=instance.coords,
+                      is_geo=np.array(instance.is_geo), metric=np.array(instance.metric))
+        if instance.matrix is not None:
+            arrays['matrix'] = instance.matrix
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
         try:
-            df = pd.read_csv(self.file_path, skipinitialspace=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.savez(tmp_path, **arrays)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Sem permissão de escrita: segue sem cache
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _parse_tsplib(self) -> Instance:
+        with open(self.file_path, encoding='utf-8') as f:
+            parsed = parse_tsplib(f.read())
+        self._log(f"   -> TSPLIB: {parsed['metric']}{' (matriz explícita)' if parsed['matrix'] is not None else ''}")
+        name = parsed['name'] or os.path.splitext(os.path.basename(self.file_path))[0]
+        return Instance(name=name, names=parsed['names'], coords=parsed['coords'],
+                        is_geo=parsed['is_geo'], metric=parsed['metric'], matrix=parsed['matrix'])
+
+    def _parse_csv(self) -> Instance:
+        with open(self.file_path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f, skipinitialspace=True)
             # Normaliza colunas
-            df.columns = [c.lower().strip() for c in df.columns]
-            cols = df.columns
-            
-            cities = []
-            
-            # DETECÇÃO DE MODO
+            cols = [c.lower().strip() for c in next(reader)]
+            rows = [row for row in reader if row]
+        columns = list(zip(*rows)) if rows else [()] * len(cols)
+
+        # DETECÇÃO DE MODO
+        if 'lat' in cols or 'latitude' in cols:
+            is_geo = True
+            col_c1 = 'lat' if 'lat' in cols else 'latitude'
+            col_c2 = 'lon' if 'lon' in cols else ('lng' if 'lng' in cols else 'longitude')
+        elif 'x' in cols:
             is_geo = False
-            if 'lat' in cols or 'latitude' in cols:
-                is_geo = True
-                col_c1 = 'lat' if 'lat' in cols else 'latitude'
-                col_c2 = 'lon' if 'lon' in cols else ('lng' if 'lng' in cols else 'longitude')
-            elif 'x' in cols:
-                is_geo = False
-                col_c1 = 'x'
-                col_c2 = 'y'
-            else:
-                # Fallback para datasets sem cabeçalho padrão
-                # Assume X, Y se houver 3 colunas e nenhuma for lat
-                is_geo = False
-                df.rename(columns={df.columns[1]: 'x', df.columns[2]: 'y'}, inplace=True)
-                col_c1, col_c2 = 'x', 'y'
-
-            print(f"   -> Modo detectado: {'🌍 Geográfico (GPS)' if is_geo else '📐 Euclidiano (Plano)'}")
-
-            for idx, row in df.iterrows():
-                # Identificar Nome
-                if 'name' in cols: name = str(row['name'])
-                elif 'city' in cols: name = str(row['city'])
-                elif 'id' in cols: name = str(row['id'])
-                else: name = f"Ponto_{idx + 1}"
-
-                cities.append(City(
-                    name=name,
-                    c1=float(row[col_c1]),
-                    c2=float(row[col_c2]),
-                    is_geo=is_geo
-                ))
-                        
-            return cities
+            col_c1, col_c2 = 'x', 'y'
+        else:
+            # Fallback para datasets sem cabeçalho padrão
+            # Assume X, Y se houver 3 colunas e nenhuma for lat
+            is_geo = False
+            col_c1, col_c2 = cols[1], cols[2]
 
-        except Exception as e:
-            raise RuntimeError(f"Erro ao processar arquivo {self.file_path}: {e}")
\ No newline at end of file
+        self._log(f"   -> Modo detectado: {'🌍 Geográfico (GPS)' if is_geo else '📐 Euclidiano (Plano)'}")
+
+        coords = np.empty((len(rows), 2), dtype=np.float64)
+        coords[:, 0] = np.array(columns[cols.index(col_c1)], dtype=np.float64)
+        coords[:, 1] = np.array(columns[cols.index(col_c2)], dtype=np.float64)
+
+        # Identificar Nome
+        name_col = next((c for c in ('name', 'city', 'id') if c in cols), None)
+        if name_col is not None:
+            names = np.array([v.strip() for v in columns[cols.index(name_col)]], dtype=str)
+        else:
+            names = np.array([f"Ponto_{i + 1}" for i in range(len(rows))], dtype=str)
+
+        name = os.path.splitext(os.path.basename(self.file_path))[0]
+        return Instance(name=name, names=names, coords=coords, is_geo=is_geo,
+                        metric='haversine' if is_geo else 'euclidean')
@@ -1,21 +1,47 @@
-from typing import List
+import numpy as np
+from typing import List, Optional, Sequence
 from .city import City
+from .distance_matrix import DistanceMatrix
 
 class Route:
     """
     Representa uma solução candidata (um percurso completo) para o TSP.
     Encapsula a lista de cidades e a distância total do ciclo.
+
+    Durante a evolução a população é mantida como matriz de índices;
+    a Route é apenas a visão de objetos reconstruída para o resultado final.
     """
-    def __init__(self, cities: List[City]):
+    def __init__(self, cities: List[City], distance_matrix: Optional[DistanceMatrix] = None,
+                 distance: Optional[float] = None):
         self.cities: List[City] = cities
-        # Calcula a distância imediatamente na instanciação
-        self.distance: float = self._calculate_distance()
+        self.distance_matrix = distance_matrix
+        self.indices: Optional[np.ndarray] = None
+        # Calcula a distância imediatamente na instanciação (se não foi informada)
+        self.distance: float = distance if distance is not None else self._calculate_distance()
+
+    @classmethod
+    def from_indices(cls, indices: Sequence[int], distance_matrix: DistanceMatrix,
+                     distance: Optional[float] = None) -> 'Route':
+        """
+        Reconstrói a Route a partir de uma permutação de índices da matriz de distâncias.
+        """
+        indices = np.asarray(indices, dtype=np.int32)
+        if distance is None:
+            distance = distance_matrix.tour_length(indices)
+        cities = [distance_matrix.cities[i] for i in indices.tolist()]
+        route = cls(cities, distance_matrix, distance)
+        route.indices = indices
+        return route
 
     def _calculate_distance(self) -> float:
         """
-        Calcula a distância Euclidiana total do percurso.
+        Calcula a distância total do percurso.
         Inclui o retorno da última cidade para a primeira (ciclo fechado).
+        Usa a matriz de distâncias pré-calculada quando disponível.
         """
+        if self.distance_matrix is not None:
+            return self.distance_matrix.tour_length(self.distance_matrix.indices_of(self.cities))
+
         total_dist = 0.0
         num_cities = len(self.cities)
         
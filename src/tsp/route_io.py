@@ -0,0 +1,71 @@
+import re
+import csv
+import json
+import numpy as np
+from typing import List, Sequence
+
+# Linha de parada no manifesto: "12. Nome da Cidade"
+_STOP_LINE = re.compile(r'^\s*\d+\.\s(.*)$')
+
+
+def read_route_manifest(file_path: str) -> List[str]:
+    """
+    Lê um manifesto de rota gerado pelo main.py (routes/<dataset>_route.txt, .json ou .csv)
+    e retorna a sequência de nomes das paradas, sem repetir o retorno à origem.
+    """
+    lower = file_path.lower()
+    if lower.endswith('.json'):
+        with open(file_path, encoding='utf-8') as f:
+            return [stop['name'] for stop in json.load(f)['stops']]
+    if lower.endswith('.csv'):
+        with open(file_path, newline='', encoding='utf-8') as f:
+            return [row['name'] for row in csv.DictReader(f)]
+
+    names = []
+    with open(file_path, encoding='utf-8') as f:
+        for line in f:
+            match = _STOP_LINE.match(line.rstrip('\n'))
+            if match:
+                names.append(match.group(1).strip())
+    # O manifesto fecha o ciclo repetindo a primeira parada
+    if len(names) > 1 and names[-1] == names[0]:
+        names.pop()
+    return names
+
+
+def write_route_manifest(file_path: str, dataset: str, names: Sequence[str], distance: float):
+    """Manifesto de carga em texto: cabeçalho e paradas numeradas, voltando à origem."""
+    route_names_closed = list(names) + [names[0]]
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(f"Malha Logística: {dataset}\n")
+        f.write(f"Distância Total: {distance:.2f} km\n")
+        f.write("-" * 30 + "\n")
+        f.write("SEQUÊNCIA DE ENTREGA SUGERIDA:\n")
+        for i, city_name in enumerate(route_names_closed):
+            f.write(f"{i+1}. {city_name}\n")
+
+
+def write_route_json(file_path: str, dataset: str, names: Sequence[str], coords: np.ndarray,
+                     distance: float, is_geo: bool = False):
+    """
+    Rota em JSON: {"dataset", "distance", "n_stops", "is_geo", "stops": [{"order", "name", "c1", "c2"}]}.
+    As paradas seguem a ordem de visita, sem repetir a origem no fim.
+    """
+    stops = [{'order': i + 1, 'name': str(name), 'c1': c1, 'c2': c2}
+             for i, (name, (c1, c2)) in enumerate(zip(names, np.asarray(coords, dtype=np.float64).tolist()))]
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({'dataset': dataset, 'distance': float(distance), 'n_stops': len(stops),
+                   'is_geo': bool(is_geo), 'stops': stops}, f, ensure_ascii=False)
+
+
+def write_route_csv(file_path: str, names: Sequence[str], coords: np.ndarray, is_geo: bool = False):
+    """
+    Rota em CSV (order, name, lat/lon ou x/y), na ordem de visita.
+    Usa os mesmos nomes de coluna dos datasets, então o arquivo também é uma instância válida.
+    """
+    c1, c2 = ('lat', 'lon') if is_geo else ('x', 'y')
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['order', 'name', c1, c2])
+        for i, (name, (a, b)) in enumerate(zip(names, np.asarray(coords, dtype=np.float64).tolist())):
+            writer.writerow([i + 1, name, repr(a), repr(b)])
@@ -0,0 +1,102 @@
+import math
+import numpy as np
+from typing import List, Optional
+
+from .distance_matrix import EARTH_RADIUS_KM
+
+
+def project_coordinates(coords: np.ndarray, is_geo: bool) -> np.ndarray:
+    """
+    Converte coordenadas para um plano cartesiano.
+    Modo Geo: projeção equiretangular (km) centrada na latitude média;
+    Modo Euclidiano: coordenadas inalteradas.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if not is_geo:
+        return coords.copy()
+    lat = np.radians(coords[:, 0])
+    lon = np.radians(coords[:, 1])
+    lat0 = lat.mean() if len(lat) else 0.0
+    return np.column_stack((EARTH_RADIUS_KM * lon * math.cos(lat0), EARTH_RADIUS_KM * lat))
+
+
+class GridIndex:
+    """
+    Índice espacial em grade uniforme (~2 pontos por célula).
+    Suporta inserção/remoção dinâmica e consultas de vizinho mais próximo
+    e k-vizinhos por busca em anéis de células.
+    """
+    def __init__(self, points: np.ndarray, populate: bool = True, points_per_cell: float = 2.0):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        n = len(self.points)
+        lo = self.points.min(axis=0) if n else np.zeros(2)
+        hi = self.points.max(axis=0) if n else np.ones(2)
+        span = np.maximum(hi - lo, 1e-9)
+
+        cells_total = max(1.0, n / points_per_cell)
+        self.cell_size = float(max(math.sqrt(span[0] * span[1] / cells_total), span.max() / cells_total, 1e-9))
+        self.origin = lo
+        self.shape = (int(span[0] // self.cell_size) + 1, int(span[1] // self.cell_size) + 1)
+
+        cells = np.floor((self.points - lo) / self.cell_size).astype(np.int64)
+        self._cx = np.minimum(cells[:, 0], self.shape[0] - 1).tolist()
+        self._cy = np.minimum(cells[:, 1], self.shape[1] - 1).tolist()
+        self._cells: List[List[set]] = [[set() for _ in range(self.shape[1])] for _ in range(self.shape[0])]
+        self._xy = self.points.tolist()
+        self.size = 0
+        if populate:
+            for i in range(n):
+                self.insert(i)
+
+    def insert(self, i: int):
+        cell = self._cells[self._cx[i]][self._cy[i]]
+        if i not in cell:
+            cell.add(i)
+            self.size += 1
+
+    def remove(self, i: int):
+        cell = self._cells[self._cx[i]][self._cy[i]]
+        if i in cell:
+            cell.remove(i)
+            self.size -= 1
+
+    def _ring(self, cx: int, cy: int, r: int):
+        """Células no anel de Chebyshev de raio r em torno de (cx, cy)."""
+        nx, ny = self.shape
+        for x in range(max(0, cx - r), min(nx, cx + r + 1)):
+            if r == 0 or x == cx - r or x == cx + r:
+                ys = range(max(0, cy - r), min(ny, cy + r + 1))
+            else:
+                ys = [y for y in (cy - r, cy + r) if 0 <= y < ny]
+            for y in ys:
+                yield self._cells[x][y]
+
+    def k_nearest(self, i: int, k: int, exclude_self: bool = True) -> List[int]:
+        """k pontos indexados mais próximos do ponto i (ordenados por distância)."""
+        if self.size == 0:
+            return []
+        px, py = self._xy[i]
+        cx, cy = self._cx[i], self._cy[i]
+        max_r = max(self.shape)
+        found = []
+        r = 0
+        while r <= max_r:
+            for cell in self._ring(cx, cy, r):
+                for j in cell:
+                    if exclude_self and j == i:
+                        continue
+                    qx, qy = self._xy[j]
+                    found.append(((qx - px) ** 2 + (qy - py) ** 2, j))
+            # Pontos em anéis externos estão a pelo menos r * cell_size de distância
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= (r * self.cell_size) ** 2:
+                    break
+            r += 1
+        found.sort()
+        return [j for _, j in found[:k]]
+
+    def nearest(self, i: int) -> Optional[int]:
+        """Ponto indexado mais próximo do ponto i (excluindo o próprio), ou None se vazio."""
+        result = self.k_nearest(i, 1)
+        return result[0] if result else None
@@ -0,0 +1,143 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# EDGE_WEIGHT_TYPE suportados -> (métrica do DistanceMatrix, coordenadas geográficas?)
+EDGE_WEIGHT_TYPES = {
+    'EUC_2D': ('euc_2d', False),
+    'CEIL_2D': ('ceil_2d', False),
+    'ATT': ('att', False),
+    'GEO': ('geo', True),
+    'EXPLICIT': ('explicit', False),
+}
+
+# EDGE_WEIGHT_FORMAT de matrizes simétricas -> (triângulo, com diagonal?)
+# Formatos *_COL de uma matriz simétrica equivalem ao triângulo oposto lido por linhas.
+_MATRIX_FORMATS = {
+    'UPPER_ROW': ('upper', False), 'LOWER_COL': ('upper', False),
+    'LOWER_ROW': ('lower', False), 'UPPER_COL': ('lower', False),
+    'UPPER_DIAG_ROW': ('upper', True), 'LOWER_DIAG_COL': ('upper', True),
+    'LOWER_DIAG_ROW': ('lower', True), 'UPPER_DIAG_COL': ('lower', True),
+}
+
+_SECTIONS = ('NODE_COORD_SECTION', 'EDGE_WEIGHT_SECTION', 'DISPLAY_DATA_SECTION')
+
+
+def _split_sections(text: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Separa o arquivo em cabeçalho (CHAVE: valor) e blocos de dados brutos por seção."""
+    header: Dict[str, str] = {}
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0].isalpha():
+            key, _, value = stripped.partition(':')
+            key = key.strip().upper()
+            if key == 'EOF':
+                break
+            if key in _SECTIONS:
+                current = sections.setdefault(key, [])
+            elif key.endswith('_SECTION'):
+                # Seções não utilizadas (ex.: FIXED_EDGES_SECTION) são ignoradas
+                current = []
+            else:
+                header[key] = value.strip()
+                current = None
+        elif current is not None:
+            current.append(stripped)
+    return header, {key: ' '.join(lines) for key, lines in sections.items()}
+
+
+def _node_table(data: str, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Converte linhas 'id x y' em (ids, coords (n, 2))."""
+    table = np.array(data.split(), dtype=np.float64).reshape(-1, 3)
+    if len(table) != dimension:
+        raise ValueError(f"Esperados {dimension} nós, encontrados {len(table)}")
+    return table[:, 0].astype(np.int64), table[:, 1:].copy()
+
+
+def geo_to_degrees(coords: np.ndarray) -> np.ndarray:
+    """Converte coordenadas GEO do TSPLIB (GGG.MM, graus e minutos) para graus decimais."""
+    degrees = np.trunc(coords)
+    return degrees + (coords - degrees) * 100.0 / 60.0
+
+
+def explicit_matrix(data: str, dimension: int, weight_format: str) -> np.ndarray:
+    """Monta a matriz N×N simétrica de uma EDGE_WEIGHT_SECTION."""
+    values = np.array(data.split(), dtype=np.float64)
+    if weight_format == 'FULL_MATRIX':
+        if values.size != dimension * dimension:
+            raise ValueError(f"FULL_MATRIX com {values.size} valores para dimensão {dimension}")
+        return values.reshape(dimension, dimension)
+    if weight_format not in _MATRIX_FORMATS:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT não suportado: {weight_format}")
+
+    triangle, diagonal = _MATRIX_FORMATS[weight_format]
+    offset = 0 if diagonal else 1
+    rows, cols = (np.triu_indices(dimension, offset) if triangle == 'upper'
+                  else np.tril_indices(dimension, -offset))
+    if values.size != rows.size:
+        raise ValueError(f"{weight_format} com {values.size} valores, esperados {rows.size}")
+    matrix = np.zeros((dimension, dimension), dtype=np.float64)
+    matrix[rows, cols] = values
+    matrix[cols, rows] = values
+    return matrix
+
+
+def classical_mds(matrix: np.ndarray) -> np.ndarray:
+    """
+    Coordenadas 2D aproximadas de uma matriz de distâncias (MDS clássico).
+    Usadas só pelas heurísticas espaciais e gráficos quando o arquivo não traz coordenadas.
+    """
+    n = len(matrix)
+    squared = matrix.astype(np.float64) ** 2
+    centered = squared - squared.mean(axis=0) - squared.mean(axis=1)[:, None] + squared.mean()
+    eigenvalues, eigenvectors = np.linalg.eigh(-0.5 * centered)
+    top = np.argsort(eigenvalues)[::-1][:2]
+    coords = eigenvectors[:, top] * np.sqrt(np.maximum(eigenvalues[top], 0.0))
+    return coords if coords.shape[1] == 2 else np.zeros((n, 2))
+
+
+def parse_tsplib(text: str) -> Dict[str, object]:
+    """
+    Lê uma instância TSPLIB (.tsp) simétrica: EUC_2D, CEIL_2D, ATT, GEO e EXPLICIT.
+    Cada tipo usa a distância inteira da especificação TSPLIB (nint, teto, pseudo-
+    Euclidiana do ATT e a fórmula GEO), então os comprimentos das rotas são
+    comparáveis aos ótimos publicados. Os datasets CSV seguem sem arredondamento.
+    Retorna um dicionário com name, names, coords, is_geo, metric e matrix (ou None).
+    """
+    header, sections = _split_sections(text)
+    problem_type = header.get('TYPE', 'TSP').upper()
+    if problem_type != 'TSP':
+        raise ValueError(f"Tipo de problema não suportado: {problem_type}")
+    dimension = int(header['DIMENSION'])
+    weight_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D').upper()
+    if weight_type not in EDGE_WEIGHT_TYPES:
+        raise ValueError(f"EDGE_WEIGHT_TYPE não suportado: {weight_type}. "
+                         f"Opções: {', '.join(EDGE_WEIGHT_TYPES)}")
+    metric, is_geo = EDGE_WEIGHT_TYPES[weight_type]
+
+    matrix = None
+    if weight_type == 'EXPLICIT':
+        weight_format = header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX').upper()
+        matrix = explicit_matrix(sections.get('EDGE_WEIGHT_SECTION', ''), dimension, weight_format)
+        if 'DISPLAY_DATA_SECTION' in sections:
+            ids, coords = _node_table(sections['DISPLAY_DATA_SECTION'], dimension)
+        else:
+            ids, coords = np.arange(1, dimension + 1), classical_mds(matrix)
+    else:
+        if 'NODE_COORD_SECTION' not in sections:
+            raise ValueError("NODE_COORD_SECTION ausente")
+        ids, coords = _node_table(sections['NODE_COORD_SECTION'], dimension)
+        if is_geo:
+            coords = geo_to_degrees(coords)
+
+    return {
+        'name': header.get('NAME', ''),
+        'names': ids.astype(str),
+        'coords': coords,
+        'is_geo': is_geo,
+        'metric': metric,
+        'matrix': matrix,
+    }
@@ -1,20 +1,40 @@
-import matplotlib.pyplot as plt
-from typing import List
+import numpy as np
+from typing import List, Optional, Tuple
 
-def plot_evolution(history: List[float], filename: str = None, title: str = "Evolução da Fitness"):
+
+def downsample_history(history: List[float], max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduz o histórico a no máximo max_points pontos (gerações, distâncias):
+    cada ponto é o mínimo de um bloco de gerações, então nenhuma melhora some do gráfico.
+    """
+    values = np.asarray(history, dtype=np.float64)
+    if max_points <= 0 or len(values) <= max_points:
+        return np.arange(len(values)), values
+    starts = np.unique(np.linspace(0, len(values), max_points, endpoint=False).astype(np.int64))
+    return starts, np.minimum.reduceat(values, starts)
+
+
+def plot_evolution(history: List[float], filename: str = None, title: str = "Evolução da Fitness",
+                   max_points: Optional[int] = None):
     """
     Plota o gráfico de convergência (distância vs gerações).
+    Com max_points, históricos longos são reduzidos antes de desenhar.
     """
-    plt.figure(figsize=(10, 6))
-    plt.plot(history, 'b-', linewidth=2)
-    
-    plt.title(title)
-    plt.xlabel("Geração")
-    plt.ylabel("Melhor Distância (Menor é melhor)")
-    plt.grid(True, linestyle='--', alpha=0.5)
-    
+    # matplotlib só é importado quando algum gráfico é de fato gerado
+    import matplotlib.pyplot as plt
+
+    generations, distances = downsample_history(history, max_points or 0)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(generations, distances, 'b-', linewidth=2)
+
+    ax.set_title(title)
+    ax.set_xlabel("Geração")
+    ax.set_ylabel("Melhor Distância (Menor é melhor)")
+    ax.grid(True, linestyle='--', alpha=0.5)
+
     if filename:
-        plt.savefig(filename)
-        plt.close()
+        fig.savefig(filename)
+        plt.close(fig)
     else:
-        plt.show()
\ No newline at end of file
+        plt.show()
@@ -1,44 +1,93 @@
-import matplotlib.pyplot as plt
+import numpy as np
+from typing import Sequence
 from ..tsp.route import Route
 
-def plot_route(route: Route, filename: str = None, title: str = "Rota"):
+# Acima deste tamanho a rota é desenhada como LineCollection, sem marcadores por cidade
+LARGE_ROUTE = 1000
+# Máximo de nomes escritos no mapa (os demais são omitidos, espaçados ao longo da rota)
+MAX_LABELS = 60
+
+
+def label_positions(n: int, max_labels: int = MAX_LABELS) -> np.ndarray:
+    """Posições da rota que recebem rótulo: todas, ou max_labels espaçadas uniformemente."""
+    if max_labels <= 0:
+        return np.empty(0, dtype=np.int64)
+    if n <= max_labels:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_labels).astype(np.int64))
+
+
+def plot_tour(coords: np.ndarray, names: Sequence[str], filename: str = None, title: str = "Rota",
+              max_labels: int = MAX_LABELS):
     """
-    Plota a rota geográfica.
+    Plota uma rota dada por arrays: coords (n, 2) na ordem de visita (c1 = Lat/X, c2 = Lon/Y).
     Eixo X = Longitude
     Eixo Y = Latitude
+    Rotas grandes usam uma única LineCollection (colorida pela ordem de visita)
+    e só max_labels nomes, para que desenhar não custe mais que resolver.
     """
-    # Extrai coordenadas
-    lons = [city.lon for city in route.cities]
-    lats = [city.lat for city in route.cities]
-    
+    # matplotlib só é importado quando algum gráfico é de fato gerado
+    import matplotlib.pyplot as plt
+
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
     # Fecha o ciclo
-    lons.append(lons[0])
-    lats.append(lats[0])
-
-    plt.figure(figsize=(10, 6))
-    
-    # Plota a linha do trajeto
-    plt.plot(lons, lats, 'bo-', markersize=4, linewidth=1, alpha=0.7, label='Trajeto')
-    
+    lons = np.append(coords[:, 1], coords[0, 1])
+    lats = np.append(coords[:, 0], coords[0, 0])
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    if n > LARGE_ROUTE:
+        from matplotlib.collections import LineCollection
+        points = np.column_stack((lons, lats))
+        segments = np.stack((points[:-1], points[1:]), axis=1)
+        trajeto = LineCollection(segments, cmap='viridis', linewidths=0.6, label='Trajeto')
+        trajeto.set_array(np.arange(n))
+        ax.add_collection(trajeto)
+        fig.colorbar(trajeto, ax=ax, label='Ordem de visita')
+        ax.autoscale()
+    else:
+        # Plota a linha do trajeto
+        ax.plot(lons, lats, 'bo-', markersize=4, linewidth=1, alpha=0.7, label='Trajeto')
+
     # Destaca o início (Vermelho)
-    plt.plot(lons[0], lats[0], 'rs', markersize=8, label='Início')
-
-    # Adiciona nomes das cidades no gráfico
-    for city in route.cities:
-        plt.annotate(city.name, (city.lon, city.lat), 
-                     textcoords="offset points", xytext=(0,5), ha='center', fontsize=8)
-
-    plt.title(title)
-    plt.xlabel("Longitude (Graus)")
-    plt.ylabel("Latitude (Graus)")
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.legend()
-    
+    ax.plot(lons[0], lats[0], 'rs', markersize=8, label='Início')
+
+    # Adiciona nomes das cidades no gráfico (decimados em rotas grandes)
+    for i in label_positions(n, max_labels).tolist():
+        ax.annotate(str(names[i]), (lons[i], lats[i]),
+                    textcoords="offset points", xytext=(0, 5), ha='center', fontsize=8)
+
+    ax.set_title(title)
+    ax.set_xlabel("Longitude (Graus)")
+    ax.set_ylabel("Latitude (Graus)")
+    ax.grid(True, linestyle='--', alpha=0.5)
+    ax.legend()
+
     # Ajusta proporção para não distorcer o mapa geograficamente
-    plt.axis('equal') 
+    ax.axis('equal')
 
     if filename:
-        plt.savefig(filename)
-        plt.close()
+        fig.savefig(filename)
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def route_arrays(route: Route):
+    """(coords (n, 2), nomes) da rota na ordem de visita, sem recriar objetos City quando possível."""
+    if route.indices is not None and route.distance_matrix is not None:
+        coords = np.asarray(route.distance_matrix.coords)[route.indices]
     else:
-        plt.show()
\ No newline at end of file
+        coords = np.array([(city.c1, city.c2) for city in route.cities], dtype=np.float64)
+    return coords, [city.name for city in route.cities]
+
+
+def plot_route(route: Route, filename: str = None, title: str = "Rota", max_labels: int = MAX_LABELS):
+    """
+    Plota a rota geográfica.
+    Eixo X = Longitude
+    Eixo Y = Latitude
+    """
+    coords, names = route_arrays(route)
+    plot_tour(coords, names, filename=filename, title=title, max_labels=max_labels)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Mesmo esquema dos scripts (src/main.py, benchmarks/): o pacote é importado como src.*
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pytest
+
+from src import batch
+from src.batch import discover_instances, run_batch
+
+GA_PARAMS = {'pop_size': 20, 'seeding_ratio': 0.1}
+_solve_instance = batch.solve_instance
+
+
+def _write_instance(path, size: int, seed: int):
+    coords = np.random.default_rng(seed).random((size, 2)) * 100.0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("id,x,y\n")
+        f.writelines(f"{i},{x:.3f},{y:.3f}\n" for i, (x, y) in enumerate(coords, start=1))
+
+
+@pytest.fixture
+def instances(tmp_path):
+    for i, size in enumerate((12, 15, 18)):
+        _write_instance(tmp_path / f"rota_{i}.csv", size, seed=i)
+    (tmp_path / 'notas.txt').write_text('ignorado', encoding='utf-8')
+    return tmp_path
+
+
+def _crashing_solve(job, *args):
+    """Simula um worker morto pelo sistema (OOM/segfault) na instância 'crash'."""
+    if 'crash' in os.path.basename(job['path']):
+        os._exit(1)
+    return _solve_instance(job, *args)
+
+
+def test_discover_folder_and_manifest(instances):
+    jobs = discover_instances(str(instances))
+    assert [os.path.basename(job['path']) for job in jobs] == ['rota_0.csv', 'rota_1.csv', 'rota_2.csv']
+
+    manifest = instances / 'lote.jsonl'
+    manifest.write_text('# comentário\nrota_0.csv\n\n{"path": "rota_1.csv", "generations": 3}\n', encoding='utf-8')
+    jobs = discover_instances(str(manifest))
+    assert jobs == [{'path': str(instances / 'rota_0.csv')},
+                    {'path': str(instances / 'rota_1.csv'), 'generations': 3}]
+
+
+def test_results_do_not_depend_on_workers(instances):
+    jobs = discover_instances(str(instances))
+    runs = []
+    for workers in (1, 2):
+        results = {r['instance']: r for r in run_batch(jobs, GA_PARAMS, generations=10, workers=workers, seed=7)}
+        runs.append(results)
+    assert set(runs[0]) == {'rota_0', 'rota_1', 'rota_2'}
+    for name, result in runs[0].items():
+        assert result['status'] == 'ok'
+        assert sorted(result['route'], key=int) == [str(i) for i in range(1, result['n_cities'] + 1)]
+        # A instância i usa sempre o i-ésimo fluxo da semente
+        assert result['route'] == runs[1][name]['route']
+        assert result['distance'] == runs[1][name]['distance']
+    other_seed = {r['instance']: r['route'] for r in run_batch(jobs, GA_PARAMS, generations=10, workers=1, seed=8)}
+    assert any(other_seed[name] != runs[0][name]['route'] for name in other_seed)
+
+
+def test_invalid_instance_becomes_error_record(instances):
+    (instances / 'quebrado.csv').write_text('id,x\n1,2\n', encoding='utf-8')
+    results = list(run_batch([{'path': str(instances / 'quebrado.csv')}], GA_PARAMS, generations=5, workers=1))
+    assert results[0]['status'] == 'error' and results[0]['instance'] == 'quebrado'
+
+
+def test_worker_crash_only_fails_its_instance(instances, monkeypatch):
+    _write_instance(instances / 'crash.csv', 10, seed=9)
+    monkeypatch.setattr(batch, 'solve_instance', _crashing_solve)
+    jobs = discover_instances(str(instances))
+
+    results = {r['instance']: r for r in run_batch(jobs, GA_PARAMS, generations=5, workers=2, seed=1)}
+    assert set(results) == {'crash', 'rota_0', 'rota_1', 'rota_2'}
+    assert results['crash']['status'] == 'error'
+    assert 'encerrado inesperadamente' in results['crash']['error']
+    assert all(results[name]['status'] == 'ok' for name in ('rota_0', 'rota_1', 'rota_2'))
@@ -0,0 +1,94 @@
+import json
+import os
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import LazyCities
+from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.ga.checkpoint import save_checkpoint, load_checkpoint, restore_checkpoint, instance_fingerprint, STATE_FILE
+
+N = 25
+
+
+def _matrix(seed: int = 0, **kwargs) -> DistanceMatrix:
+    coords = np.random.default_rng(seed).random((N, 2)) * 100.0
+    return DistanceMatrix.from_cities(LazyCities(np.arange(N).astype(str), coords), **kwargs)
+
+
+def _ga(distance_matrix: DistanceMatrix, seed: int) -> GeneticAlgorithm:
+    return GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=20, seed=seed)
+
+
+def test_round_trip_resumes_the_same_run(tmp_path):
+    distance_matrix = _matrix()
+    path = str(tmp_path / 'checkpoint')
+
+    ga = _ga(distance_matrix, seed=1)
+    ga.run(10, progress=False)
+    save_checkpoint(ga, path)
+    ga.run(10, progress=False)
+
+    resumed = _ga(distance_matrix, seed=99)
+    checkpoint = load_checkpoint(path)
+    assert isinstance(checkpoint['population'], np.memmap)
+    restore_checkpoint(resumed, checkpoint)
+    assert resumed.generation == 10
+    resumed.run(10, progress=False)
+
+    # Same generator state: the resumed run repeats the uninterrupted one exactly
+    np.testing.assert_array_equal(resumed.population, ga.population)
+    np.testing.assert_array_equal(resumed.fitness, ga.fitness)
+    assert resumed.history == ga.history
+    assert resumed.evaluations == ga.evaluations
+    assert resumed.rng.random() == ga.rng.random()
+
+
+def test_save_replaces_previous_checkpoint(tmp_path):
+    path = str(tmp_path / 'checkpoint')
+    ga = _ga(_matrix(), seed=1)
+    save_checkpoint(ga, path)
+    ga.run(3, progress=False)
+    save_checkpoint(ga, path)
+    assert load_checkpoint(path)['generation'] == 3
+    assert sorted(os.listdir(tmp_path)) == ['checkpoint']
+
+
+@pytest.mark.parametrize('other', (
+    lambda: _matrix(seed=1),                  # other coordinates
+    lambda: _matrix(metric='att'),            # same coordinates, another metric
+))
+def test_restore_rejects_another_instance(tmp_path, other):
+    path = str(tmp_path / 'checkpoint')
+    save_checkpoint(_ga(_matrix(), seed=1), path)
+    with pytest.raises(ValueError, match='different instance'):
+        restore_checkpoint(_ga(other(), seed=1), load_checkpoint(path))
+
+
+def test_explicit_fingerprint_covers_the_matrix():
+    coords = np.zeros((N, 2))
+    matrix = _matrix().matrix
+    same = DistanceMatrix(coords, matrix=matrix.copy())
+    other = DistanceMatrix(coords, matrix=matrix * 2)
+    assert instance_fingerprint(same) == instance_fingerprint(DistanceMatrix(coords, matrix=matrix))
+    assert instance_fingerprint(same) != instance_fingerprint(other)
+
+
+def test_restore_rejects_missing_generator_state_and_shape(tmp_path):
+    distance_matrix = _matrix()
+    path = str(tmp_path / 'checkpoint')
+    save_checkpoint(_ga(distance_matrix, seed=1), path)
+    with pytest.raises(ValueError, match='does not match'):
+        restore_checkpoint(GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=10, seed=1),
+                           load_checkpoint(path))
+
+    state_path = os.path.join(path, STATE_FILE)
+    with open(state_path, encoding='utf-8') as f:
+        state = json.load(f)
+    del state['rng']
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    with pytest.raises(ValueError, match='generator state'):
+        restore_checkpoint(_ga(distance_matrix, seed=1), load_checkpoint(path))
+    with pytest.raises(FileNotFoundError):
+        load_checkpoint(str(tmp_path / 'missing'))
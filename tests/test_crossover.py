@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.ga.crossover import (CROSSOVERS, ordered_crossover, cycle_crossover, ox1_child, cx_child,
+                              batch_ordered_crossover, batch_cycle_crossover, batch_pmx_crossover)
+
+SIZES = (5, 12, 51)
+
+
+def _parents(size: int, pairs: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    parents1 = np.array([rng.permutation(size) for _ in range(pairs)])
+    parents2 = np.array([rng.permutation(size) for _ in range(pairs)])
+    return parents1, parents2
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_ox1_matches_reference(size):
+    parents1, parents2 = _parents(size, 20)
+    starts, ends = [], []
+    expected1, expected2 = [], []
+    for i, (p1, p2) in enumerate(zip(parents1, parents2)):
+        # The reference draws its cut points itself: replay the same draw to fix them
+        start, end = sorted(np.random.default_rng(i).choice(size, size=2, replace=False).tolist())
+        child1, child2 = ordered_crossover(p1.tolist(), p2.tolist(), np.random.default_rng(i))
+        assert ox1_child(p1, p2, start, end).tolist() == child1
+        assert ox1_child(p2, p1, start, end).tolist() == child2
+        starts.append(start)
+        ends.append(end)
+        expected1.append(child1)
+        expected2.append(child2)
+
+    children1, children2 = batch_ordered_crossover(parents1, parents2, np.array(starts), np.array(ends))
+    assert children1.tolist() == expected1
+    assert children2.tolist() == expected2
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_ox1_full_and_empty_segments(size):
+    parents1, parents2 = _parents(size, 1)
+    p1, p2 = parents1[0], parents2[0]
+    assert ox1_child(p1, p2, 0, size).tolist() == p1.tolist()
+    assert ox1_child(p1, p2, 3, 3).tolist() == p2.tolist()
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_cx_matches_reference(size):
+    parents1, parents2 = _parents(size, 20, seed=1)
+    children1, children2 = batch_cycle_crossover(parents1, parents2)
+    for p1, p2, batch1, batch2 in zip(parents1, parents2, children1, children2):
+        child1, child2 = cycle_crossover(p1.tolist(), p2.tolist())
+        assert cx_child(p1, p2).tolist() == child1
+        assert cx_child(p2, p1).tolist() == child2
+        assert batch1.tolist() == child1
+        assert batch2.tolist() == child2
+
+
+def _edges(tour) -> set:
+    return {frozenset((int(a), int(b))) for a, b in zip(tour, np.roll(tour, -1))}
+
+
+def _instance(size: int) -> DistanceMatrix:
+    return DistanceMatrix(np.random.default_rng(size).random((size, 2)) * 100.0)
+
+
+@pytest.mark.parametrize('size', (2, 3, 4, 5, 6, 7, 10, 23, 60))
+@pytest.mark.parametrize('name', list(CROSSOVERS))
+def test_every_crossover_returns_permutations(name, size):
+    parents1, parents2 = _parents(size, 12, seed=size)
+    children1, children2 = CROSSOVERS[name](parents1, parents2, _instance(size), np.random.default_rng(0))
+    for children in (children1, children2):
+        assert children.shape == parents1.shape and children.dtype == parents1.dtype
+        assert all(sorted(child) == list(range(size)) for child in children.tolist())
+
+
+@pytest.mark.parametrize('size', (10, 51))
+def test_pmx_keeps_segment_and_secondary_positions(size):
+    parents1, parents2 = _parents(size, 20, seed=3)
+    starts, ends = np.full(20, 2), np.full(20, size - 4)
+    children1, _ = batch_pmx_crossover(parents1, parents2, starts, ends)
+    for p1, p2, child in zip(parents1, parents2, children1):
+        assert child[2:size - 4].tolist() == p1[2:size - 4].tolist()
+        # Outside the segment, every gene of p2 that does not clash with it keeps its position
+        segment = set(p1[2:size - 4].tolist())
+        for i in list(range(2)) + list(range(size - 4, size)):
+            if p2[i] not in segment:
+                assert child[i] == p2[i]
+
+
+@pytest.mark.parametrize('name', ('erx', 'eax'))
+def test_edge_crossovers_copy_identical_parents(name):
+    parents, _ = _parents(30, 5, seed=4)
+    children1, children2 = CROSSOVERS[name](parents, parents.copy(), _instance(30), np.random.default_rng(0))
+    for parent, child1, child2 in zip(parents, children1, children2):
+        assert _edges(child1) == _edges(parent) == _edges(child2)
+
+
+@pytest.mark.parametrize('name', ('erx', 'eax'))
+def test_edge_crossovers_only_use_parent_edges_for_close_parents(name):
+    size = 40
+    distance_matrix = _instance(size)
+    rng = np.random.default_rng(5)
+    for k in range(30):
+        # Parents one 2-opt move apart: the child needs no edge outside the union
+        p1 = rng.permutation(size)
+        p2 = p1.copy()
+        i, j = sorted(rng.choice(size, size=2, replace=False).tolist())
+        p2[i:j + 1] = p2[i:j + 1][::-1]
+        children1, children2 = CROSSOVERS[name](p1[None], p2[None], distance_matrix, np.random.default_rng(k))
+        parent_edges = _edges(p1) | _edges(p2)
+        assert _edges(children1[0]) <= parent_edges
+        assert _edges(children2[0]) <= parent_edges
+
+
+@pytest.mark.parametrize('name', ('erx', 'eax'))
+def test_edge_crossovers_mostly_inherit_edges(name):
+    size = 60
+    parents1, parents2 = _parents(size, 30, seed=6)
+    children1, children2 = CROSSOVERS[name](parents1, parents2, _instance(size), np.random.default_rng(1))
+    inherited = [len(_edges(c) & (_edges(a) | _edges(b))) / size
+                 for children in (children1, children2) for c, a, b in zip(children, parents1, parents2)]
+    # New edges only come from ERX dead ends or EAX subtour merges
+    assert np.mean(inherited) >= 0.9
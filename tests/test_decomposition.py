@@ -0,0 +1,130 @@
+import time
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import LazyCities
+from src.ga.decomposition import (ClusterSolver, partition_clusters, kmeans_partition, grid_partition,
+                                  improve_path)
+from src.ga.termination import Termination, Stagnation, TargetDistance
+
+N = 300
+
+
+def _coords(n: int = N, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).random((n, 2)) * 1000.0
+
+
+def _solver(n: int = N, **kwargs) -> ClusterSolver:
+    cities = LazyCities(np.arange(n).astype(str), _coords(n))
+    distance_matrix = DistanceMatrix.from_cities(cities, max_memory_mb=0)
+    params = dict(cluster_size=40, workers=1, seed=0, pop_size=20, outer_generations=20)
+    params.update(kwargs)
+    return ClusterSolver(None, distance_matrix=distance_matrix, **params)
+
+
+def _assert_partition(clusters, n: int):
+    members = np.concatenate(clusters)
+    assert len(members) == n
+    assert sorted(members.tolist()) == list(range(n))
+    assert all(len(cluster) > 0 for cluster in clusters)
+
+
+@pytest.mark.parametrize('method', ('kmeans', 'grid'))
+@pytest.mark.parametrize('cluster_size', (7, 40, 500))
+def test_partition_covers_every_stop_once(method, cluster_size):
+    clusters = partition_clusters(_coords(), False, cluster_size, method, rng=0)
+    _assert_partition(clusters, N)
+    # k-means splits clusters above twice the target; the grid is balanced
+    limit = 2 * cluster_size if method == 'kmeans' else cluster_size
+    assert max(len(cluster) for cluster in clusters) <= max(limit, 1)
+
+
+def test_partition_handles_geo_coordinates():
+    coords = np.column_stack((np.linspace(-23.0, -22.0, 120), np.linspace(-47.0, -46.0, 120)))
+    _assert_partition(partition_clusters(coords, True, 30, 'kmeans', rng=1), 120)
+
+
+def test_kmeans_and_grid_partitions():
+    points = _coords(200)
+    _assert_partition(kmeans_partition(points, 5, rng=0), 200)
+    _assert_partition(kmeans_partition(points[:3], 10, rng=0), 3)
+    cells = grid_partition(points, 25)
+    _assert_partition(cells, 200)
+    assert max(len(cell) for cell in cells) <= 25
+
+
+def test_unknown_partition_method():
+    with pytest.raises(ValueError):
+        partition_clusters(_coords(), False, 10, 'voronoi')
+    with pytest.raises(ValueError):
+        _solver(partition='voronoi')
+
+
+def test_improve_path_keeps_endpoints():
+    distance_matrix = DistanceMatrix(_coords(40))
+    path = np.random.default_rng(2).permutation(40).astype(np.int32)
+    improved = improve_path(path.copy(), distance_matrix)
+    assert improved[0] == path[0] and improved[-1] == path[-1]
+    assert sorted(improved.tolist()) == list(range(40))
+
+    def length(p):
+        return float(distance_matrix.pair_distances(p[:-1], p[1:]).sum())
+    assert length(improved) <= length(path) + 1e-9
+
+
+@pytest.mark.parametrize('partition', ('kmeans', 'grid'))
+def test_stitched_route_visits_every_stop_once(partition):
+    solver = _solver(partition=partition)
+    route, tours = solver.run(generations=10)
+    assert sorted(route.indices.tolist()) == list(range(N))
+    assert len(route.cities) == N
+    assert sorted(np.concatenate(tours).tolist()) == list(range(N))
+    assert route.distance == pytest.approx(solver.distance_matrix.tour_length(route.indices))
+    assert set(solver.timings) == {'partition', 'clusters', 'outer', 'stitch', 'seams'}
+
+
+def test_stitching_beats_a_random_tour():
+    solver = _solver()
+    route, _ = solver.run(generations=30)
+    random_tour = np.random.default_rng(0).permutation(N)
+    assert route.distance < 0.5 * solver.distance_matrix.tour_length(random_tour)
+
+
+def test_single_cluster_and_tiny_clusters():
+    route, tours = _solver(n=30, cluster_size=100).run(generations=5)
+    assert len(tours) == 1 and sorted(route.indices.tolist()) == list(range(30))
+    route, _ = _solver(n=25, cluster_size=4, partition='grid').run(generations=5)
+    assert sorted(route.indices.tolist()) == list(range(25))
+
+
+def test_parallel_workers_give_the_same_route():
+    sequential, _ = _solver(workers=1).run(generations=5)
+    parallel, _ = _solver(workers=2).run(generations=5)
+    np.testing.assert_array_equal(sequential.indices, parallel.indices)
+
+
+@pytest.mark.parametrize('workers', (1, 2))
+def test_time_limit_bounds_the_whole_run(workers):
+    # Generous generation count: without a global deadline every cluster
+    # (8 of them) would spend the full time_limit
+    solver = _solver(n=320, workers=workers)
+    start = time.perf_counter()
+    route, _ = solver.run(generations=100_000, time_limit=1.0)
+    elapsed = time.perf_counter() - start
+    assert sorted(route.indices.tolist()) == list(range(320))
+    assert elapsed < 2.5
+
+
+def test_each_cluster_gets_its_own_termination():
+    termination = Termination([Stagnation(5), TargetDistance(1e9)], restarts=1)
+    copy = ClusterSolver._cluster_termination(termination)
+    # The full-tour target is dropped and stateful criteria are not shared
+    assert [type(c) for c in copy.criteria] == [Stagnation]
+    assert copy.criteria[0] is not termination.criteria[0] and copy.restarts == 1
+    assert ClusterSolver._cluster_termination(Termination([TargetDistance(1.0)])) is None
+    assert ClusterSolver._cluster_termination(None) is None
+
+    route, _ = _solver().run(generations=100_000, termination=termination)
+    assert sorted(route.indices.tolist()) == list(range(N))
+    assert termination.restarts_done == 0
@@ -0,0 +1,104 @@
+import math
+import numpy as np
+import pytest
+
+from src.tsp.city import City
+from src.tsp.route import Route
+from src.tsp.distance_matrix import DistanceMatrix, KERNELS
+
+N = 40
+
+
+def _coords(metric: str, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    if metric in ('haversine', 'geo'):
+        # Latitude/longitude em graus (Brasil e arredores)
+        return np.column_stack((rng.uniform(-33, 5, N), rng.uniform(-73, -35, N)))
+    return rng.random((N, 2)) * 1000.0
+
+
+def _tsplib_geo(a, b) -> float:
+    """Fórmula GEO escalar, como no código de referência do TSPLIB."""
+    pi, rrr = 3.141592, 6378.388
+    lat1, lon1, lat2, lon2 = (pi * v / 180.0 for v in (*a, *b))
+    q1, q2, q3 = math.cos(lon1 - lon2), math.cos(lat1 - lat2), math.cos(lat1 + lat2)
+    angle = math.acos(max(-1.0, min(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3))))
+    return float(int(rrr * angle + 1.0)) if angle > 0 else 0.0
+
+
+def _tsplib_att(a, b) -> float:
+    r = math.dist(a, b) / math.sqrt(10.0)
+    t = int(r + 0.5)
+    return float(t + 1 if t < r else t)
+
+
+# Distância escalar de referência de cada métrica
+REFERENCE = {
+    'euclidean': lambda a, b: City('a', *a).distance_to(City('b', *b)),
+    'haversine': lambda a, b: City('a', *a, is_geo=True).distance_to(City('b', *b, is_geo=True)),
+    'euc_2d': lambda a, b: float(int(math.dist(a, b) + 0.5)),
+    'ceil_2d': lambda a, b: float(math.ceil(math.dist(a, b))),
+    'att': _tsplib_att,
+    'geo': _tsplib_geo,
+}
+
+
+def test_every_kernel_has_a_reference():
+    assert set(REFERENCE) == set(KERNELS)
+
+
+@pytest.mark.parametrize('metric', list(KERNELS))
+def test_full_and_row_cache_match_reference(metric):
+    coords = _coords(metric)
+    full = DistanceMatrix(coords, is_geo=metric in ('haversine', 'geo'), metric=metric)
+    lazy = DistanceMatrix(coords, is_geo=metric in ('haversine', 'geo'), metric=metric, max_memory_mb=0)
+    assert full.is_full and not lazy.is_full
+
+    expected = np.array([[REFERENCE[metric](a, b) for b in coords.tolist()] for a in coords.tolist()])
+    np.testing.assert_allclose(full.matrix, expected, rtol=1e-9, atol=1e-9)
+    for i in range(N):
+        np.testing.assert_allclose(lazy.row(i), expected[i], rtol=1e-9, atol=1e-9)
+
+    tour = np.random.default_rng(1).permutation(N)
+    nxt = np.roll(tour, -1)
+    assert full.tour_length(tour) == pytest.approx(expected[tour, nxt].sum())
+    assert lazy.tour_length(tour) == pytest.approx(full.tour_length(tour))
+    np.testing.assert_allclose(lazy.pair_distances(tour, nxt), full.pair_distances(tour, nxt))
+    np.testing.assert_allclose(lazy.block(tour[:5], tour[5:12]), full.block(tour[:5], tour[5:12]))
+
+
+@pytest.mark.parametrize('is_geo', (False, True))
+def test_route_uses_the_same_distances_as_city(is_geo):
+    coords = _coords('haversine' if is_geo else 'euclidean')
+    cities = [City(str(i), c1, c2, is_geo) for i, (c1, c2) in enumerate(coords.tolist())]
+    tour = np.random.default_rng(2).permutation(N)
+    ordered = [cities[i] for i in tour]
+
+    plain = Route(ordered).distance
+    for max_memory_mb in (512.0, 0):
+        distance_matrix = DistanceMatrix.from_cities(cities, max_memory_mb=max_memory_mb)
+        assert Route(ordered, distance_matrix).distance == pytest.approx(plain)
+        assert Route.from_indices(tour, distance_matrix).distance == pytest.approx(plain)
+
+
+def test_row_cache_is_lru_and_bounded():
+    distance_matrix = DistanceMatrix(_coords('euclidean'), max_memory_mb=0, cache_rows=2)
+    distance_matrix.row(0)
+    distance_matrix.row(1)
+    distance_matrix.row(0)          # acerto: a linha 1 passa a ser a menos usada
+    distance_matrix.row(2)          # descarta a linha 1
+    distance_matrix.row(1)          # nova falta
+    info = distance_matrix.cache_info()
+    assert (info['hits'], info['misses'], info['cached_rows']) == (1, 4, 2)
+    assert list(distance_matrix._row_cache) == [2, 1]
+
+
+def test_matrix_from_shared_buffer_is_used_as_is():
+    coords = _coords('euclidean')
+    matrix = DistanceMatrix(coords).matrix.astype(np.float32)
+    attached = DistanceMatrix(coords, matrix=matrix, metric='euclidean')
+    assert attached.matrix is matrix and attached.dtype == np.float32
+    with pytest.raises(ValueError):
+        DistanceMatrix(coords, metric='explicit')
+    with pytest.raises(ValueError):
+        DistanceMatrix(coords, metric='manhattan')
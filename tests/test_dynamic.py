@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from src.tsp.changes import StopChange
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import LazyCities
+from src.ga.genetic_algorithm import GeneticAlgorithm
+
+N = 12
+POP_SIZE = 16
+
+
+def _ga(max_memory_mb=None) -> GeneticAlgorithm:
+    coords = np.random.default_rng(0).random((N, 2)) * 100.0
+    names = np.array([f"S{i}" for i in range(N)], dtype=object)
+    kwargs = {} if max_memory_mb is None else {'max_memory_mb': max_memory_mb}
+    distance_matrix = DistanceMatrix.from_cities(LazyCities(names, coords), **kwargs)
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=POP_SIZE, seed=0)
+    ga.run(3, progress=False)
+    return ga
+
+
+def _assert_consistent(ga: GeneticAlgorithm, size: int):
+    assert ga.n_cities == len(ga.distance_matrix) == size
+    assert ga.population.shape == (POP_SIZE, size)
+    for tour, distance in zip(ga.population, ga.fitness):
+        assert sorted(tour.tolist()) == list(range(size))
+        assert distance == pytest.approx(ga.distance_matrix.tour_length(tour))
+
+
+def _names(ga: GeneticAlgorithm) -> list:
+    return [str(name) for name in ga.distance_matrix.cities.names]
+
+
+@pytest.mark.parametrize('max_memory_mb', (None, 0))
+def test_add_remove_move_keep_valid_population(max_memory_mb):
+    ga = _ga(max_memory_mb)
+    added = ga.add_stops([(5.0, 5.0), (95.0, 95.0)], ['A', 'B'])
+    assert added.tolist() == [N, N + 1]
+    _assert_consistent(ga, N + 2)
+
+    mapping = ga.remove_stops([0, 3])
+    assert mapping[[0, 3]].tolist() == [-1, -1] and mapping[1] == 0
+    _assert_consistent(ga, N)
+
+    ga.move_stops([1, 4], [(50.0, 50.0), (0.0, 100.0)])
+    _assert_consistent(ga, N)
+    np.testing.assert_array_equal(ga.distance_matrix.coords[[1, 4]], [[50.0, 50.0], [0.0, 100.0]])
+
+    ga.run(3, progress=False)
+    _assert_consistent(ga, N)
+
+
+def test_apply_changes_by_name():
+    ga = _ga()
+    history = len(ga.history)
+    ga.apply_changes([StopChange('remove', 'S2'), StopChange('move', 'S5', 1.0, 2.0),
+                      StopChange('add', 'New', 3.0, 4.0)])
+    _assert_consistent(ga, N)
+    names = _names(ga)
+    assert 'S2' not in names and names[-1] == 'New'
+    np.testing.assert_array_equal(ga.distance_matrix.coords[names.index('S5')], [1.0, 2.0])
+    # One batch, one baseline entry
+    assert len(ga.history) == history + 1
+    assert ga.history[-1] == pytest.approx(ga.fitness.min())
+
+
+@pytest.mark.parametrize('indices', ([2, 2], [1, 5, 1], [N], [-1]))
+def test_move_and_remove_reject_bad_indices(indices):
+    ga = _ga()
+    population = ga.population.copy()
+    with pytest.raises(ValueError):
+        ga.move_stops(indices, [(1.0, 1.0)] * len(indices))
+    with pytest.raises(ValueError):
+        ga.remove_stops(indices)
+    assert len(ga.distance_matrix) == N
+    np.testing.assert_array_equal(ga.population, population)
+
+
+@pytest.mark.parametrize('changes', [
+    [StopChange('add', 'X', 1.0, 1.0), StopChange('add', 'X', 2.0, 2.0)],
+    [StopChange('add', 'S1', 1.0, 1.0)],
+    [StopChange('move', 'S1', 1.0, 1.0), StopChange('move', 'S1', 2.0, 2.0)],
+    [StopChange('remove', 'S1'), StopChange('move', 'S1', 2.0, 2.0)],
+    [StopChange('remove', 'S1'), StopChange('remove', 'Missing')],
+])
+def test_apply_changes_rejects_invalid_batches_untouched(changes):
+    ga = _ga()
+    population, history = ga.population.copy(), list(ga.history)
+    with pytest.raises(ValueError):
+        ga.apply_changes(changes)
+    assert _names(ga) == [f"S{i}" for i in range(N)]
+    np.testing.assert_array_equal(ga.population, population)
+    assert ga.history == history
+
+
+def test_add_stops_rejects_duplicate_names():
+    ga = _ga()
+    with pytest.raises(ValueError):
+        ga.add_stops([(1.0, 1.0), (2.0, 2.0)], ['Y', 'Y'])
+    with pytest.raises(ValueError):
+        ga.add_stops([(1.0, 1.0)], ['S0'])
+    assert len(ga.distance_matrix) == N
+
+
+def test_reoptimize_continues_from_repaired_population():
+    ga = _ga()
+    route, history = ga.reoptimize([StopChange('add', 'Late', 50.0, 50.0)], generations=5)
+    assert len(route.cities) == N + 1
+    assert history[-1] == pytest.approx(route.distance)
+    assert {city.name for city in route.cities} == set(_names(ga))
+    _assert_consistent(ga, N + 1)
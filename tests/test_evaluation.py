@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.ga.evaluation import BatchEvaluator
+
+
+def _population(n_cities: int, size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.array([rng.permutation(n_cities) for _ in range(size)], dtype=np.int32)
+
+
+@pytest.mark.parametrize('max_memory_mb', (512.0, 0))
+def test_batch_matches_tour_length(max_memory_mb):
+    coords = np.random.default_rng(0).random((30, 2)) * 100.0
+    distance_matrix = DistanceMatrix(coords, max_memory_mb=max_memory_mb)
+    population = _population(30, 25)
+    evaluate = BatchEvaluator(distance_matrix)
+
+    distances = evaluate(population)
+    expected = [distance_matrix.tour_length(tour) for tour in population]
+    np.testing.assert_allclose(distances, expected, rtol=1e-12)
+    assert evaluate.evaluations == 25
+    # A single tour is evaluated as a one-row population
+    assert evaluate(population[0])[0] == pytest.approx(expected[0])
+    assert evaluate.evaluations == 26
+
+
+def test_chunked_gather_matches_single_pass(monkeypatch):
+    distance_matrix = DistanceMatrix(np.random.default_rng(1).random((20, 2)))
+    population = _population(20, 50, seed=1)
+    expected = BatchEvaluator(distance_matrix)(population)
+    # 3 tours per chunk: several chunks plus a partial one
+    monkeypatch.setattr(BatchEvaluator, 'CHUNK_ELEMENTS', 60)
+    np.testing.assert_array_equal(BatchEvaluator(distance_matrix)(population), expected)
+
+
+def test_float32_matrix_sums_in_float64():
+    distance_matrix = DistanceMatrix(np.random.default_rng(2).random((50, 2)) * 1e4, dtype=np.float32)
+    population = _population(50, 10, seed=2)
+    distances = BatchEvaluator(distance_matrix)(population)
+    assert distances.dtype == np.float64
+    np.testing.assert_allclose(distances, [distance_matrix.tour_length(t) for t in population], rtol=1e-9)
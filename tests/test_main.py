@@ -0,0 +1,64 @@
+import sys
+import json
+import numpy as np
+import pytest
+
+from src import main as cli
+
+
+def _write_instance(path, size: int = 30):
+    coords = np.random.default_rng(0).random((size, 2)) * 100.0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("id,x,y\n")
+        for i, (x, y) in enumerate(coords, start=1):
+            f.write(f"{i},{x:.3f},{y:.3f}\n")
+
+
+def test_events_survive_reoptimize(tmp_path, monkeypatch):
+    # Caminho absoluto: a rota exportada fica ao lado do dataset (tmp_path), não em routes/
+    dataset = tmp_path / 'dynamic.csv'
+    _write_instance(dataset)
+    changes = tmp_path / 'changes.jsonl'
+    changes.write_text('{"op": "add", "name": "novo", "x": 50.0, "y": 50.0}\n'
+                       '{"op": "remove", "name": "3"}\n', encoding='utf-8')
+    events = tmp_path / 'events.jsonl'
+
+    monkeypatch.setattr(sys, 'argv', [
+        'main.py', '--dataset', str(dataset), '--pop_size', '20', '--generations', '5', '--seed', '1',
+        '--plots', 'none', '--exports', 'json', '--events', str(events),
+        '--changes', str(changes), '--reopt_generations', '5',
+    ])
+    cli.main()
+
+    records = [json.loads(line) for line in events.read_text(encoding='utf-8').splitlines()]
+    kinds = [record['event'] for record in records]
+    # Uma execução e uma reotimização, cada uma com suas gerações e o resumo final
+    assert kinds.count('run_end') == 2
+    assert kinds.count('generation') == 10
+    assert kinds[-1] == 'run_end'
+
+    route = json.loads((tmp_path / 'dynamic_route.json').read_text(encoding='utf-8'))
+    assert 'novo' in json.dumps(route) and len(route['stops']) == 30
+
+
+@pytest.mark.parametrize('options', (
+    ['--islands', '2', '--resume'],
+    ['--islands', '2', '--warm_start', 'rota.txt'],
+    ['--cluster_size', '50', '--checkpoint_every', '10'],
+    ['--cluster_size', '50', '--resume'],
+))
+def test_single_population_options_are_rejected_in_other_modes(options, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['main.py', *options])
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main()
+    assert exit_info.value.code == 2
+    assert 'não são suportados' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('criterion', (['--stagnation', '20'], ['--max_evaluations', '1000'], ['--target', '400'],
+                                       ['--restarts', '2'], ['--diversity_threshold', '0.9']))
+def test_island_mode_rejects_termination_criteria(criterion, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--islands', '2', *criterion])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert 'critério de parada' in capsys.readouterr().err
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.ga.mutation import DELTA_MUTATIONS, MUTATION_DRAWS
+
+SIZES = (5, 9, 60)
+
+
+def _instance(size: int, seed: int = 0) -> DistanceMatrix:
+    return DistanceMatrix(np.random.default_rng(seed).random((size, 2)) * 100.0)
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('name', list(DELTA_MUTATIONS))
+def test_delta_matches_full_recompute(name, size):
+    distance_matrix = _instance(size)
+    rng = np.random.default_rng(1)
+    mutate = DELTA_MUTATIONS[name]
+    tour = rng.permutation(size)
+    for _ in range(200):
+        before = distance_matrix.tour_length(tour)
+        _, delta = mutate(tour, distance_matrix, rng.random(MUTATION_DRAWS).tolist())
+        assert sorted(tour.tolist()) == list(range(size))
+        assert distance_matrix.tour_length(tour) - before == pytest.approx(delta, abs=1e-9)
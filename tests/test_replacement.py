@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import LazyCities
+from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.ga.replacement import REPLACEMENT_STRATEGIES, top_k, worst_k, default_offspring_size
+
+N = 20
+POP_SIZE = 30
+
+
+def _matrix() -> DistanceMatrix:
+    coords = np.random.default_rng(0).random((N, 2)) * 100.0
+    return DistanceMatrix.from_cities(LazyCities(np.arange(N).astype(str), coords))
+
+
+@pytest.mark.parametrize('k', (0, 1, 5, 12, 20))
+def test_top_k_and_worst_k(k):
+    fitness = np.random.default_rng(k).random(12)
+    order = np.argsort(fitness)
+    assert top_k(fitness, k).tolist() == order[:min(k, 12)].tolist()
+    assert sorted(worst_k(fitness, k).tolist()) == sorted(order[len(order) - min(k, 12):].tolist())
+
+
+def test_top_k_is_stable_on_ties():
+    assert top_k(np.array([2.0, 1.0, 1.0, 0.5, 1.0]), 3).tolist() == [3, 1, 2]
+
+
+@pytest.mark.parametrize('elite_size', (1, 3))
+@pytest.mark.parametrize('strategy,offspring_size', [
+    ('generational', None),
+    ('steady_state', None),
+    ('steady_state', 7),
+    ('mu_plus_lambda', None),
+    ('mu_plus_lambda', 10),
+    ('mu_comma_lambda', None),
+    # λ below the population size: the elites fill the rest
+    ('mu_comma_lambda', 'smallest'),
+])
+def test_population_size_and_elitism(strategy, offspring_size, elite_size):
+    distance_matrix = _matrix()
+    if offspring_size == 'smallest':
+        offspring_size = POP_SIZE - elite_size
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=POP_SIZE, replacement=strategy,
+                          offspring_size=offspring_size, elite_size=elite_size, mutation_rate=0.3, seed=4)
+    for _ in range(15):
+        elites = np.sort(ga.fitness)[:elite_size]
+        ga._evolve()
+        assert ga.population.shape == (POP_SIZE, N)
+        assert ga.fitness.shape == (POP_SIZE,)
+        # The best elite_size tours (or better ones) survive every generation
+        assert np.all(np.sort(ga.fitness)[:elite_size] <= elites + 1e-9)
+        assert all(sorted(tour) == list(range(N)) for tour in ga.population.tolist())
+        np.testing.assert_allclose(ga.fitness, [distance_matrix.tour_length(t) for t in ga.population])
+
+
+def test_offspring_sizes():
+    assert default_offspring_size('generational', 50, 2) == 48
+    assert default_offspring_size('steady_state', 50, 2) == 5
+    assert default_offspring_size('mu_plus_lambda', 50, 2) == 50
+    assert default_offspring_size('mu_comma_lambda', 50, 2) == 100
+    ga = GeneticAlgorithm(None, distance_matrix=_matrix(), pop_size=POP_SIZE, offspring_size=5, seed=0)
+    # Generational replacement always fills the population with offspring
+    assert ga.offspring_size == POP_SIZE - 1
+
+
+def test_mu_comma_lambda_needs_enough_offspring():
+    with pytest.raises(ValueError, match='offspring_size'):
+        GeneticAlgorithm(None, distance_matrix=_matrix(), pop_size=POP_SIZE, replacement='mu_comma_lambda',
+                         offspring_size=POP_SIZE - 2, elite_size=1, seed=0)
+    with pytest.raises(ValueError, match='replacement'):
+        GeneticAlgorithm(None, distance_matrix=_matrix(), pop_size=POP_SIZE, replacement='tournament', seed=0)
+    assert set(REPLACEMENT_STRATEGIES) == {'generational', 'steady_state', 'mu_plus_lambda', 'mu_comma_lambda'}
@@ -0,0 +1,119 @@
+import os
+import json
+import signal
+import socket
+import threading
+import numpy as np
+import pytest
+
+from src.service.daemon import SolverDaemon
+from src.service.client import SolverClient
+
+N_STOPS = 25
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Daemon em processo, num socket temporário, com um dataset pequeno."""
+    coords = np.random.default_rng(0).random((N_STOPS, 2)) * 100.0
+    lines = ['id,x,y'] + [f"{i + 1},{x:.3f},{y:.3f}" for i, (x, y) in enumerate(coords)]
+    (tmp_path / 'pequeno.csv').write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    solver = SolverDaemon(str(tmp_path / 'evotsp.sock'), workers=1, cache_mb=64,
+                          datasets_dir=str(tmp_path), ga_params={'pop_size': 20},
+                          max_time_limit=10.0, stream_interval=0.0)
+    solver.start()
+    server = threading.Thread(target=solver.serve_forever, daemon=True)
+    server.start()
+    yield solver
+    solver.shutdown()
+    server.join(timeout=5)
+    solver.close()
+
+
+def _client(daemon: SolverDaemon) -> SolverClient:
+    return SolverClient(daemon.socket_path, timeout=30)
+
+
+def _solve(daemon: SolverDaemon, dataset: str = 'pequeno.csv', **options) -> list:
+    return list(_client(daemon).solve(dataset, **options))
+
+
+def test_ping_and_stats(daemon):
+    client = _client(daemon)
+    assert client.request({'op': 'ping'}) == {'event': 'pong'}
+    stats = client.stats()
+    assert stats['event'] == 'stats' and stats['workers'] == 1
+    assert (stats['requests'], stats['errors'], stats['running']) == (0, 0, 0)
+
+
+def test_solve_streams_events_and_reuses_cache(daemon):
+    first = _solve(daemon, time_limit=0.3, seed=1)
+    kinds = [event['event'] for event in first]
+    assert kinds[0] == 'accepted' and kinds[-1] == 'done'
+    assert 'improved' in kinds and set(kinds) == {'accepted', 'improved', 'done'}
+    accepted, done = first[0], first[-1]
+    assert accepted['cached'] is False and accepted['n_stops'] == N_STOPS and accepted['seed'] == 1
+    assert sorted(done['route'], key=int) == [str(i + 1) for i in range(N_STOPS)]
+    # Cada rota parcial melhora a anterior; a final é a melhor
+    distances = [event['distance'] for event in first if event['event'] == 'improved']
+    assert distances == sorted(distances, reverse=True)
+    assert done['distance'] <= distances[-1] + 1e-9
+
+    second = _solve(daemon, time_limit=0.2, seed=1, routes=False)
+    assert second[0]['cached'] is True
+    assert all('route' not in event for event in second if event['event'] == 'improved')
+    assert 'route' in second[-1]
+
+    stats = _client(daemon).stats()
+    assert (stats['requests'], stats['errors'], stats['running']) == (2, 0, 0)
+    assert stats['cache']['hits'] == 1 and stats['cache']['misses'] == 1
+
+
+def test_invalid_requests_count_as_errors(daemon):
+    missing = _solve(daemon, 'nao_existe.csv')
+    assert [event['event'] for event in missing] == ['error']
+
+    forbidden = _solve(daemon, time_limit=0.1, params={'distance_matrix': None})
+    assert forbidden[-1]['event'] == 'error' and 'não permitido' in forbidden[-1]['error']
+
+    assert _client(daemon).request({'op': 'desconhecida'})['event'] == 'error'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(daemon.socket_path)
+        sock.sendall(b"{nao e json\n")
+        with sock.makefile('r', encoding='utf-8') as reader:
+            assert 'JSON inválido' in json.loads(reader.readline())['error']
+
+    stats = _client(daemon).stats()
+    # Só as requisições de solve contam (a de dataset inexistente e a de parâmetro proibido)
+    assert (stats['requests'], stats['errors'], stats['running']) == (2, 2, 0)
+
+
+def test_cancel_frees_the_worker(daemon):
+    events = _client(daemon).solve('pequeno.csv', time_limit=10.0)
+    for event in events:
+        if event['event'] == 'improved':
+            break
+    # Interromper a iteração cancela a requisição; a próxima não espera os 10 s
+    events.close()
+    following = _solve(daemon, time_limit=0.2)
+    assert following[-1]['event'] == 'done'
+    assert following[-1]['elapsed_s'] < 5.0
+
+
+def test_killed_worker_is_reported_and_replaced(daemon):
+    killed = None
+    events = []
+    for event in _client(daemon).solve('pequeno.csv', time_limit=10.0):
+        events.append(event)
+        if event['event'] == 'improved' and killed is None:
+            killed = daemon._processes[0].pid
+            os.kill(killed, signal.SIGKILL)
+    assert events[-1]['event'] == 'error' and 'encerrado inesperadamente' in events[-1]['error']
+    assert daemon._processes[0].pid != killed
+    assert _client(daemon).stats()['errors'] == 1
+
+    # O worker substituto atende a próxima requisição
+    following = _solve(daemon, time_limit=0.2)
+    assert following[-1]['event'] == 'done'
+    assert _client(daemon).stats()['errors'] == 1
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.tsp.instance_loader import LazyCities
+from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.ga.termination import (Termination, TimeLimit, MaxEvaluations, Stagnation, TargetDistance,
+                                DiversityCollapse)
+
+
+def _state(best: float, generation: int = 0, evaluations: int = 0, population=None):
+    """Minimal stand-in for the GA attributes the criteria read."""
+    population = population if population is not None else np.arange(5)[None, :]
+    return SimpleNamespace(fitness=np.array([best, best + 1.0]), generation=generation,
+                           evaluations=evaluations, population=population, restarts=0)
+
+
+def _ga(**kwargs) -> GeneticAlgorithm:
+    coords = np.random.default_rng(0).random((8, 2)) * 100.0
+    distance_matrix = DistanceMatrix.from_cities(LazyCities(np.arange(8).astype(str), coords))
+    return GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=20, seed=3, **kwargs)
+
+
+def test_time_limit():
+    expired, running = TimeLimit(0.0), TimeLimit(60.0)
+    for criterion in (expired, running):
+        criterion.start(None)
+    assert expired.check(None) and not running.check(None)
+
+
+def test_max_evaluations_and_target():
+    assert not MaxEvaluations(100).check(_state(10.0, evaluations=99))
+    assert MaxEvaluations(100).check(_state(10.0, evaluations=100))
+    target = TargetDistance.from_gap(400.0, 5.0)
+    assert target.target == pytest.approx(420.0)
+    assert target.check(_state(420.0)) and not target.check(_state(420.5))
+
+
+def test_stagnation_window_and_tolerance():
+    criterion = Stagnation(window=3, tolerance=0.01)
+    criterion.start(_state(100.0))
+    assert not criterion.check(_state(99.5, generation=1))   # below the 1% tolerance: not an improvement
+    assert not criterion.check(_state(98.0, generation=2))   # improvement resets the window
+    assert not criterion.check(_state(98.0, generation=4))
+    assert criterion.check(_state(98.0, generation=5))
+
+
+def test_diversity_collapse():
+    clones = np.tile(np.arange(6), (4, 1))
+    mixed = np.array([np.random.default_rng(i).permutation(6) for i in range(4)])
+    criterion = DiversityCollapse(threshold=0.95, every=5)
+    assert criterion.check(_state(1.0, generation=5, population=clones))
+    assert not criterion.check(_state(1.0, generation=6, population=clones))   # checked every 5 generations
+    assert not criterion.check(_state(1.0, generation=5, population=mixed))
+
+
+def test_first_firing_criterion_stops_the_run():
+    termination = Termination([MaxEvaluations(10), TargetDistance(50.0)])
+    termination.start(_state(100.0))
+    assert termination.check(_state(100.0, evaluations=5)) is None
+    assert termination.check(_state(40.0, evaluations=20)) == 'max_evaluations'
+
+
+def test_restartable_criteria_restart_before_stopping():
+    restarted = []
+    state = _state(100.0)
+    state.restart = lambda keep: restarted.append(keep)
+    termination = Termination([Stagnation(window=1)], restarts=2, restart_keep=0.3)
+    termination.start(state)
+    state.generation = 1
+    assert termination.check(state) is None
+    state.generation = 2
+    assert termination.check(state) is None
+    state.generation = 3
+    assert termination.check(state) == 'stagnation'
+    assert restarted == [0.3, 0.3] and termination.restarts_done == 2
+
+    # Non-restartable criteria stop even with restarts left
+    termination = Termination([TargetDistance(1000.0)], restarts=5)
+    assert termination.check(_state(100.0)) == 'target'
+
+
+def test_run_reports_stop_reason_and_restarts():
+    ga = _ga()
+    ga.run(10_000, progress=False, termination=Termination([Stagnation(window=5)], restarts=2))
+    assert ga.stop_reason == 'stagnation' and ga.restarts == 2
+    # A restart keeps the best tour found so far
+    assert min(ga.history) == pytest.approx(float(ga.fitness.min()))
+
+    ga = _ga()
+    ga.run(10_000, progress=False, time_limit=0.0)
+    assert ga.stop_reason == 'time_limit'
+
+    ga = _ga()
+    ga.run(5, progress=False, termination=Termination([TargetDistance(0.0)]))
+    assert ga.stop_reason == 'generations' and ga.generation == 5
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from src.tsp.distance_matrix import DistanceMatrix
+from src.ga.genetic_algorithm import GeneticAlgorithm
+from src.ga.mutation import DELTA_MUTATIONS, MUTATION_DRAWS
+from src.ga.tour_hash import tour_hashes, update_hash, FitnessCache, CachedEvaluator
+
+
+def _instance(size: int, seed: int = 0) -> DistanceMatrix:
+    return DistanceMatrix(np.random.default_rng(seed).random((size, 2)) * 100.0)
+
+
+def _edges(tour) -> set:
+    return {(min(a, b), max(a, b)) for a, b in zip(tour.tolist(), np.roll(tour, -1).tolist())}
+
+
+def test_hash_is_canonical():
+    tour = np.random.default_rng(0).permutation(30)
+    h = tour_hashes(tour)[0]
+    for shift in (1, 7, 29):
+        assert tour_hashes(np.roll(tour, shift))[0] == h
+        assert tour_hashes(np.roll(tour[::-1], shift))[0] == h
+    other = tour.copy()
+    other[[3, 11]] = other[[11, 3]]
+    assert tour_hashes(other)[0] != h
+
+
+def test_population_hashes_match_single_tours():
+    population = np.argsort(np.random.default_rng(1).random((8, 20)), axis=1)
+    hashes = tour_hashes(population)
+    assert hashes.dtype == np.uint64
+    assert hashes.tolist() == [int(tour_hashes(tour)[0]) for tour in population]
+
+
+@pytest.mark.parametrize('size', (5, 9, 60))
+@pytest.mark.parametrize('name', list(DELTA_MUTATIONS))
+def test_update_hash_matches_recompute_after_every_move(name, size):
+    distance_matrix = _instance(size)
+    rng = np.random.default_rng(2)
+    tour = rng.permutation(size)
+    h = int(tour_hashes(tour)[0])
+    for _ in range(100):
+        before = _edges(tour)
+        DELTA_MUTATIONS[name](tour, distance_matrix, rng.random(MUTATION_DRAWS).tolist())
+        after = _edges(tour)
+        h = update_hash(h, before - after, after - before)
+        assert h == int(tour_hashes(tour)[0])
+
+
+@pytest.mark.parametrize('size', (4, 5, 12))
+def test_mutate_policy_keeps_hashes_and_fitness_exact(size):
+    # All clones of one tour, on tiny instances: every 2-opt span (including
+    # the whole tour) is drawn, and each replaced clone must hash and score
+    # like a freshly evaluated tour
+    distance_matrix = _instance(size)
+    ga = GeneticAlgorithm(None, distance_matrix=distance_matrix, pop_size=60, seed=size,
+                          duplicates='mutate', fitness_cache=1000)
+    for _ in range(5):
+        ga.population[:] = ga.population[0]
+        ga.fitness[:] = ga.fitness[0]
+        ga.fitness_cache.clear()
+        ga._track_duplicates()
+        for tour, distance in zip(ga.population, ga.fitness):
+            assert sorted(tour.tolist()) == list(range(size))
+            assert distance == pytest.approx(distance_matrix.tour_length(tour))
+        # Only real tour hashes are memoized
+        assert set(ga.fitness_cache._entries) == set(tour_hashes(ga.population).tolist())
+
+
+def test_fitness_cache_is_lru():
+    cache = FitnessCache(capacity=2)
+    cache.store(np.array([1, 2], dtype=np.uint64), np.array([10.0, 20.0]))
+    assert cache.lookup(np.array([1], dtype=np.uint64))[0].tolist() == [True]
+    cache.store(np.array([3], dtype=np.uint64), np.array([30.0]))
+    # 2 was the least recently used entry
+    found, values = cache.lookup(np.array([1, 2, 3], dtype=np.uint64))
+    assert found.tolist() == [True, False, True]
+    assert values[[0, 2]].tolist() == [10.0, 30.0]
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+    assert cache.hit_rate == pytest.approx(0.75)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cached_evaluator_evaluates_each_distinct_tour_once():
+    distance_matrix = _instance(15)
+    calls = []
+
+    def evaluator(population):
+        calls.append(len(population))
+        return np.array([distance_matrix.tour_length(tour) for tour in population])
+
+    tours = np.argsort(np.random.default_rng(3).random((4, 15)), axis=1)
+    # Rotations and reversals of the same cycle count as the same tour
+    batch = np.vstack([tours, np.roll(tours[0], 5), tours[1][::-1]])
+    cached = CachedEvaluator(evaluator, FitnessCache(100))
+
+    expected = [distance_matrix.tour_length(tour) for tour in batch]
+    np.testing.assert_allclose(cached(batch), expected)
+    assert calls == [4] and cached.last_evaluated == 4
+
+    np.testing.assert_allclose(cached(batch[::-1]), expected[::-1])
+    assert calls == [4] and cached.last_evaluated == 0
+    assert cached.cache.hits == 6
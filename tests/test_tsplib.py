@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from src.tsp.tsplib import parse_tsplib, geo_to_degrees, EDGE_WEIGHT_TYPES
+from src.tsp.instance_loader import InstanceLoader
+from src.tsp.distance_matrix import DistanceMatrix
+
+# (0,0)-(3,4) = 5; (0,0)-(1,1) = 1.414; (0,0)-(10,0): ATT r = 3.162; (0,0)-(0,30): ATT r = 9.487
+COORDS = [(0, 0), (3, 4), (1, 1), (10, 0), (0, 30)]
+EXPECTED_FROM_ORIGIN = {
+    'EUC_2D': [0, 5, 1, 10, 30],
+    'CEIL_2D': [0, 5, 2, 10, 30],
+    'ATT': [0, 2, 1, 4, 10],
+}
+
+
+def _coord_file(weight_type: str, coords=COORDS, name: str = 'teste') -> str:
+    lines = [f"NAME: {name}", "TYPE: TSP", f"DIMENSION: {len(coords)}",
+             f"EDGE_WEIGHT_TYPE: {weight_type}", "NODE_COORD_SECTION"]
+    lines += [f"{i} {x} {y}" for i, (x, y) in enumerate(coords, start=1)]
+    return "\n".join(lines + ["EOF", ""])
+
+
+def _matrix_of(parsed) -> DistanceMatrix:
+    return DistanceMatrix(parsed['coords'], is_geo=parsed['is_geo'], metric=parsed['metric'],
+                          matrix=parsed['matrix'])
+
+
+@pytest.mark.parametrize('weight_type', list(EXPECTED_FROM_ORIGIN))
+def test_rounded_coordinate_types(weight_type):
+    parsed = parse_tsplib(_coord_file(weight_type))
+    assert parsed['metric'] == EDGE_WEIGHT_TYPES[weight_type][0]
+    assert parsed['names'].tolist() == ['1', '2', '3', '4', '5']
+    assert _matrix_of(parsed).matrix[0].tolist() == EXPECTED_FROM_ORIGIN[weight_type]
+
+
+def test_geo_type_matches_published_optimum():
+    # burma14 (TSPLIB), ótimo publicado 3323
+    burma14 = [(16.47, 96.10), (16.47, 94.44), (20.09, 92.54), (22.39, 93.37), (25.23, 97.24),
+               (22.00, 96.05), (20.47, 97.02), (17.20, 96.29), (16.30, 97.38), (14.05, 98.12),
+               (16.53, 97.38), (21.52, 95.59), (19.41, 97.13), (20.09, 94.55)]
+    parsed = parse_tsplib(_coord_file('GEO', burma14, 'burma14'))
+    assert parsed['is_geo'] and parsed['metric'] == 'geo'
+    assert parsed['coords'][0].tolist() == pytest.approx([16 + 47 / 60, 96 + 10 / 60])
+    tour = np.array([1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]) - 1
+    assert _matrix_of(parsed).tour_length(tour) == 3323.0
+
+
+def test_geo_to_degrees_keeps_sign():
+    np.testing.assert_allclose(geo_to_degrees(np.array([[16.30, -97.45]])), [[16.5, -97.75]])
+
+
+SYMMETRIC = np.array([[0, 1, 2, 3],
+                      [1, 0, 4, 5],
+                      [2, 4, 0, 6],
+                      [3, 5, 6, 0]], dtype=float)
+
+
+def _weights(weight_format: str) -> list:
+    """Valores da EDGE_WEIGHT_SECTION de SYMMETRIC no formato pedido."""
+    n = len(SYMMETRIC)
+    if weight_format == 'FULL_MATRIX':
+        return SYMMETRIC.ravel().tolist()
+    diagonal = 'DIAG' in weight_format
+    # *_COL de uma matriz simétrica é o triângulo oposto lido por linhas
+    upper = weight_format.startswith('UPPER') != weight_format.endswith('COL')
+    values = []
+    for i in range(n):
+        columns = range(i if diagonal else i + 1, n) if upper else range(0, i + 1 if diagonal else i)
+        values += [SYMMETRIC[i, j] for j in columns]
+    return values
+
+
+@pytest.mark.parametrize('weight_format', [
+    'FULL_MATRIX', 'UPPER_ROW', 'LOWER_ROW', 'UPPER_DIAG_ROW', 'LOWER_DIAG_ROW',
+    'UPPER_COL', 'LOWER_COL', 'UPPER_DIAG_COL', 'LOWER_DIAG_COL',
+])
+def test_explicit_formats(weight_format):
+    values = " ".join(f"{v:g}" for v in _weights(weight_format))
+    text = (f"NAME: explicito\nTYPE: TSP\nDIMENSION: 4\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+            f"EDGE_WEIGHT_FORMAT: {weight_format}\nEDGE_WEIGHT_SECTION\n{values}\nEOF\n")
+    parsed = parse_tsplib(text)
+    assert parsed['metric'] == 'explicit'
+    np.testing.assert_array_equal(parsed['matrix'], SYMMETRIC)
+    # Sem DISPLAY_DATA_SECTION, coordenadas aproximadas por MDS só para heurísticas e gráficos
+    assert parsed['coords'].shape == (4, 2)
+    assert _matrix_of(parsed).tour_length([0, 1, 2, 3]) == 1 + 4 + 6 + 3
+
+
+def test_explicit_with_display_data():
+    text = ("NAME: explicito\nTYPE: TSP\nDIMENSION: 4\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+            "EDGE_WEIGHT_FORMAT: UPPER_ROW\nEDGE_WEIGHT_SECTION\n1 2 3\n4 5\n6\n"
+            "DISPLAY_DATA_SECTION\n1 0 0\n2 1 0\n3 1 1\n4 0 1\nEOF\n")
+    parsed = parse_tsplib(text)
+    np.testing.assert_array_equal(parsed['matrix'], SYMMETRIC)
+    assert parsed['coords'].tolist() == [[0, 0], [1, 0], [1, 1], [0, 1]]
+
+
+@pytest.mark.parametrize('text,message', [
+    (_coord_file('MAN_2D'), 'EDGE_WEIGHT_TYPE'),
+    (_coord_file('EUC_2D').replace('TYPE: TSP', 'TYPE: ATSP'), 'Tipo de problema'),
+    (_coord_file('EUC_2D').replace('DIMENSION: 5', 'DIMENSION: 6'), 'Esperados 6'),
+    (_coord_file('EUC_2D').replace('NODE_COORD_SECTION', 'FIXED_EDGES_SECTION'), 'NODE_COORD_SECTION'),
+    ("DIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\nEDGE_WEIGHT_FORMAT: UPPER_ROW\nEDGE_WEIGHT_SECTION\n1 2\nEOF\n",
+     'UPPER_ROW'),
+    ("DIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\nEDGE_WEIGHT_FORMAT: FUNCTION\nEDGE_WEIGHT_SECTION\n1 2 3\nEOF\n",
+     'EDGE_WEIGHT_FORMAT'),
+])
+def test_invalid_files(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_tsplib(text)
+
+
+def test_loader_reads_and_caches_tsplib(tmp_path):
+    path = tmp_path / 'pontos.tsp'
+    path.write_text(_coord_file('ATT'), encoding='utf-8')
+    first = InstanceLoader(str(path), verbose=False).load()
+    cached = InstanceLoader(str(path), verbose=False).load()
+    assert len(list((tmp_path / '.cache').iterdir())) == 1
+    for instance in (first, cached):
+        assert instance.metric == 'att' and instance.name == 'teste'
+        assert instance.distance_matrix().matrix[0].tolist() == EXPECTED_FROM_ORIGIN['ATT']